@@ -1,44 +1,24 @@
+import os
+import sys
+
 import dash
 import dash_core_components as dcc
 import dash_html_components as html
-import pandas as pd
 import plotly.graph_objs as go
 
-GC_METRICS = ['GCPauseTimePercentage', 'HeapCount',
-       'MaxAllocRateMBSec', 'MaxSizePeakMB', 'MaxSuspendDurationMSec',
-       'MeanCpuMSec', 'MeanPauseDurationMSec', 'MeanSizeAfterMB',
-       'MeanSizePeakMB', 'NumInduced', 'NumWithPinEvents',
-       'NumWithPinPlugEvents', 'PinnedObjectPercentage', 'PinnedObjectSizes',
-       'ProcessDuration', 'TotalAllocatedMB', 'TotalCpuMSec',
-       'TotalPauseTimeMSec', 'TotalPromotedMB', 'TotalSizeAfterMB',
-       'TotalSizePeakMB']
+# the metrics and their units come from the same table ETWAnalysis.py writes the
+# results with
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'scripts'))
+from gcstats.metrics import GC_METRIC_SPEC, GC_METRIC_UNITS
+from gcstats.store import open_results_store
+
+GC_METRICS = [metric.name for metric in GC_METRIC_SPEC]
 
-df = pd.read_csv('./scripts/test.csv')
+# the results ETWAnalysis.py writes; each graph only reads the test and metric it
+# shows. The first time it's started off with the old test.csv.
+results = open_results_store('./scripts/test-results.db', './scripts/test.csv')
 
 app = dash.Dash()
-GC_METRIC_UNITS = {
-    'GCPauseTimePercentage': '%',
-    'HeapCount': 'Count',
-    'MaxAllocRateMBSec': 'MB',
-    'MaxSizePeakMB': 'MB',
-    'MaxSuspendDurationMSec': 'MSec',
-    'MeanCpuMSec': 'MSec',
-    'MeanPauseDurationMSec': 'MSec',
-    'MeanSizeAfterMB': 'MB',
-    'MeanSizePeakMB': 'MB',
-    'NumInduced': 'Count',
-    'NumWithPinEvents': 'Count',
-    'NumWithPinPlugEvents': 'Count',
-    'PinnedObjectPercentage': '%',
-    'PinnedObjectSizes': 'Count',
-    'ProcessDuration': 'Sec',
-    'TotalAllocatedMB': 'MB',
-    'TotalCpuMSec': 'MSec',
-    'TotalPauseTimeMSec': 'MSec',
-    'TotalPromotedMB': 'MB',
-    'TotalSizeAfterMB': 'MB',
-    'TotalSizePeakMB': 'MB'
-}
 
 app.layout = html.Div([
     html.Div([
@@ -50,7 +30,7 @@ app.layout = html.Div([
             ),
             dcc.Dropdown(
                 id='crossfilter-testname',
-                options=[{'label': i, 'value': i} for i in df.Test.unique()],
+                options=[{'label': i, 'value': i} for i in results.get_tests()],
                 value='Legacy@ConcurrentSpin'
             ),
         ],
@@ -73,11 +53,12 @@ app.layout = html.Div([
 def update_metric(metric, test):
     print(metric)
     print(test)
+    test_results = results.read(['Date', metric], tests=[test])
     return {
         'data': [
             go.Scatter(
-                x=df['Date'],
-                y=df[df['Test'] == test][metric],
+                x=test_results['Date'],
+                y=test_results[metric],
                 mode='markers',
                 name=metric,
                 opacity=0.7
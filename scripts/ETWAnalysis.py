@@ -3,7 +3,6 @@ import glob
 import os
 import clr
 import sys
-from datetime import date, timedelta
 
 sys.path.append('C:/Users/suwhang/AppData/Local/Programs/Python/Python36/')
 
@@ -18,6 +17,13 @@ from Microsoft.Diagnostics.Tracing.Analysis import TraceProcessesExtensions as t
 from System import Action
 import Microsoft.Diagnostics.Tracing.Analysis as analysis
 
+from gcstats.metrics import GC_METRIC_SPEC, read_gc_metrics
+from gcstats.readers import trace_reader
+from gcstats.events import event_source, filtered_trace_reader, traced_process
+from gcstats.ingest import ingest_traces
+from gcstats.store import open_results_store
+from gcstats.manifest import trace_manifest
+
 # GC types
 NonConcurrentGC = 0
 BackgroundGC = 1
@@ -28,10 +34,6 @@ CONCURRENT_GC = 0x000001
 SERVER_GC = 0x001000 
 
 
-# GC Stats header
-GCSTATS_HEADER = ['GCPauseTimePercentage', 'HeapCount', 'MaxAllocRateMBSec', 'MaxSizePeakMB', 'MaxSuspendDurationMSec', 'MeanCpuMSec', 'MeanPauseDurationMSec', 'MeanSizeAfterMB', 'MeanSizePeakMB', 'NumInduced', 'NumWithPinEvents', 'NumWithPinPlugEvents', 'PinnedObjectPercentage', 'PinnedObjectSizes', 'ProcessDuration', 'TotalAllocatedMB', 'TotalCpuMSec', 'TotalPauseTimeMSec', 'TotalPromotedMB', 'TotalSizeAfterMB', 'TotalSizePeakMB']
-
-
 def read_trace(file_name):
     source = tracing.ETWTraceEventSource(file_name)
     ext.NeedLoadedDotNetRuntimes(source)
@@ -51,37 +53,72 @@ def read_trace(file_name):
             continue
         
 
-        statsSummary['IsServerGCUsed'] = mang.GC.Stats().IsServerGCUsed
-
-        stats = {}
-        stats['GCPauseTimePercentage'] = {'Units': '%', 'Stat': mang.GC.Stats().GetGCPauseTimePercentage()}
-        stats['HeapCount'] = {'Units': 'Count', 'Stat': mang.GC.Stats().HeapCount}    
-        stats['MaxAllocRateMBSec'] = {'Units': 'MB', 'Stat': mang.GC.Stats().MaxAllocRateMBSec}
-        stats['MaxSizePeakMB'] = {'Units': 'MB', 'Stat': mang.GC.Stats().MaxSizePeakMB}
-        stats['MaxSuspendDurationMSec'] = {'Units': 'MSec', 'Stat': mang.GC.Stats().MaxSuspendDurationMSec}
-        stats['MeanCpuMSec'] = {'Units': 'MSec', 'Stat': mang.GC.Stats().MeanCpuMSec}
-        stats['MeanPauseDurationMSec'] = {'Units': 'MSec', 'Stat': mang.GC.Stats().MeanPauseDurationMSec}
-        stats['MeanSizeAfterMB'] = {'Units': 'MB', 'Stat': mang.GC.Stats().MeanSizeAfterMB}
-        stats['MeanSizePeakMB'] = {'Units': 'MB', 'Stat': mang.GC.Stats().MeanSizePeakMB}
-        stats['NumInduced'] = {'Units': 'Count', 'Stat': mang.GC.Stats().NumInduced}
-        stats['NumWithPinEvents'] = {'Units': 'Count', 'Stat': mang.GC.Stats().NumWithPinEvents}
-        stats['NumWithPinPlugEvents'] = {'Units': 'Count', 'Stat': mang.GC.Stats().NumWithPinPlugEvents}
-        stats['PinnedObjectPercentage'] = {'Units': '%', 'Stat': mang.GC.Stats().PinnedObjectPercentage}
-        stats['PinnedObjectSizes'] = {'Units': 'Count', 'Stat': mang.GC.Stats().PinnedObjectSizes}
-        stats['ProcessDuration'] = {'Units': 'Sec', 'Stat': mang.GC.Stats().ProcessDuration}
-        stats['TotalAllocatedMB'] = {'Units': 'MB', 'Stat': mang.GC.Stats().TotalAllocatedMB}
-        stats['TotalCpuMSec'] = {'Units': 'MSec', 'Stat': mang.GC.Stats().TotalCpuMSec}
-        stats['TotalPauseTimeMSec'] = {'Units': 'MSec', 'Stat': mang.GC.Stats().TotalPauseTimeMSec}
-        stats['TotalPromotedMB'] = {'Units': 'MB', 'Stat': mang.GC.Stats().TotalPromotedMB}
-        stats['TotalSizeAfterMB'] = {'Units': 'MB', 'Stat': mang.GC.Stats().TotalSizeAfterMB}
-        stats['TotalSizePeakMB'] = {'Units': 'MB', 'Stat': mang.GC.Stats().TotalSizePeakMB}
-
-
-        statsSummary['stats'] = stats
+        # Stats() adds up all the GCs of the process each time it's called so we only
+        # call it once and read every stat off that (see gcstats/metrics.py)
+        gc_stats = mang.GC.Stats()
+        statsSummary['IsServerGCUsed'] = gc_stats.IsServerGCUsed
+        statsSummary['stats'] = read_gc_metrics(gc_stats)
         print ("info for process {0}: {1}".format(proc.ProcessID, proc.Name))
         return statsSummary
 
 
+# read_trace as a trace_reader so gcstats.ingest can read traces with it in worker
+# processes (each worker imports this module, and with it clr)
+class traceevent_reader(trace_reader):
+    def read(self, file_name):
+        return read_trace(file_name)
+
+
+# the TraceEvent side of gcstats/events.py. Stats() is only asked for the processes
+# the filter matches, as they end, and we stop going through the trace as soon as
+# the reader has its process instead of processing the whole thing first.
+#
+# an .etl has whatever was turned on when it was collected and TraceEvent's
+# runtime analysis subscribes to the CLR events it needs itself, so the keyword
+# set isn't something we can turn down here - this source only uses the filter
+# for the process name.
+class traceevent_source(event_source):
+    def __init__(self, file_name):
+        self.file_name = file_name
+
+    def process(self, event_filter, on_process_stop):
+        source = tracing.ETWTraceEventSource(self.file_name)
+        ext.NeedLoadedDotNetRuntimes(source)
+
+        stopped_processes = set()
+        is_done = [False]
+        def stop_process(proc):
+            stopped_processes.add(proc.ProcessIndex)
+            mang = ext.LoadedDotNetRuntime(proc)
+            gc_stats = None if (mang is None) else mang.GC.Stats()
+            return on_process_stop(traced_process(proc.ProcessID, proc.Name, gc_stats))
+
+        def on_process_stop_event(proc):
+            if (is_done[0] or (not event_filter.matches_process(proc.Name))):
+                return
+            if (stop_process(proc)):
+                is_done[0] = True
+                source.StopProcessing()
+
+        tpext.AddCallbackOnProcessStop(source, Action[analysis.TraceProcess](on_process_stop_event))
+        source.Process()
+        if (is_done[0]):
+            return
+
+        # the ones still running when the trace ended
+        for proc in tpext.Processes(source):
+            if ((proc.ProcessIndex in stopped_processes) or (not event_filter.matches_process(proc.Name))):
+                continue
+            if (stop_process(proc)):
+                return
+
+
+# reads only the corerun process and stops once it's ended, see traceevent_source
+class traceevent_filtered_reader(filtered_trace_reader):
+    def open_source(self, file_name):
+        return traceevent_source(file_name)
+
+
 def build_stats_xml(statsSummary, test_name):
     # Emit our data as XML
     #test_name = file_name.split('@')[1].split('/')[0]
@@ -129,34 +166,29 @@ def main():
 if __name__ == '__main__':
     #main()
     traces = find_all_etl('E:/GC/Traces/suwhang-test-2/')
-    csv_file = open('./test.csv', 'w')
     print(traces)
-    
-    csv_file.write('Test,')  # Test name
-    csv_file.write('Date,')  # Date test was taken
-    for header in GCSTATS_HEADER:
-        csv_file.write(header)
-        csv_file.write(',')
-
-    csv_file.write('\n')
-    
-    stats = {}
-    for trace_file in traces:
-        stats = read_trace(trace_file)['stats']
-        
-        test_name = trace_file.split('\\')[1]
-        date_diff = int(trace_file.split('\\')[2])
-        test_date = date.today() - timedelta(days=date_diff)
-        
-
-        csv_file.write('{},{},'.format(test_name, test_date))
-        for header in GCSTATS_HEADER:
-            csv_file.write(str(stats[header]['Stat']))
-            csv_file.write(',')
-        csv_file.write('\n')
 
-    for header in GCSTATS_HEADER:
-        print('\'{}\': \'{}\''.format(header, stats[header]['Units']))
+    # only the traces that are new or changed since the last run are read (see
+    # gcstats/manifest.py, delete test-traces.json to read them all again). The
+    # traces are read in parallel and each row goes in the results store (see
+    # gcstats/store.py, app.py reads it) as soon as its trace is done; a trace that
+    # fails is printed and left out of the manifest so it's tried again next time.
+    manifest = trace_manifest('./test-traces.json')
+    changed_traces = manifest.get_changed_traces(traces)
+    print('{} of {} traces are new or changed'.format(len(changed_traces), len(traces)))
+
+    results = open_results_store('./test-results.db', './test.csv')
+    try:
+        # traceevent_reader() reads every process in the traces like read_trace always has
+        num_rows, failed_traces = ingest_traces(list(changed_traces), traceevent_filtered_reader(), results,
+            trace_done=lambda trace_file: manifest.mark_ingested(trace_file, changed_traces[trace_file]))
+    finally:
+        results.close()
+        manifest.save()
+    print('{} traces written, {} failed'.format(num_rows, len(failed_traces)))
+
+    for metric in GC_METRIC_SPEC:
+        print('\'{}\': \'{}\''.format(metric.name, metric.units))
 
 #ET.dump(orig_root)
 #tree = ET.ElementTree(orig_root)
@@ -0,0 +1,21 @@
+# parsing and charting the GC logs.
+#
+# records      - the per GC record types and the column stores they're kept in
+# lines        - field extractors and line_classifier for the log lines we care about
+# buckets      - the bucket schemes the runtime has bucketed sizes with
+# cache        - caches parsed results on disk
+# gcindex      - byte offsets of each GC in a log so we can parse a range of GCs
+# tail         - reading a log backwards
+# parallel     - parsing several logs at once
+# bgc_tuning   - the BGC tuning logs
+# size_increase - the size_increase logs
+# gc1          - the gc1 logs
+# throughput   - the lastbuf/output files of throughput runs
+# charts       - chart helpers, matplotlib is only imported when they draw
+# downsample   - cutting a series down to what a chart can show
+# render       - drawing the chart panels to files without a display, in parallel
+# cli          - python -m gclog, runs the parsers over a batch of logs and writes tables
+# synthlog     - writes made up logs in the formats the parsers read (for the tests and benchmarks)
+#
+# importing any of these doesn't read anything or import matplotlib, parse-gclog.py
+# is the notebook that runs them.
@@ -0,0 +1,6 @@
+# python -m gclog, see cli.py
+import sys
+
+from .cli import main
+
+sys.exit(main())
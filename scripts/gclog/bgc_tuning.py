@@ -0,0 +1,846 @@
+import concurrent.futures
+import contextlib
+import io
+import locale
+import mmap
+import os
+import sys
+import time
+
+import numpy as np
+
+from .common import GC_REASON_STEPPING, GC_REASON_PANIC_SOH, GC_REASON_PANIC_LOH, GC_REASON_GROWTH_SOH, GC_REASON_GROWTH_LOH
+from .records import bgc_tuning_data, bgc_tuning_data_fields, bgc_detailed_tuning_data, bgc_detailed_tuning_data_fields, gc_record_store
+from .lines import LINE_KIND_NONE, line_classifier, parse_str, parse_str_no_end, get_btl_star_info, parse_path_and_fl
+from .cache import cached_parse
+from .gcindex import decode_log_line, find_next_gc_start, iter_lines_with_next_in_range
+from .parallel import process_files_in_parallel
+
+# the logs are read lazily, one line at a time, so memory stays flat no matter
+# how big the log is. The only lookahead any parser needs is the line right after
+# the current one (eg, "before doing a bgc" after a *GC* line) so we hand out
+# (line, next_line) pairs; next_line is "" for the last line in the file.
+def iter_lines_with_next(pause_file):
+    line = pause_file.readline()
+    while line:
+        next_line = pause_file.readline()
+        yield line, next_line
+        line = next_line
+
+# (kind, line, next_line) for the lines that have a marker the classifier knows about
+def iter_classified_lines(file_name, classifier):
+    classify = classifier.classify
+    with open(file_name, "r") as pause_file:
+        for line, next_line in iter_lines_with_next(pause_file):
+            kind = classify(line)
+            if (kind != LINE_KIND_NONE):
+                yield kind, line, next_line
+
+# the same as iter_classified_lines but most lines in a log don't have any marker we
+# care about and we still make a str out of each of them and run the classifier on it.
+# This maps the log and classifies it a block at a time in the raw bytes instead -
+# each marker is searched for on its own over the whole block (which is about as fast
+# as scanning memory), the offsets of the newlines tell us which line each one is in
+# and a line's kind is the lowest kind found in it, which is what classify would say.
+# Then only the lines with a kind (and the line after each) are decoded. This expects
+# "\n" or "\r\n" line ends.
+def iter_classified_lines_mmap(file_name, classifier, block_size=64 * 1024 * 1024):
+    num_markers = len(classifier.markers)
+    encoding = locale.getpreferredencoding(False)
+    with open(file_name, "rb") as pause_file:
+        log_size = os.fstat(pause_file.fileno()).st_size
+        if (log_size == 0):
+            return
+        with mmap.mmap(pause_file.fileno(), 0, access=mmap.ACCESS_READ) as log_map:
+            log_bytes = np.frombuffer(log_map, dtype=np.uint8)
+            try:
+                block_start = 0
+                while (block_start < log_size):
+                    # blocks end at the end of a line
+                    block_end = min(block_start + block_size, log_size)
+                    if (block_end < log_size):
+                        last_newline = log_map.rfind(b"\n", block_start, block_end)
+                        if (last_newline == -1):
+                            last_newline = log_map.find(b"\n", block_end)
+                        block_end = log_size if (last_newline == -1) else (last_newline + 1)
+
+                    # where each line in the block ends (exclusive)
+                    line_ends = np.flatnonzero(log_bytes[block_start:block_end] == ord("\n")) + (block_start + 1)
+                    if ((len(line_ends) == 0) or (line_ends[-1] != block_end)):
+                        line_ends = np.append(line_ends, block_end)
+
+                    # the lower kinds win so they go last
+                    line_kinds = np.full(len(line_ends), num_markers)
+                    for kind in range(num_markers - 1, -1, -1):
+                        marker_offsets = [m.start() for m in classifier.marker_bytes_regexes[kind].finditer(log_map, block_start, block_end)]
+                        if (marker_offsets):
+                            line_kinds[np.searchsorted(line_ends, marker_offsets, side="right")] = kind
+
+                    # without any "\r"s in the block the lines can be decoded as they are
+                    if (log_map.find(b"\r", block_start, block_end) == -1):
+                        decode = lambda raw_line: raw_line.decode(encoding, errors="replace")
+                    else:
+                        decode = decode_log_line
+
+                    line_ends = line_ends.tolist()
+                    # lines with a kind often come one after another so the next_line we
+                    # decoded is usually the line we want next.
+                    next_line_start = -1
+                    next_line = ""
+                    for line_index, kind in zip(np.flatnonzero(line_kinds < num_markers).tolist(), line_kinds[line_kinds < num_markers].tolist()):
+                        line_start = block_start if (line_index == 0) else line_ends[line_index - 1]
+                        line_end = line_ends[line_index]
+                        line = next_line if (line_start == next_line_start) else decode(log_map[line_start:line_end])
+                        next_line_end = log_map.find(b"\n", line_end)
+                        next_line_end = log_size if (next_line_end == -1) else (next_line_end + 1)
+                        next_line_start = line_end
+                        next_line = decode(log_map[line_end:next_line_end])
+                        yield kind, line, next_line
+
+                    block_start = block_end
+            finally:
+                # the map can't be closed while there's an array on it
+                del log_bytes
+
+# all the parser state for BGC tuning, this is also what process_file_bgc_tuning
+# gets num_gen2s and total_physical_memory from once the log is done.
+class bgc_tuning_state():
+    def __init__(self):
+        self.num_gen2s = 0
+        self.goal_ml = 0
+        self.goal_available_memory = 0
+
+        self.current_gen2_index = 0
+        self.current_gen2_reason = -1
+
+        self.alloc_gen0_current_gen2 = 0
+        self.alloc_gen3_current_gen2 = 0
+        self.beg_ml = 0
+        self.end_ml = 0
+        self.beg_heap_size = 0
+        self.beg_commit_size = 0
+        self.beg_ws_size = 0
+        self.end_heap_size = 0
+        self.end_commit_size = 0
+        self.end_ws_size = 0
+
+        # from the BTL2*/BTL3*
+        self.gen2_last_bgc_size = 0
+        self.gen2_current_bgc_start_flr = 0.0
+        self.gen2_current_bgc_sweep_flr = 0.0
+        self.gen2_current_bgc_physical_sweep_flr = 0.0
+        self.gen2_current_bgc_end_flr = 0.0
+        self.gen2_gen_increase_flr = 0.0
+        self.gen2_bgc_surv_rate = 0.0
+        self.gen2_actual_gen1_to_trigger = 0
+        self.gen2_gen1_since_last = 0
+        self.gen2_actual_alloc_to_trigger = 0
+        self.gen2_alloc_to_trigger = 0
+        self.gen2_end_physical_size = 0
+        self.gen2_end_vfl_size = 0
+
+        self.gen3_last_bgc_size = 0
+        self.gen3_current_bgc_start_flr = 0.0
+        self.gen3_current_bgc_sweep_flr = 0.0
+        self.gen3_current_bgc_physical_sweep_flr = 0.0
+        self.gen3_current_bgc_end_flr = 0.0
+        self.gen3_gen_increase_flr = 0.0
+        self.gen3_bgc_surv_rate = 0.0
+        self.gen3_actual_gen1_to_trigger = 0
+        self.gen3_gen1_since_last = 0
+        self.gen3_actual_alloc_to_trigger = 0
+        self.gen3_alloc_to_trigger = 0
+        self.gen3_end_physical_size = 0
+        self.gen3_end_vfl_size = 0
+
+        self.gen2_alloc_kp = 0
+        self.gen2_alloc_ki = 0
+        self.gen3_alloc_kp = 0
+        self.gen3_alloc_ki = 0
+
+        self.gen3_current_end_fl = 0
+        self.gen3_fl_goal = 0
+        self.gen3_path_taken = 0
+        self.gen3_alloc_smoothed = 0
+        self.gen3_alloc_ff = 0
+
+        self.ml_kp = 0
+        self.ml_ki = 0
+        self.pi = 0
+
+        self.low_memory_induced_p = 0
+        self.recorded_ml = 0
+
+        self.elapsed_since_last_s = 0
+        self.elapsed_ms = 0
+        self.last_bgc_end = 0.0
+        self.current_bgc_start = 0.0
+
+        self.gen2_panic_alloc = 0
+        self.gen2_panic_fl = 0
+        self.gen2_panic_ca_plugs_size = 0
+        self.gen2_panic_ca_plugs_count = 0
+
+        # We always parse the plugs line but not everyone will lead to a gen2 panic
+        # since it may have already paniced.
+        # So set a flag to indicate when we see the "panic trigger" line and clear
+        # it when the BGC it triggered ended.
+        self.record_plugs_p = 1
+        # stores the info on plugs that were not 100% allocated into fl
+        self.gen2_plugs_size = 0
+        self.gen2_plugs_count = 0
+
+        # based on available physical mem and total mem, calculate this so we know
+        # if the total physical mem consumption is wildly different from our process's ws
+        self.in_use_physical_memory = 0
+
+        self.total_physical_memory = 0
+
+#
+# one handler per kind of line we care about. Each takes the state, the line and
+# the line after it; the *EGC handler returns the records for the BGC that just
+# ended, all the others return None.
+#
+def bgc_tuning_handle_gc_start(state, line, next_line):
+    #print(line)
+
+    if (line.find("(2)(NGC)") != -1):
+        if (state.low_memory_induced_p != 1):
+            print("NGC2 was not low memory triggered, ml is {0}".format(state.recorded_ml))
+            print(line)
+    if (state.low_memory_induced_p == 1):
+        print("this GC was low mem triggered!")
+        print(line)
+        state.low_memory_induced_p = 0
+
+    # don't process FGCs for now
+    if (line.find("(FGC)") != -1):
+        return None
+    #print(next_line)
+
+    # for calculating alloc, we ignore FGCs and the first eph GC right before we need to do a BGC
+    # which is indicated by "before doing a bgc" in the next line after *GC*
+    words = line.split(")(")
+    #print_array(words)
+    #
+    # words[1] is generation
+    # words[4] is gen0 alloc
+    # words[5] beginning is gen3 alloc:
+    #
+    #0: [ 5524]*GC* 1(gen0:0
+    #1: 2
+    #2: BGC
+    #3: 0
+    #4: g0: 688
+    #5: g3: 66)fla(2: 0-0, 3: 0)esa3: 69395608
+    #
+    # skip the eph GC we do at the beginning of a BGC, it displays the same info as the BGC
+    # line anyway.
+    #[ 8388]*GC* 40012(gen0:40011)(2)(BGC)(0)(g0: 726)(g3: 2234)fla(2: 24004-5427, 3: 1914)esa3: 339211512
+    #[ 8396]*GC* 40013(gen0:40011)(0)(NGC)(1)(g0: 726)(g3: 2234)fla(2: 24004-5427, 3: 1914)esa3: 339211512
+    #[ 8396]doing gen0 before doing a bgc
+    if (next_line.find("before doing a bgc") != -1):
+        #print("skipping")
+        return None
+
+    alloc_gen0_str = words[4][len("g0: "):]
+    #print("gen0 allocated {0}".format(alloc_gen0_str))
+    state.alloc_gen0_current_gen2 += int(alloc_gen0_str)
+
+    if (words[1] == '2'):
+        #print("GEN2!!!")
+        state.num_gen2s += 1
+        gen_index_str, remaining_str = parse_str(words[0], "*GC* ", "(")
+        state.current_gen2_index = int(gen_index_str)
+
+        temp_alloc_gen3_str = words[5][len("g3: "):]
+        alloc_gen3_end = temp_alloc_gen3_str.find(")")
+        alloc_gen3_str = temp_alloc_gen3_str[:alloc_gen3_end]
+        #print("BGC #{0} gen0 alloced {1} so far, gen3 allocated {2}".format(
+                #state.current_gen2_index, state.alloc_gen0_current_gen2, alloc_gen3_str))
+        state.alloc_gen3_current_gen2 = int(alloc_gen3_str)
+    return None
+
+def bgc_tuning_handle_gc_end(state, line, next_line):
+    #print(line)
+    if ((line.find("(2)(NGC)") == -1) and (line.find("(BGC)") == -1)):
+        return None
+
+    # it turned out I didn't log beg_ml/end_ml correctly in EGC..
+    # what's after -> is just the begin ml
+    #[ 3816]*EGC* 21720(gen0:21723)(2)(BGC)(S)(P)(ml: 41->41)
+    #[ 8372]*EGC* 23757(gen0:23757)(2)(NGC)(C)(P)(ml: 0->93)
+    beg_ml_str, remaining_str = parse_str (line, "->", ")")
+    state.beg_ml = int(beg_ml_str)
+
+    if (line.find("(BGC)") == -1):
+        state.end_ml = state.beg_ml
+
+    if (state.current_gen2_reason == GC_REASON_PANIC_SOH):
+        state.gen2_panic_ca_plugs_size = state.gen2_plugs_size
+        state.gen2_panic_ca_plugs_count = state.gen2_plugs_count
+        print("bgc {0} reason {1}, gen2 plugs not full alloced in fl {2}->{3}".format(
+            state.current_gen2_index, state.current_gen2_reason,
+            state.gen2_panic_ca_plugs_count, state.gen2_panic_ca_plugs_size))
+
+#     print("BGC#{0}({1}) reason: {2}, beg heap: {3}, beg commit: {4}, ws: {5}".format(state.num_gen2s, state.current_gen2_index,
+#         state.current_gen2_reason, state.beg_heap_size, state.beg_commit_size, state.beg_ws_size))
+    # end of a BGC, hand the data out
+    records = (bgc_tuning_data(state.current_gen2_index,
+                                state.current_gen2_reason,
+                                state.gen2_panic_ca_plugs_size,
+                                state.gen2_panic_ca_plugs_count,
+                                state.gen2_panic_alloc,
+                                state.gen2_panic_fl,
+                                state.elapsed_since_last_s,
+                                state.elapsed_ms,
+                                state.alloc_gen0_current_gen2,
+                                state.alloc_gen3_current_gen2,
+                                state.beg_ml,
+                                state.end_ml,
+                                state.beg_heap_size,
+                                state.beg_commit_size,
+                                state.beg_ws_size,
+                                state.end_heap_size,
+                                state.end_commit_size,
+                                state.end_ws_size,
+                                state.gen2_last_bgc_size,
+                                state.gen2_current_bgc_start_flr,
+                                state.gen2_current_bgc_sweep_flr,
+                                state.gen2_current_bgc_physical_sweep_flr,
+                                state.gen2_current_bgc_end_flr,
+                                state.gen2_gen_increase_flr,
+                                state.gen2_bgc_surv_rate,
+                                state.gen2_actual_gen1_to_trigger,
+                                state.gen2_gen1_since_last,
+                                state.gen2_actual_alloc_to_trigger,
+                                state.gen2_alloc_to_trigger,
+                                state.gen3_last_bgc_size,
+                                state.gen3_current_bgc_start_flr,
+                                state.gen3_current_bgc_sweep_flr,
+                                state.gen3_current_bgc_physical_sweep_flr,
+                                state.gen3_current_bgc_end_flr,
+                                state.gen3_gen_increase_flr,
+                                state.gen3_bgc_surv_rate,
+                                state.gen3_actual_gen1_to_trigger,
+                                state.gen3_gen1_since_last,
+                                state.gen3_actual_alloc_to_trigger,
+                                state.gen3_alloc_to_trigger,
+                                state.in_use_physical_memory),
+               bgc_detailed_tuning_data(
+                                state.ml_kp,
+                                state.ml_ki,
+                                state.pi,
+                                state.gen2_alloc_kp,
+                                state.gen2_alloc_ki,
+                                state.gen3_alloc_kp,
+                                state.gen3_alloc_ki,
+                                state.gen2_end_physical_size,
+                                state.gen2_end_vfl_size,
+                                state.gen3_end_physical_size,
+                                state.gen3_end_vfl_size,
+                                state.gen3_current_end_fl,
+                                state.gen3_fl_goal,
+                                state.gen3_path_taken,
+                                state.gen3_alloc_smoothed,
+                                state.gen3_alloc_ff))
+    # reset stuff
+    state.alloc_gen0_current_gen2 = 0
+    state.alloc_gen3_current_gen2 = 0
+    state.current_gen2_reason = -1
+    state.record_plugs_p = 1
+    state.gen2_panic_ca_plugs_size = 0
+    state.gen2_panic_ca_plugs_count = 0
+    state.gen2_panic_alloc = 0
+    state.gen2_panic_fl = 0
+    return records
+
+def bgc_tuning_handle_tuning_parameters(state, line, next_line):
+    ml_goal_str, remaining_str = parse_str(line, "mem goal: ", "(")
+    sweep_flr_goal, remaining_str = parse_str(remaining_str, "sweep flr goal: ", ",")
+    ml_kp_str, remaining_str = parse_str(remaining_str, "ml: kp ", ",")
+    ml_ki_str = parse_str_no_end(remaining_str, ", ki ")
+    print("ml goal: {0}, sweep flr goal: {1}, ml kp: {2}, ml ki: {3}".format(ml_goal_str,
+        sweep_flr_goal, ml_kp_str, ml_ki_str))
+
+def bgc_tuning_handle_plugs(state, line, next_line):
+    if (state.record_plugs_p == 1):
+        plugs_fa_ratio_str, remaining_str = parse_str(line, ") ", "%")
+        plugs_fa_ratio = int (plugs_fa_ratio_str)
+        if (plugs_fa_ratio != 100) :
+            # print("detected plugs not completely alloced in fl")
+            # print(line)
+            temp_gen2_plugs_count_str, remaining_str = parse_str(line, "P: ", "(")
+            temp_gen2_plugs_count = int(temp_gen2_plugs_count_str)
+            if (temp_gen2_plugs_count > 0):
+                state.gen2_plugs_count = temp_gen2_plugs_count
+                gen2_plugs_size_str, remaining_str = parse_str(remaining_str, "(", ")")
+                state.gen2_plugs_size = int(gen2_plugs_size_str)
+                # print("{0} plugs, size {1}".format(state.gen2_plugs_count, state.gen2_plugs_size))
+
+# get alloc kp
+def bgc_tuning_handle_alloc_kp(state, line, next_line):
+    if (line.find("BTL2") != -1):
+        gen2_alloc_kp_str, remaining_str = parse_str(line, "= ", " ")
+        state.gen2_alloc_kp = int(gen2_alloc_kp_str)
+    else:
+        gen3_alloc_kp_str, remaining_str = parse_str(line, "= ", " ")
+        state.gen3_alloc_kp = int(gen3_alloc_kp_str)
+
+# get alloc ki
+def bgc_tuning_handle_alloc_ki(state, line, next_line):
+    if (line.find("BTL2:") != -1):
+        gen2_alloc_ki_str, remaining_str = parse_str(line, "accu err ", "=")
+        state.gen2_alloc_ki = int(gen2_alloc_ki_str)
+    else:
+        gen3_alloc_ki_str, remaining_str = parse_str(line, "accu err ", "=")
+        state.gen3_alloc_ki = int(gen3_alloc_ki_str)
+
+def bgc_tuning_handle_panic_trigger_in_free(state, line, next_line):
+    if (line.find("gen3") != -1):
+        print("currrently we don't let gen3 panic")
+    else:
+        # print(line)
+        gen2_panic_size_str, remaining_str = parse_str(line, "->", ",")
+        gen2_panic_size = int(gen2_panic_size_str)
+        gen2_panic_flr_str, remaining_str = parse_str(remaining_str, "flr: ", ",")
+        gen2_panic_flr = float(gen2_panic_flr_str)
+        state.gen2_panic_fl = int (float(gen2_panic_size) * gen2_panic_flr / 100.0)
+        gen2_current_alloc_str, remaining_str = parse_str(line, "(", " ")
+        gen2_current_alloc = int (gen2_current_alloc_str)
+        gen2_last_alloc_str, remaining_str = parse_str(remaining_str, "- ", ")")
+        gen2_last_alloc = int (gen2_last_alloc_str)
+        state.gen2_panic_alloc = gen2_current_alloc - gen2_last_alloc
+        # print("{0} - {1} = {2}".format(gen2_current_alloc, gen2_last_alloc, state.gen2_panic_alloc))
+        state.record_plugs_p = 0
+
+def bgc_tuning_handle_bgc_start_time(state, line, next_line):
+    # print(line)
+    current_bgc_start_str, remaining_str = parse_str (line, "]: ", " ")
+    state.current_bgc_start = float (current_bgc_start_str)
+    state.elapsed_since_last_s = int((state.current_bgc_start - state.last_bgc_end) * 60.0)
+    # print("GC#{0} start {1:10.3f}, {2}s since last bgc end".format(state.current_gen2_index,
+    #     state.current_bgc_start, state.elapsed_since_last_s))
+
+def bgc_tuning_handle_bgc_end_time(state, line, next_line):
+    # print(line)
+    current_bgc_end_str, remaining_str = parse_str (line, "]: ", " ")
+    current_bgc_end = float (current_bgc_end_str)
+    state.elapsed_ms = int((current_bgc_end - state.current_bgc_start) * 60.0 * 1000.0)
+    # print("GC#{0} start {1:10.3f} end {2:10.3f}, {3}ms since bgc start".format(state.current_gen2_index,
+    #     state.current_bgc_start, current_bgc_end, state.elapsed_ms))
+    state.last_bgc_end = current_bgc_end
+
+def bgc_tuning_handle_gen3_path(state, line, next_line):
+    state.gen3_current_end_fl, state.gen3_fl_goal, state.gen3_path_taken = parse_path_and_fl(line)
+
+def bgc_tuning_handle_smoothed(state, line, next_line):
+    if (line.find("BTL3") != -1):
+        gen3_alloc_smoothed_str = parse_str_no_end(line, "->")
+        state.gen3_alloc_smoothed = int(gen3_alloc_smoothed_str)
+
+def bgc_tuning_handle_ff(state, line, next_line):
+    if (line.find("BTL3") != -1):
+        gen3_alloc_ff_str = parse_str_no_end(line, "->")
+        state.gen3_alloc_ff = int(gen3_alloc_ff_str)
+
+# for below goal we don't do kp or ff, use the value we calculated for kp,
+# note that it has a space after ->
+def bgc_tuning_handle_below_goal(state, line, next_line):
+    if (line.find("BTL3") != -1):
+        gen3_alloc_kp_str = parse_str_no_end(line, "-> ")
+        state.gen3_alloc_kp = int(gen3_alloc_kp_str)
+
+# this is to parse this line during bgc sweep
+# [ 3060]BTL2: sflr: 98.751%->91.115% (49168919753->49168919753, 48554626049->44800081185) (1:0-0/gen1) since start (afl: 40001272097, 52.345)
+# to get the physical sweep flr
+def bgc_tuning_handle_physical_sweep_flr(state, line, next_line):
+    if (line.find("BTL2:") != -1):
+        gen2_afl_str, remaining_str = parse_str(line, "(afl: ", ",")
+        gen2_physical_sflr_str, remaining_str = parse_str(remaining_str, " ", ")")
+        #print("gen2 afl {0:14}, physical sflr: {1:}".format(gen2_afl_str, gen2_physical_sflr_str))
+        state.gen2_current_bgc_physical_sweep_flr = float(gen2_physical_sflr_str)
+    else:
+        gen3_afl_str, remaining_str = parse_str(line, "(afl: ", ",")
+        gen3_physical_sflr_str, remaining_str = parse_str(remaining_str, " ", ")")
+        #print("gen3 afl {0:14}, physical sflr: {1:}".format(gen3_afl_str, gen3_physical_sflr_str))
+        state.gen3_current_bgc_physical_sweep_flr = float(gen3_physical_sflr_str)
+
+def bgc_tuning_handle_btl_ml(state, line, next_line):
+    #[ 3816]BTL: ml: 44 (g: 35), a 67038240768 (g: 78168098611)
+    #Or this line:
+    #[ 4324]BTL: ml: 7 (g: 35), a: 111696109568 (g: 78168098611, elg: 0->272188303, 0->14591389003), +33528010957 = 7054109066 + 26473901890
+
+    # latest version:
+    #BTL: ml: 61 (g: 60)(below), a: 6615834624 (g: 6848602112, elg: 5123182664+0=5123182664, 30698544+0=30698544, pi=0), vfl: -5342047895=-232767488+-5109280407
+
+    is_ngc2 = 0
+    if (line.find("(NGC2)") != -1):
+        is_ngc2 = 1
+
+    if (state.goal_ml == 0):
+        goal_ml_str, remaining_str = parse_str(line, "g: ", ")")
+        state.goal_ml = int(goal_ml_str)
+        goal_available_memory_str, remaining_str = parse_str(remaining_str, "(g: ", ",")
+        state.goal_available_memory = int(goal_available_memory_str)
+        state.total_physical_memory = float(state.goal_available_memory) * 100 / float(100 - state.goal_ml)
+        print("ml goal is {0}, available mem goal is {1:,}, total phy mem is {2:,}".format(state.goal_ml,
+                                state.goal_available_memory, state.total_physical_memory))
+        print("after goal : gen2 reason is {0}".format(state.current_gen2_reason))
+
+    # now get the end ml for the current BGC
+    end_ml_str, remaining_str = parse_str(line, "BTL: ml: ", " ")
+    state.end_ml = int(end_ml_str)
+
+    in_use_physical_memory_str, remaining_str = parse_str(line, "a: ", " ")
+    state.in_use_physical_memory = state.total_physical_memory - int (in_use_physical_memory_str)
+
+    # now get the physical size of gen2/3 and their vfl sizes
+    gen2_end_physical_size_str, remaining_str = parse_str(remaining_str, "elg: ", "+")
+    state.gen2_end_physical_size = int(gen2_end_physical_size_str)
+    gen2_end_vfl_size_str, remaining_str = parse_str(remaining_str, "+", "=")
+    state.gen2_end_vfl_size = int(gen2_end_vfl_size_str)
+
+    gen3_end_physical_size_str, remaining_str = parse_str(remaining_str, ", ", "+")
+    state.gen3_end_physical_size = int(gen3_end_physical_size_str)
+    gen3_end_vfl_size_str, remaining_str = parse_str(remaining_str, "+", "=")
+    state.gen3_end_vfl_size = int(gen3_end_vfl_size_str)
+
+    # print("g2 physical size is {0}, vfl is {1}, g3 {2} {3}".format(
+    #                                                     state.gen2_end_physical_size,
+    #                                                     state.gen2_end_vfl_size,
+    #                                                     state.gen3_end_physical_size,
+    #                                                     state.gen3_end_vfl_size))
+
+    # for logs that logged pi (build-0530 and after)
+    state.pi = 0
+    if (line.find("pi=") != -1):
+        pi_str, remaining_str = parse_str(line, "pi=", ")")
+        state.pi = int(pi_str)
+
+    # for logs that recorded the vfl info
+    if (line.find("), vfl: ") != -1):
+        vfl_str = parse_str_no_end(line, "), vfl: ")
+        vfl_kp_str, remaining_str = parse_str(vfl_str, "=", "+")
+        state.ml_kp = int(vfl_kp_str)
+        if (is_ngc2 == 1):
+            vfl_ki_str, remaining_str = parse_str(remaining_str, "+", "(NGC2)")
+        else:
+            vfl_ki_str = parse_str_no_end(remaining_str, "+")
+        state.ml_ki = int(vfl_ki_str)
+
+def bgc_tuning_handle_stepping(state, line, next_line):
+    state.current_gen2_reason = GC_REASON_STEPPING
+    #print("BGC#{0}({1}), stepping ({2})".format(state.num_gen2s, state.current_gen2_index, state.current_gen2_reason))
+
+def bgc_tuning_handle_gen2_panic(state, line, next_line):
+    state.current_gen2_reason = GC_REASON_PANIC_SOH
+    #print("BGC#{0}({1}), gen2 panic ({2})".format(state.num_gen2s, state.current_gen2_index, state.current_gen2_reason))
+
+def bgc_tuning_handle_gen3_panic(state, line, next_line):
+    state.current_gen2_reason = GC_REASON_PANIC_LOH
+    #print("BGC#{0}({1}), gen3 panic ({2})".format(state.num_gen2s, state.current_gen2_index, state.current_gen2_reason))
+
+def bgc_tuning_handle_gen2_growth(state, line, next_line):
+    state.current_gen2_reason = GC_REASON_GROWTH_SOH
+    #print("BGC#{0}({1}), gen2 growth ({2})".format(state.num_gen2s, state.current_gen2_index, state.current_gen2_reason))
+
+def bgc_tuning_handle_gen3_growth(state, line, next_line):
+    state.current_gen2_reason = GC_REASON_GROWTH_LOH
+    #print("BGC#{0}({1}), gen3 growth ({2})".format(state.num_gen2s, state.current_gen2_index, state.current_gen2_reason))
+
+# otherwise we need to parse the end BGC
+def bgc_tuning_handle_reason(state, line, next_line):
+    bgc_reason_str, remaining_str = parse_str(line, "BTL: reason: ", ",")
+    bgc_reason = int(bgc_reason_str)
+    if (bgc_reason == GC_REASON_PANIC_SOH):
+        state.gen2_panic_ca_plugs_size = state.gen2_plugs_size
+        state.gen2_panic_ca_plugs_count = state.gen2_plugs_count
+        # print("bgc {0} reason {1}, gen2 plugs not full alloced in fl {2}->{3}".format(
+            # state.current_gen2_index, bgc_reason,
+            # state.gen2_panic_ca_plugs_count, state.gen2_panic_ca_plugs_size))
+    if (state.current_gen2_reason == -1):
+        state.current_gen2_reason = bgc_reason
+
+def bgc_tuning_handle_btl2_star(state, line, next_line):
+    #print(line)
+    state.gen2_last_bgc_size, state.gen2_current_bgc_start_flr, state.gen2_current_bgc_sweep_flr, state.gen2_current_bgc_end_flr, state.gen2_gen_increase_flr, state.gen2_bgc_surv_rate, state.gen2_actual_gen1_to_trigger, state.gen2_gen1_since_last, state.gen2_actual_alloc_to_trigger, state.gen2_alloc_to_trigger = get_btl_star_info(line, "BTL2* ")
+
+def bgc_tuning_handle_btl3_star(state, line, next_line):
+    #print(line)
+    state.gen3_last_bgc_size, state.gen3_current_bgc_start_flr, state.gen3_current_bgc_sweep_flr, state.gen3_current_bgc_end_flr, state.gen3_gen_increase_flr, state.gen3_bgc_surv_rate, state.gen3_actual_gen1_to_trigger, state.gen3_gen1_since_last, state.gen3_actual_alloc_to_trigger, state.gen3_alloc_to_trigger = get_btl_star_info(line, "BTL3* ")
+
+def bgc_tuning_handle_low_memory_init(state, line, next_line):
+    state.low_memory_induced_p = 1
+
+def bgc_tuning_handle_ml(state, line, next_line):
+    if ((line.find("interval") == -1) and (line.find("stepping") == -1) and (line.find("elg:") == -1)):
+        ml_index = line.find(" ml: ")
+        ml_str = line[(ml_index + len(" ml: ")):]
+        state.recorded_ml = int(ml_str)
+
+def bgc_tuning_handle_gen2_beg(state, line, next_line):
+    beg_heap_size_str, remaining_str = parse_str(line, "THS: ", " ")
+    state.beg_heap_size = int(beg_heap_size_str)
+    beg_commit_size_str, remaining_str = parse_str(remaining_str, " ", " ")
+    state.beg_commit_size = int(beg_commit_size_str)
+    beg_ws_size_str, remaining_str = parse_str(remaining_str, " ", "(")
+    state.beg_ws_size = int(beg_ws_size_str)
+#     print(line)
+#     print("THS beg, heap size {0}, commit {1}, ws {2}".format(state.beg_heap_size, state.beg_commit_size, state.beg_ws_size))
+
+# [ 9080]g(2) #2965 [END] THS: 3358396272 4197388288 4255346688
+# new (and currently not used)
+# [ 6184]g(2) #2 [BEG] #2 THS: 645460720 645697536 662626304(645697536, 662626304)
+def bgc_tuning_handle_gen2_end(state, line, next_line):
+    if (line.find("[END]") != -1):
+        end_heap_size_str, remaining_str = parse_str(line, "THS: ", " ")
+        state.end_heap_size = int(end_heap_size_str)
+        end_commit_size_str, remaining_str = parse_str(remaining_str, " ", " ")
+        state.end_commit_size = int(end_commit_size_str)
+        end_ws_size_str = parse_str_no_end(remaining_str, " ")
+        # TODO
+        state.end_ws_size = int(end_ws_size_str)
+        # state.end_ws_size = 0
+#         print(line)
+#         print("THS end, heap size {0}, commit {1}, ws {2}".format(state.end_heap_size, state.end_commit_size, state.end_ws_size))
+
+# the order matters - a line goes to the first marker it contains, exactly
+# like the elif chain this replaced.
+bgc_tuning_line_handlers = [
+    ("*GC*", bgc_tuning_handle_gc_start),
+    ("*EGC", bgc_tuning_handle_gc_end),
+    ("BTL tuning parameters: ", bgc_tuning_handle_tuning_parameters),
+    (", P: ", bgc_tuning_handle_plugs),
+    ("bytes in alloc, ", bgc_tuning_handle_alloc_kp),
+    ("+accu err ", bgc_tuning_handle_alloc_ki),
+    ("panic trigger in free", bgc_tuning_handle_panic_trigger_in_free),
+    ("BTL: g2t[st]", bgc_tuning_handle_bgc_start_time),
+    ("BTL: g2t[en]", bgc_tuning_handle_bgc_end_time),
+    ("BTL3: path ", bgc_tuning_handle_gen3_path),
+    ("smoothed ", bgc_tuning_handle_smoothed),
+    ("ff ", bgc_tuning_handle_ff),
+    ("]: below goal", bgc_tuning_handle_below_goal),
+    (") since start (afl: ", bgc_tuning_handle_physical_sweep_flr),
+    ("BTL: ml: ", bgc_tuning_handle_btl_ml),
+    ("stepping trigger: yes", bgc_tuning_handle_stepping),
+    ("BTLc: gen2 panic trigger!!!", bgc_tuning_handle_gen2_panic),
+    ("BTLc: gen3 panic trigger!!!", bgc_tuning_handle_gen3_panic),
+    ("BTLc: gen2 below goal growth trigger!!!", bgc_tuning_handle_gen2_growth),
+    ("BTLc: gen3 below goal growth trigger!!!", bgc_tuning_handle_gen3_growth),
+    ("BTL: reason: ", bgc_tuning_handle_reason),
+    ("BTL2* ", bgc_tuning_handle_btl2_star),
+    ("BTL3* ", bgc_tuning_handle_btl3_star),
+    ("init: 0(9)", bgc_tuning_handle_low_memory_init),
+    (" ml: ", bgc_tuning_handle_ml),
+    ("g2 [BEG] ", bgc_tuning_handle_gen2_beg),
+    ("g(2) #", bgc_tuning_handle_gen2_end),
+]
+
+bgc_tuning_classifier = line_classifier([marker for marker, handler in bgc_tuning_line_handlers])
+
+# general processing for BGC tuning
+#
+# yields a (bgc_tuning_data, bgc_detailed_tuning_data) pair at the end of each BGC
+# (and each blocking gen2) so callers can consume the records as they are parsed
+# instead of holding the whole log in memory.
+#
+# use_mmap picks iter_classified_lines_mmap over reading the log in text mode, the
+# records are the same either way.
+def stream_file_bgc_tuning (file_name, state=None, use_mmap=False):
+    if (state is None):
+        state = bgc_tuning_state()
+
+    handlers = [handler for marker, handler in bgc_tuning_line_handlers]
+
+    if (use_mmap):
+        classified_lines = iter_classified_lines_mmap(file_name, bgc_tuning_classifier)
+    else:
+        classified_lines = iter_classified_lines(file_name, bgc_tuning_classifier)
+
+    for kind, line, next_line in classified_lines:
+        records = handlers[kind](state, line, next_line)
+        if (records is not None):
+            yield records
+
+def parse_file_bgc_tuning (file_name, use_mmap=False):
+    bgc_tuning_per_process = gc_record_store(bgc_tuning_data, bgc_tuning_data_fields)
+    bgc_detailed_tuning_per_process = gc_record_store(bgc_detailed_tuning_data, bgc_detailed_tuning_data_fields)
+    state = bgc_tuning_state()
+
+    for bgc_tuning, bgc_detailed_tuning in stream_file_bgc_tuning(file_name, state, use_mmap):
+        bgc_tuning_per_process.append(bgc_tuning)
+        bgc_detailed_tuning_per_process.append(bgc_detailed_tuning)
+
+    return state.num_gen2s, bgc_tuning_per_process, bgc_detailed_tuning_per_process, state.total_physical_memory
+
+# num_workers > 1 parses the log with parse_file_bgc_tuning_parallel. Its chunks
+# are read in text mode, there's no mmap version of reading a range of the log, so
+# use_mmap can't be used with it.
+def process_file_bgc_tuning (file_name, use_mmap=False, num_workers=1):
+    if (use_mmap and (num_workers != 1)):
+        raise ValueError("use_mmap only works with num_workers=1, the parallel parse reads the log in text mode")
+    if (num_workers != 1):
+        parse_function = lambda file_name: parse_file_bgc_tuning_parallel(file_name, num_workers)
+    else:
+        parse_function = lambda file_name: parse_file_bgc_tuning(file_name, use_mmap)
+    return cached_parse(file_name, "bgc-tuning", parse_function,
+        [None, bgc_tuning_data, bgc_detailed_tuning_data, None])
+
+# parses the log both ways (without the cache), makes sure they agree and prints
+# how fast each one was.
+def compare_bgc_tuning_parse_modes (file_name):
+    file_mb = os.path.getsize(file_name) / 1024.0 / 1024.0
+    results = []
+    for use_mmap in [False, True]:
+        printed = io.StringIO()
+        start_time = time.perf_counter()
+        with contextlib.redirect_stdout(printed):
+            num_gen2s, bgc_tuning, bgc_detailed_tuning, total_physical_memory = parse_file_bgc_tuning(file_name, use_mmap)
+        elapsed_s = time.perf_counter() - start_time
+        print("{0:5}: {1:.3f}s, {2:.1f}mb/s, {3} BGCs".format(
+            ("mmap" if use_mmap else "text"), elapsed_s, (file_mb / elapsed_s), len(bgc_tuning)))
+        results.append((num_gen2s, bgc_tuning.data[:len(bgc_tuning)].tolist(), bgc_detailed_tuning.data[:len(bgc_detailed_tuning)].tolist(),
+            total_physical_memory, printed.getvalue()))
+
+    if (results[0] != results[1]):
+        print("text and mmap parsing of {0} don't match!!!".format(file_name))
+    return results[0] == results[1]
+
+# parsing one log on multiple cores.
+#
+# the log is split into chunks that each start at a *GC* line and the chunks are
+# parsed in a process pool. The catch is the state that carries over from one chunk to
+# the next (current_gen2_index, last_bgc_end, the BTL2*/BTL3* fields...) - a chunk
+# doesn't know it till the chunks before it are done. So each chunk guesses: it
+# first parses the last g_parallel_parse_warmup_bytes before it (throwing away what
+# that produces) to get the state it most likely starts with, then parses itself
+# keeping track of every state field it read before writing and what it assumed that
+# field was. Once the results are back we go through the chunks in order - if every
+# field a chunk assumed matches the real state at the end of the chunk before it, the
+# chunk did exactly what a serial parse would have done and we take its records and
+# output as they are; if not we parse that chunk again with the real state. Either
+# way the result is identical to parse_file_bgc_tuning's.
+#
+# counters (the fields that are only ever added to) would never match so they aren't
+# guessed, each chunk counts from 0 and the counts are added up.
+g_parallel_parse_warmup_bytes = 1024 * 1024
+
+bgc_tuning_counter_fields = ["num_gen2s"]
+
+class speculative_bgc_tuning_state():
+    def __init__(self, assumed_fields):
+        # none of the state fields are set on the object at first so reading one
+        # goes through __getattr__ and we know it was read before it was written.
+        object.__setattr__(self, "_assumed_fields", assumed_fields)
+        object.__setattr__(self, "_fields_read", {})
+
+    def __getattr__(self, name):
+        if (name.startswith("_")):
+            raise AttributeError(name)
+        try:
+            value = self._assumed_fields[name]
+        except KeyError:
+            raise AttributeError(name)
+        self._fields_read[name] = value
+        object.__setattr__(self, name, value)
+        return value
+
+    # the fields read before being written and the value each was assumed to have
+    def fields_read(self):
+        return self._fields_read
+
+    def fields(self):
+        return {name: value for name, value in vars(self).items() if not name.startswith("_")}
+
+def run_bgc_tuning_handlers(state, file_name, start_offset, end_offset, records):
+    handlers = [handler for marker, handler in bgc_tuning_line_handlers]
+    classify = bgc_tuning_classifier.classify
+    for line, next_line in iter_lines_with_next_in_range(file_name, start_offset, end_offset):
+        kind = classify(line)
+        if (kind != LINE_KIND_NONE):
+            chunk_records = handlers[kind](state, line, next_line)
+            if ((chunk_records is not None) and (records is not None)):
+                records.append((tuple(chunk_records[0]), tuple(chunk_records[1])))
+
+# what a worker runs. Records come back as plain tuples to keep the pickling cheap.
+def parse_bgc_tuning_chunk(file_name, warmup_start_offset, start_offset, end_offset):
+    warmup_state = bgc_tuning_state()
+    with contextlib.redirect_stdout(io.StringIO()):
+        run_bgc_tuning_handlers(warmup_state, file_name, warmup_start_offset, start_offset, None)
+
+    assumed_fields = dict(vars(warmup_state))
+    for name in bgc_tuning_counter_fields:
+        assumed_fields[name] = 0
+
+    state = speculative_bgc_tuning_state(assumed_fields)
+    records = []
+    printed = io.StringIO()
+    with contextlib.redirect_stdout(printed):
+        run_bgc_tuning_handlers(state, file_name, start_offset, end_offset, records)
+    return records, printed.getvalue(), state.fields_read(), state.fields()
+
+# returns [(warmup_start_offset, start_offset, end_offset)] with each start at a *GC* line.
+# The boundaries are found by seeking to where each one should be and reading on to
+# the next *GC* line, not from the GC index - building that is a pass over the whole
+# log before any of the workers could start.
+def get_bgc_tuning_chunks(file_name, num_chunks):
+    file_size = os.path.getsize(file_name)
+
+    chunk_starts = [0]
+    with open(file_name, "rb") as log_file:
+        for chunk_index in range(1, num_chunks):
+            chunk_start = find_next_gc_start(log_file, chunk_index * file_size // num_chunks)
+            if ((chunk_start > chunk_starts[-1]) and (chunk_start < file_size)):
+                chunk_starts.append(chunk_start)
+
+        chunks = []
+        for chunk_index in range(len(chunk_starts)):
+            start_offset = chunk_starts[chunk_index]
+            end_offset = chunk_starts[chunk_index + 1] if (chunk_index + 1 < len(chunk_starts)) else file_size
+            if (chunk_index == 0):
+                warmup_start_offset = 0
+            else:
+                warmup_start_offset = min(find_next_gc_start(log_file, max(start_offset - g_parallel_parse_warmup_bytes, 0)), start_offset)
+            chunks.append((warmup_start_offset, start_offset, end_offset))
+    return chunks
+
+def parse_file_bgc_tuning_parallel (file_name, num_workers=None):
+    if (num_workers is None):
+        num_workers = os.cpu_count()
+
+    bgc_tuning_per_process = gc_record_store(bgc_tuning_data, bgc_tuning_data_fields)
+    bgc_detailed_tuning_per_process = gc_record_store(bgc_detailed_tuning_data, bgc_detailed_tuning_data_fields)
+
+    chunks = get_bgc_tuning_chunks(file_name, num_workers)
+    with concurrent.futures.ProcessPoolExecutor(max_workers=num_workers) as executor:
+        chunk_futures = [executor.submit(parse_bgc_tuning_chunk, file_name, *chunk) for chunk in chunks]
+
+        state_fields = vars(bgc_tuning_state())
+        num_reparsed_chunks = 0
+        for chunk, chunk_future in zip(chunks, chunk_futures):
+            records, printed, fields_read, chunk_state_fields = chunk_future.result()
+            if (all((state_fields[name] == value) for name, value in fields_read.items() if (name not in bgc_tuning_counter_fields))):
+                sys.stdout.write(printed)
+                for name in bgc_tuning_counter_fields:
+                    if (name in chunk_state_fields):
+                        chunk_state_fields[name] += state_fields[name]
+                state_fields.update(chunk_state_fields)
+            else:
+                # the chunk guessed wrong, do it again with the real state
+                num_reparsed_chunks += 1
+                state = bgc_tuning_state()
+                state.__dict__.update(state_fields)
+                records = []
+                run_bgc_tuning_handlers(state, file_name, chunk[1], chunk[2], records)
+                state_fields = vars(state)
+
+            for bgc_tuning, bgc_detailed_tuning in records:
+                bgc_tuning_per_process.append(bgc_tuning)
+                bgc_detailed_tuning_per_process.append(bgc_detailed_tuning)
+
+    # print("{0} chunks, {1} had to be parsed again".format(len(chunks), num_reparsed_chunks))
+    return state_fields["num_gen2s"], bgc_tuning_per_process, bgc_detailed_tuning_per_process, state_fields["total_physical_memory"]
+
+def process_files_bgc_tuning(file_names, num_workers=None):
+    return process_files_in_parallel(process_file_bgc_tuning, file_names, num_workers)
@@ -0,0 +1,161 @@
+import collections
+import re
+import types
+
+import numpy as np
+
+# the runtime has bucketed free spaces/plugs/objs by size in a few different ways
+# over time. a bucket scheme is everything we need to know about one of them -
+# the size of each bucket, which bucket a logged size is and whether the buckets
+# are logged as 2^n. they never change once they are made so logs that use different
+# schemes can be parsed in the same process, or in parallel.
+#
+# sizes is what we print for a bucket, bucket_sizes is what we weigh a bucket's
+# count with (they only differ for 2^n buckets with size_in_pow_2_p set).
+#
+# the index map is read only which can't be pickled, so a scheme is sent to worker
+# processes as what it was made from and made again there.
+class bucket_scheme(collections.namedtuple("bucket_scheme",
+    ["name", "sizes", "size_indices", "bucket_sizes", "size_in_pow_2_p", "base_power"])):
+    __slots__ = ()
+    def __reduce__(self):
+        return (make_bucket_scheme, (self.name, self.sizes, self.size_in_pow_2_p, self.base_power))
+
+def make_bucket_scheme(name, sizes, size_in_pow_2_p=0, base_power=8):
+    sizes = tuple(sizes)
+    # size -> bucket index for the buckets that are logged by size instead of by power,
+    # backwards so if a size is there twice we get the first one
+    size_indices = {}
+    for i in range(len(sizes) - 1, -1, -1):
+        size_indices[sizes[i]] = i
+
+    if (size_in_pow_2_p == 0):
+        bucket_sizes = np.array(sizes, dtype=np.int64)
+    else:
+        # when it's in 2^n format, b0 starts with 2^base_power
+        bucket_sizes = np.power(2.0, np.arange(len(sizes)) + base_power)
+    bucket_sizes.flags.writeable = False
+
+    return bucket_scheme(name, sizes, types.MappingProxyType(size_indices), bucket_sizes, size_in_pow_2_p, base_power)
+
+# this is the power of 2 and they are indexed by the power, we start from 2^8
+def get_pow2_bucket_sizes():
+    sizes = [256]
+    for temp_b_index in range (1, 11):
+        sizes.append(sizes[temp_b_index - 1] * 2)
+        # print("b{0}: size {1}".format(temp_b_index, sizes[temp_b_index]))
+    sizes.append(1048576)
+    return sizes
+
+# this is the 1st impl of size class - 100 buckets
+# we just use the size, no power of 2 stuff
+def get_size_buckets_0():
+    sizes = []
+    for i in range(0, 8):
+        sizes.append((i + 1) * 128)
+    for i in range(1, 16):
+        sizes.append((i + 1) * 1024)
+    for i in range(1, 61):
+        sizes.append((i * 4 + 16) * 1024)
+    for i in range(1, 17):
+        sizes.append((i * 16 + 256) * 1024)
+    sizes.append(1048576)
+    return sizes
+
+# this is the 2nd impl of size class - 42 buckets
+def get_size_buckets_1():
+    sizes = []
+    s = 128
+    last_bucket_min_size = 559872
+
+    while (s < last_bucket_min_size):
+        sizes.append(s)
+        if (s < 2 * 1024):
+            s += 128
+        elif (s < 16 * 1024):
+            s += 1024
+        elif (s < 32 * 1024):
+            s += 4 * 1024
+        else:
+            s += s >> 1
+
+    sizes.append(s)
+
+    # bucket 41 is the last bucket and it doesn't have a max 
+    # size associated with it. but we need it for printing so
+    # set it to 1mb
+    sizes.append(1048576)
+    return sizes
+
+# these are the buckets the gc1 logs record - 105 buckets
+def get_recording_bucket_sizes():
+    sizes = []
+    s = 128
+    last_bucket_min_size = 648 * 1024
+
+    while (s < last_bucket_min_size):
+        sizes.append(s)
+        if (s < 8 * 1024):
+            s += 128
+        elif (s < 16 * 1024):
+            s += 1024
+        elif (s < 128 * 1024):
+            s += 4 * 1024
+        else:
+            s += s >> 1
+
+    sizes.append(s)
+
+    # bucket 104 is the last bucket and it doesn't have a max 
+    # size associated with it. but we need it for printing so
+    # set it to 1mb
+    sizes.append(1024 * 1024)
+    return sizes
+
+# name -> bucket_scheme. if the runtime buckets things in a new way, make a scheme
+# for it and register it here.
+bucket_schemes = {}
+
+def register_bucket_scheme(scheme):
+    bucket_schemes[scheme.name] = scheme
+    return scheme
+
+register_bucket_scheme(make_bucket_scheme("pow2", get_pow2_bucket_sizes()))
+register_bucket_scheme(make_bucket_scheme("size100", get_size_buckets_0()))
+register_bucket_scheme(make_bucket_scheme("size42", get_size_buckets_1()))
+register_bucket_scheme(make_bucket_scheme("recording105", get_recording_bucket_sizes()))
+
+# the bucket lines in the size_increase logs look like
+# [25160][h0][#7986]: 2^13: F: 1152->1132(20), u: 0(0), O: 11, P: 9, TB: 6
+# [24648][h0] 128: F: 29348->29380(-32), u: 0(0), O: 1257, P: 14, TB: 0
+bucket_line_regex = re.compile(rb"(2\^|\] )(\d+): F: ")
+
+# which of the candidate schemes a log uses. 2^n buckets are always pow2; for sizes
+# we keep reading bucket lines until only one candidate has all the sizes we've seen.
+# if it's still ambiguous after max_bucket_lines, the earliest candidate wins.
+def detect_bucket_scheme(file_name, candidates=("size42", "size100", "pow2"), max_bucket_lines=100000):
+    remaining_candidates = [bucket_schemes[name] for name in candidates]
+    num_bucket_lines = 0
+    with open(file_name, "rb") as log_file:
+        for raw_line in log_file:
+            if (raw_line.find(b": F: ") == -1):
+                continue
+            bucket_match = bucket_line_regex.search(raw_line)
+            if (bucket_match is None):
+                continue
+            if (bucket_match.group(1) == b"2^"):
+                return bucket_schemes["pow2"]
+
+            bucket_size = int(bucket_match.group(2))
+            remaining_candidates = [scheme for scheme in remaining_candidates if (bucket_size in scheme.size_indices)]
+            if (len(remaining_candidates) == 0):
+                raise ValueError("{0} has a bucket of size {1} that none of {2} have".format(
+                    file_name, bucket_size, candidates))
+            num_bucket_lines += 1
+            if ((len(remaining_candidates) == 1) or (num_bucket_lines == max_bucket_lines)):
+                break
+
+    # no bucket lines at all, we stay with pow2 like we always did
+    if (num_bucket_lines == 0):
+        return bucket_schemes["pow2"]
+    return remaining_candidates[0]
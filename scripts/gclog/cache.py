@@ -0,0 +1,165 @@
+import hashlib
+import os
+import sys
+
+import numpy as np
+
+from .records import gc_bucket_matrix, gc_record_store
+
+# cache for parsed logs.
+#
+# we re-run the cells against the same logs over and over while working on the
+# charts so the parsed results are saved in g_parse_cache_dir as .npz files. A
+# cache file is keyed by the log's path, size and mtime, the parser and
+# PARSER_VERSION (bump it whenever a parser change would change what it returns)
+# plus whatever else the parser depends on, eg the bucket sizes. Whatever the
+# parser printed is saved too and printed again on a hit.
+#
+# when the cache dir is over g_parse_cache_max_bytes the least recently used
+# files are deleted; a hit counts as a use. Set g_parse_cache_dir to None to
+# turn the cache off.
+PARSER_VERSION = 2
+
+g_parse_cache_dir = os.path.join(os.path.expanduser("~"), ".gclog-parse-cache")
+g_parse_cache_max_bytes = 2 * 1024 * 1024 * 1024
+
+# the settings are module globals, so a worker process started with spawn (what
+# Windows always does) has the defaults again, not what the parent set them to.
+# Pools that parse in their workers pass these on with
+#   initializer=set_parse_cache_settings, initargs=get_parse_cache_settings()
+def get_parse_cache_settings():
+    return (g_parse_cache_dir, g_parse_cache_max_bytes)
+
+def set_parse_cache_settings(cache_dir, max_bytes):
+    global g_parse_cache_dir, g_parse_cache_max_bytes
+    g_parse_cache_dir = cache_dir
+    g_parse_cache_max_bytes = max_bytes
+
+class stdout_recorder():
+    def __init__(self, stdout):
+        self.stdout = stdout
+        self.text = []
+
+    def write(self, s):
+        self.text.append(s)
+        return self.stdout.write(s)
+
+    def flush(self):
+        self.stdout.flush()
+
+def get_parse_cache_path(file_name, parser_name, parser_config):
+    file_stat = os.stat(file_name)
+    key = "{0}|{1}|{2}|{3}|{4}|{5}".format(os.path.abspath(file_name), file_stat.st_size,
+        file_stat.st_mtime_ns, parser_name, PARSER_VERSION, parser_config)
+    key_hash = hashlib.sha1(key.encode("utf-8")).hexdigest()
+    return os.path.join(g_parse_cache_dir, "{0}-{1}.npz".format(parser_name, key_hash))
+
+# what a parser returns is a tuple of gc_record_stores, numbers, lists of numbers
+# and dicts of GC# -> list of per bucket numbers. Each is saved as an array plus
+# a kind so we know how to turn it back.
+def save_parse_result(cache_path, result, printed):
+    arrays = {}
+    kinds = []
+    for item_index, item in enumerate(result):
+        item_name = "item{0}".format(item_index)
+        if (isinstance(item, gc_record_store)):
+            kinds.append("store")
+            arrays[item_name] = item.data[:item.count]
+        elif (isinstance(item, gc_bucket_matrix)):
+            kinds.append("matrix")
+            arrays[item_name] = item.rows()
+        elif (isinstance(item, dict)):
+            kinds.append("dict")
+            arrays[item_name + "_keys"] = np.array(list(item.keys()), dtype=np.int64)
+            arrays[item_name] = np.array(list(item.values()))
+        elif (isinstance(item, list)):
+            kinds.append("list")
+            arrays[item_name] = np.array(item)
+        else:
+            kinds.append("scalar")
+            arrays[item_name] = np.array(item)
+    arrays["kinds"] = np.array(kinds)
+    arrays["printed"] = np.array(printed)
+
+    os.makedirs(g_parse_cache_dir, exist_ok=True)
+    temp_path = "{0}.{1}.tmp".format(cache_path, os.getpid())
+    with open(temp_path, "wb") as cache_file:
+        np.savez(cache_file, **arrays)
+    os.replace(temp_path, cache_path)
+
+# record_types[i] is the record type of result[i] if it's a gc_record_store
+def load_parse_result(cache_path, record_types):
+    result = []
+    with np.load(cache_path) as arrays:
+        kinds = arrays["kinds"].tolist()
+        for item_index, kind in enumerate(kinds):
+            item_name = "item{0}".format(item_index)
+            item = arrays[item_name]
+            if (kind == "store"):
+                store = gc_record_store(record_types[item_index], item.dtype, capacity=max(len(item), 1))
+                store.data[:len(item)] = item
+                store.count = len(item)
+                result.append(store)
+            elif (kind == "matrix"):
+                matrix = gc_bucket_matrix(item.shape[1], capacity=max(len(item), 1))
+                matrix.data[:len(item)] = item
+                matrix.count = len(item)
+                result.append(matrix)
+            elif (kind == "dict"):
+                keys = arrays[item_name + "_keys"].tolist()
+                result.append(dict(zip(keys, item.tolist())))
+            else:
+                result.append(item.tolist())
+        printed = arrays["printed"].item()
+    return tuple(result), printed
+
+def trim_parse_cache():
+    cache_files = []
+    total_size = 0
+    for entry in os.scandir(g_parse_cache_dir):
+        if (entry.is_file() and entry.name.endswith(".npz")):
+            entry_stat = entry.stat()
+            cache_files.append((entry_stat.st_mtime, entry_stat.st_size, entry.path))
+            total_size += entry_stat.st_size
+
+    # oldest use first
+    cache_files.sort()
+    for mtime, size, path in cache_files:
+        if (total_size <= g_parse_cache_max_bytes):
+            break
+        try:
+            os.remove(path)
+            total_size -= size
+        except OSError:
+            pass
+
+# returns what parse_function(file_name) returns, from the cache if we've parsed
+# this file before.
+def cached_parse(file_name, parser_name, parse_function, record_types, parser_config=""):
+    if (g_parse_cache_dir is None):
+        return parse_function(file_name)
+
+    cache_path = get_parse_cache_path(file_name, parser_name, parser_config)
+    if (os.path.exists(cache_path)):
+        try:
+            result, printed = load_parse_result(cache_path, record_types)
+            # mark it as recently used
+            os.utime(cache_path, None)
+            sys.stdout.write(printed)
+            return result
+        except (OSError, ValueError, KeyError) as e:
+            print("ignoring bad cache file {0}: {1}".format(cache_path, e))
+
+    recorder = stdout_recorder(sys.stdout)
+    sys.stdout = recorder
+    try:
+        result = parse_function(file_name)
+    finally:
+        sys.stdout = recorder.stdout
+
+    try:
+        save_parse_result(cache_path, result, "".join(recorder.text))
+        trim_parse_cache()
+    except OSError as e:
+        print("couldn't write cache file {0}: {1}".format(cache_path, e))
+    return result
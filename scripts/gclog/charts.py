@@ -0,0 +1,117 @@
+# the chart helpers. They draw on the subplots you give them so matplotlib is only
+# imported when something actually needs it.
+import numpy as np
+
+from .common import total_colors
+from .records import get_fields
+from .downsample import downsample_series
+
+# every series is cut down to what the subplot can show before it's drawn (see
+# downsample.py) so drawing takes about the same time however many GCs there are.
+# downsample_method is "minmax" (keeps the spikes) or "lttb" (keeps the shape),
+# max_points None is 2 points per pixel of the subplot's width.
+
+def plot_inc_chart(inc_plt, num_elements, x_inc_data, y_inc_data, 
+                 inc_legend, inc_color_index, downsample_method="minmax", max_points=None):
+    x_inc_data, y_inc_data = downsample_series(inc_plt, x_inc_data, y_inc_data, downsample_method, max_points)
+    #inc_plt.set_title(inc_title, loc='right')
+    inc_plt.plot(x_inc_data, y_inc_data, 
+        marker='.', 
+        linestyle='-',
+        color=total_colors[inc_color_index],
+        label=inc_legend)
+    #inc_plt.legend(bbox_to_anchor=(1, 1), loc=2, borderaxespad=0.)
+    inc_plt.legend(bbox_to_anchor=(1, 1), loc=2, borderaxespad=0.)
+    inc_plt.grid()
+
+def plot_surv_chart(inc_plt, num_elements, x_inc_data, y_inc_data, 
+                 inc_legend, inc_color_index, downsample_method="minmax", max_points=None):
+    x_inc_data, y_inc_data = downsample_series(inc_plt, x_inc_data, y_inc_data, downsample_method, max_points)
+    #inc_plt.set_title(inc_title, loc='right')
+    inc_plt.plot(x_inc_data, y_inc_data, 
+        marker='.', 
+        linestyle='-',
+        color=total_colors[inc_color_index],
+        label=inc_legend)
+    #inc_plt.legend(bbox_to_anchor=(1, 1), loc=2, borderaxespad=0.)
+    inc_plt.legend(bbox_to_anchor=(1, 1), loc=2, borderaxespad=0.)
+    inc_plt.grid()
+
+def plot_fl_fit_chart(inc_plt, num_elements, x_inc_data, y_inc_data, 
+                 inc_legend, inc_color_index, downsample_method="minmax", max_points=None):
+    x_inc_data, y_inc_data = downsample_series(inc_plt, x_inc_data, y_inc_data, downsample_method, max_points)
+    #inc_plt.set_title(inc_title, loc='right')
+    inc_plt.plot(x_inc_data, y_inc_data, 
+        marker='.', 
+        linestyle='-',
+        color=total_colors[inc_color_index],
+        label=inc_legend)
+    #inc_plt.legend(bbox_to_anchor=(1, 1), loc=2, borderaxespad=0.)
+    inc_plt.legend(bbox_to_anchor=(1, 1), loc=2, borderaxespad=0.)
+    inc_plt.grid()
+
+title_font = {'family': 'verdana',
+        'color':  'gray',
+        'weight': 'bold',
+        'size': 16,
+        }
+# src0, src1 provides the y_data
+def plt_comparison(c_plt, c_title, color_index_0,
+                   legend_0, legend_1,  legend_2,
+                   src0, src1, src2,
+                   field_name, start_index, 
+                   num_elements_0, num_elements_1, num_elements_2,
+                   downsample_method="minmax", max_points=None) :
+    from matplotlib.ticker import MultipleLocator
+
+    max_num_elements = max(num_elements_0, num_elements_1)
+    max_num_elements = max(max_num_elements, num_elements_2)
+    # print("getting GCs from {0} to {1}".format(start_index, (start_index + num_elements)))
+    c_x_data = np.arange(start_index, (start_index + max_num_elements))
+    # y_data_0 = get_fields(src0, field_name, start_index, num_elements)
+    # y_data_1 = get_fields(src1, field_name, start_index, num_elements)
+    y_data_0 = get_fields(src0, field_name, start_index, num_elements_0, max_num_elements)
+    y_data_1 = get_fields(src1, field_name, start_index, num_elements_1, max_num_elements)
+    y_data_2 = get_fields(src2, field_name, start_index, num_elements_2, max_num_elements)
+
+    # c_plt.set_title(c_title, fontdict=title_font, loc='right')
+    # c_plt.set_title(c_title, fontdict=title_font, x=1.08, loc='right')
+    c_plt.set_title(c_title, fontdict=title_font, x=1.08, loc="left")
+
+    # x_spacing = 5
+    # x_minorLocator = MultipleLocator(x_spacing)
+    # c_plt.xaxis.set_major_locator(x_minorLocator)
+    
+    if ((c_title == "ml")):
+        y_spacing = 5
+        y_minorLocator = MultipleLocator(y_spacing)
+        c_plt.yaxis.set_major_locator(y_minorLocator)
+
+    if ((c_title.find("sflr") != -1)):
+        y_spacing = 5
+        y_minorLocator = MultipleLocator(y_spacing)
+        c_plt.yaxis.set_major_locator(y_minorLocator)
+
+    c_x_data_0, y_data_0 = downsample_series(c_plt, c_x_data, y_data_0, downsample_method, max_points)
+    c_x_data_1, y_data_1 = downsample_series(c_plt, c_x_data, y_data_1, downsample_method, max_points)
+
+    c_plt.plot(c_x_data_0, y_data_0, 
+        marker='.', 
+        linestyle='-',
+        color=total_colors[color_index_0], 
+        label=legend_0)
+    c_plt.plot(c_x_data_1, y_data_1, 
+        marker='.', 
+        linestyle='-',
+        color=total_colors[color_index_0 + 1], 
+        label=legend_1)
+    # c_plt.plot(c_x_data, y_data_2, 
+    #     marker='.', 
+    #     linestyle='-',
+    #     color=total_colors[color_index_0 + 2], 
+    #     label=legend_2)
+
+    c_plt.legend(bbox_to_anchor=(1, 1), loc=2, borderaxespad=0.)
+
+    c_plt.grid(which='major')    
+    # c_plt.grid()
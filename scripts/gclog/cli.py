@@ -0,0 +1,283 @@
+# running the parsers from the command line over a batch of logs and writing what
+# they return as tables, eg
+#
+#   python -m gclog size-increase "D:/logs/**/new-gclog.*.log" --gc-range 74000:80000 --format parquet --jobs 8 --out D:/results
+#
+# each mode writes a few tables, one file per table in --out, with the rows of all
+# the logs in it and a "file" column saying which log a row came from.
+import argparse
+import contextlib
+import csv
+import functools
+import glob
+import importlib.util
+import json
+import os
+import sys
+
+import numpy as np
+
+from .buckets import bucket_schemes
+from .parallel import process_files_in_parallel
+from .bgc_tuning import process_file_bgc_tuning
+from .size_increase import process_file_bgc_tuning_size_increase
+from .gc1 import process_file_bgc_gc1, get_alloc_info_for_gc
+from .throughput import process_throughput_size, process_output
+from . import cache
+
+# globs are expanded here since the Windows shells don't do it for us. Files are
+# in the order they were given in, each only once.
+def expand_log_paths(paths):
+    file_names = []
+    for path in paths:
+        matches = sorted(glob.glob(path, recursive=True))
+        if (len(matches) == 0):
+            matches = [path]
+        file_names.extend(matches)
+    return list(dict.fromkeys(file_names))
+
+# "74000:80000", "74000:" or ":80000"
+def parse_gc_range(range_str):
+    start_str, separator, end_str = range_str.partition(":")
+    if (separator == ""):
+        raise argparse.ArgumentTypeError("{0} isn't start:end".format(range_str))
+    try:
+        start_gc_index = int(start_str) if (start_str != "") else None
+        end_gc_index = int(end_str) if (end_str != "") else None
+    except ValueError:
+        raise argparse.ArgumentTypeError("{0} isn't start:end".format(range_str))
+    return start_gc_index, end_gc_index
+
+# a table is {column name: array}, all the columns the same length
+def store_table(store):
+    return {field_name: store.column(field_name) for field_name in store.dtype.names}
+
+def in_gc_range(gen_index, gc_range):
+    start_gc_index, end_gc_index = gc_range
+    keep = np.ones(len(gen_index), dtype=bool)
+    if (start_gc_index is not None):
+        keep &= (gen_index >= start_gc_index)
+    if (end_gc_index is not None):
+        keep &= (gen_index <= end_gc_index)
+    return keep
+
+def filter_table(table, keep):
+    return {column_name: column[keep] for column_name, column in table.items()}
+
+def get_bgc_tuning_tables(results, gc_range):
+    tables = {"bgc-tuning": [], "bgc-detailed-tuning": []}
+    for file_name, (num_gen2s, bgc_tuning_info, bgc_detailed_tuning_info, total_physical_memory) in results.items():
+        bgc_tuning_table = store_table(bgc_tuning_info)
+        bgc_detailed_tuning_table = store_table(bgc_detailed_tuning_info)
+        if (gc_range is not None):
+            # the detailed records go with the BGC records of the same index
+            keep = in_gc_range(bgc_tuning_table["gen_index"], gc_range)
+            bgc_tuning_table = filter_table(bgc_tuning_table, keep)
+            bgc_detailed_tuning_table = filter_table(bgc_detailed_tuning_table, keep[:len(bgc_detailed_tuning_info)])
+        tables["bgc-tuning"].append((file_name, bgc_tuning_table))
+        tables["bgc-detailed-tuning"].append((file_name, bgc_detailed_tuning_table))
+    return tables
+
+size_increase_bucket_columns = ["gen2_free_spaces", "gen2_free_spaces_consumed", "gen1_objs", "gen1_plugs",
+    "gen1_unfit_plugs", "gen0_big_objects", "gen2_tb"]
+
+def get_size_increase_tables(results, schemes):
+    tables = {"eph-surv": [], "gen2-increase": [], "buckets": [], "gen0-buckets": []}
+    for file_name, result in results.items():
+        eph_surv_info, total_gen0_plugs, total_gen0_objs, total_gen0_allocated_big_objs, num_gen1_gen2_gcs, gen2_size_increase_info = result[:6]
+        bucket_matrices = [matrix.rows() for matrix in result[6:]]
+        scheme = schemes[file_name]
+
+        tables["eph-surv"].append((file_name, store_table(eph_surv_info)))
+        tables["gen2-increase"].append((file_name, store_table(gen2_size_increase_info)))
+
+        # one row per GC and bucket that has anything in it
+        gc_rows, bucket_indices = np.nonzero(np.any(np.stack(bucket_matrices) != 0, axis=0))
+        buckets_table = {
+            "gen_index": gen2_size_increase_info.column("gen_index")[gc_rows],
+            "bucket_size": np.array(scheme.sizes, dtype=np.int64)[bucket_indices],
+        }
+        for column_name, matrix in zip(size_increase_bucket_columns, bucket_matrices):
+            buckets_table[column_name] = matrix[gc_rows, bucket_indices]
+        tables["buckets"].append((file_name, buckets_table))
+
+        tables["gen0-buckets"].append((file_name, {
+            "bucket_size": np.array(scheme.sizes, dtype=np.int64),
+            "gen0_plugs": np.array(total_gen0_plugs, dtype=np.int64),
+            "gen0_objs": np.array(total_gen0_objs, dtype=np.int64),
+            "gen0_allocated_big_objs": np.array(total_gen0_allocated_big_objs, dtype=np.int64),
+        }))
+    return tables
+
+# the first log is the baseline; like process_file_bgc_gc1_comparison the allocs are
+# compared at the same point in time, the last GC of whichever log ends first.
+def get_gc1_compare_tables(results, scheme):
+    file_names = list(results.keys())
+    last_gc_timestamp_s = min(results[file_name][2] for file_name in file_names)
+    baseline_free_spaces = np.array(results[file_names[0]][0], dtype=np.int64)
+    baseline_plugs = np.array(results[file_names[0]][1], dtype=np.int64)
+
+    tables = {"gc1-summary": [], "gc1-buckets": []}
+    for file_name in file_names:
+        bgc_free_space_bucket_counts, gc1_plug_bucket_counts, gc_timestamp_s, soh_alloc_mb, loh_alloc_mb = results[file_name]
+        if (gc_timestamp_s > last_gc_timestamp_s):
+            soh_alloc_mb, loh_alloc_mb = get_alloc_info_for_gc(file_name, last_gc_timestamp_s)
+        tables["gc1-summary"].append((file_name, {
+            "last_gc_timestamp_s": np.array([gc_timestamp_s], dtype=np.int64),
+            "compared_at_s": np.array([last_gc_timestamp_s], dtype=np.int64),
+            "soh_alloc_mb": np.array([soh_alloc_mb], dtype=np.int64),
+            "loh_alloc_mb": np.array([loh_alloc_mb], dtype=np.int64),
+        }))
+
+        free_spaces = np.array(bgc_free_space_bucket_counts, dtype=np.int64)
+        plugs = np.array(gc1_plug_bucket_counts, dtype=np.int64)
+        tables["gc1-buckets"].append((file_name, {
+            "bucket_size": np.array(scheme.sizes, dtype=np.int64),
+            "bgc_free_spaces": free_spaces,
+            "gc1_plugs": plugs,
+            "bgc_free_spaces_diff": free_spaces - baseline_free_spaces,
+            "gc1_plugs_diff": plugs - baseline_plugs,
+        }))
+    return tables
+
+# the lastbuf files, with the iterations from the output file of the same run if
+# it's there (<run>lastbuf.txt goes with <run>output.txt).
+def process_throughput_run(lastbuf_file_name):
+    soh_alloc_mb, loh_alloc_mb, gen2_size, last_gc_index = process_throughput_size(lastbuf_file_name)
+    num_iterations = -1
+    lastbuf_index = lastbuf_file_name.rfind("lastbuf")
+    if (lastbuf_index != -1):
+        output_file_name = lastbuf_file_name[:lastbuf_index] + "output.txt"
+        if (os.path.exists(output_file_name)):
+            num_iterations = process_output(output_file_name)
+            if (num_iterations is None):
+                num_iterations = -1
+    return soh_alloc_mb, loh_alloc_mb, gen2_size, last_gc_index, num_iterations
+
+def get_throughput_tables(results):
+    tables = {"throughput": []}
+    for file_name, (soh_alloc_mb, loh_alloc_mb, gen2_size, last_gc_index, num_iterations) in results.items():
+        tables["throughput"].append((file_name, {
+            "soh_alloc_mb": np.array([soh_alloc_mb], dtype=np.int64),
+            "loh_alloc_mb": np.array([loh_alloc_mb], dtype=np.int64),
+            "gen2_size": np.array([gen2_size], dtype=np.int64),
+            "last_gc_index": np.array([last_gc_index], dtype=np.int64),
+            "num_iterations": np.array([num_iterations], dtype=np.int64),
+        }))
+    return tables
+
+# the per log tables are concatenated with the log as the first column
+def concat_tables(file_tables):
+    columns = {"file": np.array([file_name for file_name, table in file_tables
+        for row_index in range(len(next(iter(table.values()))))], dtype=object)}
+    for column_name in file_tables[0][1].keys():
+        columns[column_name] = np.concatenate([table[column_name] for file_name, table in file_tables])
+    return columns
+
+def write_csv(file_name, columns):
+    with open(file_name, "w", newline="") as csv_file:
+        writer = csv.writer(csv_file)
+        writer.writerow(list(columns.keys()))
+        writer.writerows(zip(*[column.tolist() for column in columns.values()]))
+
+def write_json(file_name, columns):
+    column_names = list(columns.keys())
+    rows = [dict(zip(column_names, row)) for row in zip(*[column.tolist() for column in columns.values()])]
+    with open(file_name, "w") as json_file:
+        json.dump(rows, json_file)
+
+# pyarrow is only needed for parquet so it's only imported then
+def write_parquet(file_name, columns):
+    import pyarrow
+    import pyarrow.parquet
+    table = pyarrow.table({column_name: column.tolist() if (column.dtype == object) else column
+        for column_name, column in columns.items()})
+    pyarrow.parquet.write_table(table, file_name)
+
+table_writers = {"csv": write_csv, "json": write_json, "parquet": write_parquet}
+
+def write_tables(tables, out_dir, output_format):
+    os.makedirs(out_dir, exist_ok=True)
+    written = []
+    for table_name, file_tables in tables.items():
+        if (len(file_tables) == 0):
+            continue
+        file_name = os.path.join(out_dir, "{0}.{1}".format(table_name, output_format))
+        columns = concat_tables(file_tables)
+        table_writers[output_format](file_name, columns)
+        written.append((file_name, len(columns["file"])))
+    return written
+
+def get_arg_parser():
+    arg_parser = argparse.ArgumentParser(prog="python -m gclog",
+        description="parse GC logs and write the results as tables")
+    arg_parser.add_argument("mode", choices=["bgc-tuning", "size-increase", "gc1-compare", "throughput"])
+    arg_parser.add_argument("logs", nargs="+",
+        help="log files or globs (** goes into subdirs); for gc1-compare the first one is the baseline, for throughput the lastbuf files")
+    arg_parser.add_argument("--format", dest="output_format", choices=sorted(table_writers.keys()), default="csv")
+    arg_parser.add_argument("--out", dest="out_dir", default=".", help="dir to write the tables to")
+    arg_parser.add_argument("--jobs", type=int, default=1, help="how many logs to parse at once")
+    arg_parser.add_argument("--gc-range", type=parse_gc_range, default=None,
+        help="start:end GC index (either can be left out), for bgc-tuning and size-increase")
+    arg_parser.add_argument("--scheme", choices=sorted(bucket_schemes.keys()), default=None,
+        help="bucket scheme for size-increase/gc1-compare, by default it's detected from each log")
+    arg_parser.add_argument("--no-cache", action="store_true", help="don't use or fill the parse cache")
+    arg_parser.add_argument("--quiet", action="store_true", help="don't show what the parsers print")
+    return arg_parser
+
+def run(args):
+    file_names = expand_log_paths(args.logs)
+    missing_file_names = [file_name for file_name in file_names if (not os.path.isfile(file_name))]
+    if (len(missing_file_names) > 0):
+        raise SystemExit("no such log: {0}".format(", ".join(missing_file_names)))
+
+    if (args.mode == "bgc-tuning"):
+        results = process_files_in_parallel(process_file_bgc_tuning, file_names, args.jobs)
+        return get_bgc_tuning_tables(results, args.gc_range)
+
+    if (args.mode == "size-increase"):
+        start_gc_index, end_gc_index = (None, None) if (args.gc_range is None) else args.gc_range
+        # with no --scheme each worker detects it (only if the log isn't cached) and
+        # sends it back with the results, we need it for the bucket sizes
+        process_function = functools.partial(process_file_bgc_tuning_size_increase,
+            start_gc_index=start_gc_index, end_gc_index=end_gc_index,
+            scheme=(None if (args.scheme is None) else bucket_schemes[args.scheme]), return_scheme=True)
+        results_and_schemes = process_files_in_parallel(process_function, file_names, args.jobs)
+        results = {file_name: result for file_name, (result, scheme) in results_and_schemes.items()}
+        schemes = {file_name: scheme for file_name, (result, scheme) in results_and_schemes.items()}
+        return get_size_increase_tables(results, schemes)
+
+    if (args.mode == "gc1-compare"):
+        scheme = bucket_schemes["recording105" if (args.scheme is None) else args.scheme]
+        results = process_files_in_parallel(functools.partial(process_file_bgc_gc1, scheme=scheme), file_names, args.jobs)
+        return get_gc1_compare_tables(results, scheme)
+
+    results = process_files_in_parallel(process_throughput_run, file_names, args.jobs)
+    return get_throughput_tables(results)
+
+def main(argv=None):
+    arg_parser = get_arg_parser()
+    args = arg_parser.parse_args(argv)
+    if ((args.gc_range is not None) and (args.mode not in ("bgc-tuning", "size-increase"))):
+        arg_parser.error("--gc-range only applies to bgc-tuning and size-increase")
+    if (args.jobs < 1):
+        arg_parser.error("--jobs has to be at least 1")
+
+    if (args.output_format == "parquet"):
+        # checked before parsing anything rather than finding out at the end
+        if (importlib.util.find_spec("pyarrow") is None):
+            arg_parser.error("--format parquet needs pyarrow (pip install pyarrow), or use csv/json")
+
+    if (args.no_cache):
+        cache.g_parse_cache_dir = None
+
+    if (args.quiet):
+        with open(os.devnull, "w") as devnull:
+            with contextlib.redirect_stdout(devnull):
+                tables = run(args)
+    else:
+        tables = run(args)
+
+    for file_name, num_rows in write_tables(tables, args.out_dir, args.output_format):
+        print("wrote {0} rows to {1}".format(num_rows, file_name), file=sys.stderr)
+    return 0
@@ -0,0 +1,31 @@
+# constants and small helpers shared by the parsers and the charts.
+
+def print_array (arr):
+    num_elements = len(arr)
+    index = 0
+    while (index < num_elements):
+        print("{0}: {1}".format(index, arr[index]))
+        index += 1
+
+BGC_MARK_START = 0
+BGC_SWEEP_START = 1
+BGC_SWEEP_END = 2
+BGC_MAX = 3
+
+GC_REASON_TUNING_SOH = 12
+GC_REASON_TUNING_LOH = 13
+GC_REASON_STEPPING = 14
+GC_REASON_PANIC_SOH = 15
+GC_REASON_PANIC_LOH = 16
+GC_REASON_GROWTH_SOH = 17
+GC_REASON_GROWTH_LOH = 18
+
+#b: blue
+#g: green
+#r: red
+#c: cyan
+#m: magenta
+#y: yellow
+#k: black
+total_colors = ['b', 'g', 'r', 'c', 'm', 'y', 'k', 'b', 'g', 'r', 'c', 'm', 'y', 'k']
+line_styles = ['-', '-.', '--', ':']
@@ -0,0 +1,86 @@
+# cutting a series down to what can actually be seen before it's drawn. A chart
+# can't show more points than it has pixels across so drawing 100k+ GCs only makes
+# it slow. Both ways keep the first and last points and the points stay in x order.
+import numpy as np
+
+# keeps the smallest and the largest y of each bucket of consecutive points, so
+# spikes (a long pause, a FL dropping) are still there after it's cut down. NaNs
+# (missing values) never win a bucket.
+def minmax_downsample(x, y, max_points):
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    num_points = len(y)
+    if ((max_points is None) or (num_points <= max_points)):
+        return x, y
+
+    bucket_len = -(-num_points // max(max_points // 2, 1))
+    num_buckets = -(-num_points // bucket_len)
+    buckets = np.full(num_buckets * bucket_len, np.nan)
+    buckets[:num_points] = y
+    buckets = buckets.reshape(num_buckets, bucket_len)
+    is_nan = np.isnan(buckets)
+    min_indices = np.where(is_nan, np.inf, buckets).argmin(axis=1)
+    max_indices = np.where(is_nan, -np.inf, buckets).argmax(axis=1)
+
+    bucket_starts = np.arange(num_buckets) * bucket_len
+    indices = np.unique(np.concatenate((bucket_starts + min_indices, bucket_starts + max_indices,
+        [0, num_points - 1])))
+    indices = indices[indices < num_points]
+    return x[indices], y[indices]
+
+# largest triangle three buckets - from each bucket it keeps the point that makes
+# the biggest triangle with the point kept before it and the average of the next
+# bucket. That keeps the shape of the line with 1 point per bucket so it's better
+# for trends (allocs, survival) than the min/max envelope. NaNs are dropped first.
+def lttb_downsample(x, y, max_points):
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    if ((max_points is None) or (len(y) <= max_points)):
+        return x, y
+    not_nan = ~(np.isnan(x) | np.isnan(y))
+    x = x[not_nan]
+    y = y[not_nan]
+    num_points = len(y)
+    max_points = max(max_points, 3)
+    if (num_points <= max_points):
+        return x, y
+
+    # the first and last points are always kept, the rest is split into max_points - 2 buckets
+    bucket_edges = np.linspace(1, num_points - 1, max_points - 1).astype(np.int64)
+    indices = np.empty(max_points, dtype=np.int64)
+    indices[0] = 0
+    indices[-1] = num_points - 1
+    kept_index = 0
+    for bucket_index in range(0, max_points - 2):
+        start = bucket_edges[bucket_index]
+        end = bucket_edges[bucket_index + 1]
+        if (bucket_index == (max_points - 3)):
+            next_x = x[-1]
+            next_y = y[-1]
+        else:
+            next_end = bucket_edges[bucket_index + 2]
+            next_x = x[end:next_end].mean()
+            next_y = y[end:next_end].mean()
+        areas = np.abs((x[kept_index] - next_x) * (y[start:end] - y[kept_index]) -
+            (x[kept_index] - x[start:end]) * (next_y - y[kept_index]))
+        kept_index = start + int(areas.argmax())
+        indices[bucket_index + 1] = kept_index
+    return x[indices], y[indices]
+
+downsample_methods = {
+    "minmax": minmax_downsample,
+    "lttb": lttb_downsample,
+}
+
+# how many points are worth drawing on a subplot - 2 per pixel across
+def get_max_points(sub_plt):
+    return 2 * max(int(sub_plt.get_window_extent().width), 1)
+
+# the charts call this with the whole series; max_points None means as many as the
+# subplot can show.
+def downsample_series(sub_plt, x_data, y_data, method="minmax", max_points=None):
+    if (max_points is None):
+        max_points = get_max_points(sub_plt)
+    if (len(y_data) <= max_points):
+        return x_data, y_data
+    return downsample_methods[method](x_data, y_data, max_points)
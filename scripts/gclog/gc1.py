@@ -0,0 +1,257 @@
+# the gc1 logs - the free space and gen1 plug buckets of the last BGC, and comparing
+# two of them.
+import bisect
+import functools
+import math
+import os
+
+from .lines import parse_str, elapsed_alloc_fields, gc1_bucket_fields
+from .buckets import bucket_schemes
+from .gcindex import decode_log_line
+from .tail import iter_lines_reversed
+from .parallel import process_files_in_parallel
+
+g_elapsed_index_block_size = 256 * 1024
+
+# finding the GC at some point in time would mean parsing every "(elapsed: " line before
+# it. Since the elapsed seconds only go up in a log we can bisect on the file instead -
+# this samples the first GC at or after the beginning of each block in the file (lazily,
+# so we only look at log2(num_blocks) of them) and looks like a sorted list of their
+# timestamps to bisect.
+class elapsed_timestamp_index():
+    def __init__(self, log_file, block_size=None):
+        self.log_file = log_file
+        self.block_size = g_elapsed_index_block_size if (block_size is None) else block_size
+        self.file_size = log_file.seek(0, os.SEEK_END)
+        self.num_blocks = self.file_size // self.block_size + 1
+        # block -> (timestamp_s, offset of the line), or None if there are no GCs after the block starts
+        self.entries = {}
+
+    def entry(self, block):
+        if (block not in self.entries):
+            self.entries[block] = find_next_elapsed_line(self.log_file, block * self.block_size)
+        return self.entries[block]
+
+    def __len__(self):
+        return self.num_blocks
+
+    def __getitem__(self, block):
+        block_entry = self.entry(block)
+        return math.inf if (block_entry is None) else block_entry[0]
+
+# returns (timestamp_s, offset) of the first "(elapsed: " line that starts at or after offset
+def find_next_elapsed_line(log_file, offset):
+    if (offset > 0):
+        # this skips the rest of the line offset is in, or nothing if offset is at the start of a line
+        log_file.seek(offset - 1)
+        log_file.readline()
+    else:
+        log_file.seek(0)
+
+    while (True):
+        line_offset = log_file.tell()
+        raw_line = log_file.readline()
+        if (not raw_line):
+            return None
+        if (raw_line.find(b"(elapsed: ") != -1):
+            gc_timestamp_s_str, soh_alloc_mb_str, loh_alloc_mb_str = elapsed_alloc_fields.extract(decode_log_line(raw_line))
+            return int(gc_timestamp_s_str), line_offset
+
+def convert_recording_bucket_index(bucket_str, scheme):
+    bucket_index = scheme.size_indices.get(int(bucket_str))
+    if (bucket_index is None):
+        print("what?! {0} isn't valid".format(bucket_str))
+    return bucket_index
+
+def print_recording_buckets(buckets, scheme):
+    for i in range(0, len(scheme.sizes)):
+        print("b#{0}: {1} - {2}".format(i, scheme.sizes[i], buckets[i]))
+
+# scheme is how the log buckets sizes, the gc1 logs use the recording buckets.
+def process_file_bgc_gc1 (file_name, scheme=None):
+    if (scheme is None):
+        scheme = bucket_schemes["recording105"]
+
+    bgc_free_space_bucket_counts = [0 for i in range(len(scheme.sizes))]
+    # this is what we allocated into gen2 from gen1
+    gc1_plug_bucket_counts = [0 for i in range(len(scheme.sizes))]
+
+    # we only want the buckets and gen2 info from the very last BGC sweep in the file
+    # so whenever we see a sweep we throw away what we've recorded so far. The counts
+    # are kept by bucket size and only converted to bucket indices at the end.
+    last_bgc_bucket_counts = {}
+
+    bgc_surv = 0
+    bgc_total_size = 0
+    bgc_fl = 0
+    bgc_fo = 0
+
+    gc_timestamp_s = 0
+    soh_alloc_mb = 0
+    loh_alloc_mb = 0
+
+    with open(file_name, "r") as pause_file:
+        for line in pause_file:
+
+            if (line.find("]end of bgc sweep: ") != -1):
+                last_bgc_bucket_counts = {}
+                bgc_surv = 0
+                bgc_total_size = 0
+                bgc_fl = 0
+                bgc_fo = 0
+
+            # parse this line
+            # [73576]GC#61632(1949,123)(gen0) took 3ms(elapsed: 1574564594, 11374s, 189min) (alloc: 379613mb, 354mb)
+            elif(line.find("(elapsed: ") != -1):
+                gc_timestamp_s_str, soh_alloc_mb_str, loh_alloc_mb_str = elapsed_alloc_fields.extract(line)
+                gc_timestamp_s = int(gc_timestamp_s_str)
+                soh_alloc_mb = int(soh_alloc_mb_str)
+                loh_alloc_mb = int(loh_alloc_mb_str)
+
+            if (line.find("2F: ") != -1):
+                bucket_size_str, bgc_free_space_counts_str, gc1_plug_counts_str = gc1_bucket_fields.extract(line)
+                last_bgc_bucket_counts[int(bucket_size_str)] = (int(bgc_free_space_counts_str), int(gc1_plug_counts_str))
+
+            # parse this line to print out some info about gen2
+            # [35820]h0 g2 surv: 316220408 current: 316220432 alloc: 8514792 (96%) f: 180% new-size: 564412648 new-alloc: 248192216
+            elif (line.find("g2 surv") != -1):
+                bgc_surv_str, remaining_str = parse_str(line, "g2 surv: ", " ")
+                bgc_surv = int(bgc_surv_str)
+
+            # parse this line
+            # [35820][END][g2]g2:, s: 393140432, frag: 76920000(L: 71701840, O: 5218160), f: 19% (S)   P
+            elif (line.find("[END][g2]g2") != -1):
+                bgc_total_size_str, remaining_str = parse_str(line, "s: ", ",")
+                bgc_total_size = int(bgc_total_size_str)
+
+                bgc_fl_str, remaining_str = parse_str(remaining_str, "L: ", ",")
+                bgc_fl = int(bgc_fl_str)
+
+                bgc_fo_str, remaining_str = parse_str(remaining_str, "O: ", ")")
+                bgc_fo = int(bgc_fo_str)
+
+    for bucket_size, (bgc_free_space_counts, gc1_plug_counts) in last_bgc_bucket_counts.items():
+        bucket_index = convert_recording_bucket_index(bucket_size, scheme)
+        bgc_free_space_bucket_counts[bucket_index] = bgc_free_space_counts
+        gc1_plug_bucket_counts[bucket_index] = gc1_plug_counts
+
+    print("{0} last bgc".format(file_name))
+    print("size: {0:,}, FL: {1:,}, FO: {2:,}, surv: {3:,}, size-fo-fl: {4:,}".format(
+        bgc_total_size, bgc_fl, bgc_fo, bgc_surv, (bgc_total_size - bgc_fl - bgc_fo)))
+
+    print("last GC at {0:,}s, soh alloc {1:,}mb, loh alloc {2:,}mb".format(
+        gc_timestamp_s, soh_alloc_mb, loh_alloc_mb))
+
+    # print("printing bgc free space counts from {0}".format(file_name))
+    # print_recording_buckets(bgc_free_space_bucket_counts, scheme)    
+
+    # print("printing g1 surv plug counts from {0}".format(file_name))
+    # print_recording_buckets(gc1_plug_bucket_counts, scheme) 
+
+    return bgc_free_space_bucket_counts, gc1_plug_bucket_counts, gc_timestamp_s, soh_alloc_mb, loh_alloc_mb
+
+def get_alloc_info_for_gc (file_name, target_gc_timestamp_s):
+
+    saved_gc_timestamp_s = 0
+    saved_soh_alloc_mb = 0
+    saved_loh_alloc_mb = 0
+    
+    print("looking for the last GC at {0:,}s in {1}".format(target_gc_timestamp_s, file_name))
+
+    with open(file_name, "rb") as pause_file:
+        # find the first block whose first GC is already past the target, the GC we want
+        # is after the first GC in the block before it.
+        timestamp_index = elapsed_timestamp_index(pause_file)
+        block = bisect.bisect_left(timestamp_index, target_gc_timestamp_s + 1)
+        pause_file.seek(0 if (block == 0) else timestamp_index.entry(block - 1)[1])
+
+        for raw_line in pause_file:
+
+            # parse this line
+            # [73576]GC#61632(1949,123)(gen0) took 3ms(elapsed: 1574564594, 11374s, 189min) (alloc: 379613mb, 354mb)
+            if(raw_line.find(b"(elapsed: ") != -1):
+                gc_timestamp_s_str, soh_alloc_mb_str, loh_alloc_mb_str = elapsed_alloc_fields.extract(decode_log_line(raw_line))
+                gc_timestamp_s = int(gc_timestamp_s_str)
+
+                # we wanna get the last GC with that timestamp
+                if (gc_timestamp_s == (target_gc_timestamp_s + 1)):
+                    # print("exiting at this line...found the first GC with {0:,}+1".format(target_gc_timestamp_s))
+                    # print(line)
+                    break
+
+                # there's no GC with the timestamp right after the target which means we won't
+                # find one later either, so what we'd end up with is the last GC in the file.
+                if (gc_timestamp_s > (target_gc_timestamp_s + 1)):
+                    for line in iter_lines_reversed(file_name):
+                        if (line.find("(elapsed: ") != -1):
+                            gc_timestamp_s_str, soh_alloc_mb_str, loh_alloc_mb_str = elapsed_alloc_fields.extract(line)
+                            saved_gc_timestamp_s = int(gc_timestamp_s_str)
+                            saved_soh_alloc_mb = int(soh_alloc_mb_str)
+                            saved_loh_alloc_mb = int(loh_alloc_mb_str)
+                            break
+                    break
+
+                soh_alloc_mb = int(soh_alloc_mb_str)
+                loh_alloc_mb = int(loh_alloc_mb_str)
+
+                saved_gc_timestamp_s = gc_timestamp_s
+                saved_soh_alloc_mb = soh_alloc_mb
+                saved_loh_alloc_mb = loh_alloc_mb
+
+    print("found GC at {0:,}s, soh alloc {1:,}mb, loh alloc {2:,}mb".format(
+        saved_gc_timestamp_s, saved_soh_alloc_mb, saved_loh_alloc_mb))
+
+    return saved_soh_alloc_mb, saved_loh_alloc_mb
+
+def process_file_bgc_gc1_comparison (file_name_0, file_name_1, scheme=None): 
+    if (scheme is None):
+        scheme = bucket_schemes["recording105"]
+
+    print("comparing {0} with {1}".format(file_name_0, file_name_1))
+    gc1_results = process_files_in_parallel(functools.partial(process_file_bgc_gc1, scheme=scheme), [file_name_0, file_name_1])
+    bgc_free_space_bucket_counts_0, gc1_plug_bucket_counts_0, gc_timestamp_s_0, soh_alloc_mb_0, loh_alloc_mb_0 = gc1_results[file_name_0]
+    bgc_free_space_bucket_counts_1, gc1_plug_bucket_counts_1, gc_timestamp_s_1, soh_alloc_mb_1, loh_alloc_mb_1 = gc1_results[file_name_1]
+
+    reparse_file_name = file_name_0 if (gc_timestamp_s_0 > gc_timestamp_s_1) else file_name_1
+    reparse_gc_timestamp_s = gc_timestamp_s_1 if (gc_timestamp_s_0 > gc_timestamp_s_1) else gc_timestamp_s_0
+
+    reparse_soh_alloc_mb, reparse_loh_alloc_mb = get_alloc_info_for_gc (reparse_file_name, reparse_gc_timestamp_s)
+
+    baseline_soh_alloc_mb = reparse_soh_alloc_mb if (gc_timestamp_s_0 > gc_timestamp_s_1) else soh_alloc_mb_0
+    comparison_soh_alloc_mb = reparse_soh_alloc_mb if (gc_timestamp_s_0 < gc_timestamp_s_1) else soh_alloc_mb_1
+
+    print("soh alloc 0: {0:,}mb, 1: {1:,}mb ({2:.2f}%)".format(
+        baseline_soh_alloc_mb, comparison_soh_alloc_mb, 
+        100.0 * (comparison_soh_alloc_mb - baseline_soh_alloc_mb) / baseline_soh_alloc_mb))
+
+    baseline_loh_alloc_mb = reparse_loh_alloc_mb if (gc_timestamp_s_0 > gc_timestamp_s_1) else loh_alloc_mb_0
+    comparison_loh_alloc_mb = reparse_loh_alloc_mb if (gc_timestamp_s_0 < gc_timestamp_s_1) else loh_alloc_mb_1
+
+    print("loh alloc 0: {0:,}mb, 1: {1:,}mb ({2:.2f}%)".format(
+        baseline_loh_alloc_mb, comparison_loh_alloc_mb, 
+        100.0 * (comparison_loh_alloc_mb - baseline_loh_alloc_mb) / baseline_loh_alloc_mb))
+
+    print("{0:10} | {1:10} | {2:10} | {3:10} | {4:10} | {5:10} | {6:10}".format(
+        "size",
+        "free0", "free1", "diff",
+        "plug0", "plug1", "diff"))
+
+    for i in range(0, len(scheme.sizes)):
+        bgc_free_space_bucket_0 = bgc_free_space_bucket_counts_0[i]
+        bgc_free_space_bucket_1 = bgc_free_space_bucket_counts_1[i]
+        gc1_plug_bucket_0 = gc1_plug_bucket_counts_0[i]
+        gc1_plug_bucket_1 = gc1_plug_bucket_counts_1[i]
+        free1_is_bigger = (bgc_free_space_bucket_1 > bgc_free_space_bucket_0)
+        bgc_free_space_bucket_diff = abs(bgc_free_space_bucket_1 - bgc_free_space_bucket_0)
+        gc1_plug1_is_bigger = (gc1_plug_bucket_1 > gc1_plug_bucket_0)
+        gc1_plug_bucket_diff = abs(gc1_plug_bucket_1 - gc1_plug_bucket_0)
+        print("{0:10} | {1:10} | {2:10} | {3}{4:9} | {5:10} | {6:10} | {7}{8:9}".format(
+            scheme.sizes[i],
+            bgc_free_space_bucket_0,
+            bgc_free_space_bucket_1,
+            ("+" if free1_is_bigger else "-"),
+            bgc_free_space_bucket_diff,
+            gc1_plug_bucket_0,
+            gc1_plug_bucket_1,
+            ("+" if gc1_plug1_is_bigger else "-"),
+            gc1_plug_bucket_diff))
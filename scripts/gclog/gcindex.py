@@ -0,0 +1,180 @@
+import io
+import locale
+import os
+import re
+
+import numpy as np
+
+from .records import gc_record_store
+
+# byte offsets of GCs in a log.
+#
+# the charts usually only look at a window of GCs (start_gc_index/end_gc_index) so
+# instead of parsing everything before the window we can seek straight to it. The
+# index has an entry per GC with the offset of its *GC* line and the offset right
+# after its *EGC* line (-1 if the log ends before the GC does) and is saved next to
+# the log as <log>.gcindex.npz so we only scan the log for it once.
+GC_INDEX_VERSION = 1
+
+gc_offset_fields = [
+    ("gc_index", np.int64),
+    ("start", np.int64),
+    ("end", np.int64),
+]
+
+gc_boundary_regex = re.compile(rb"\*(E?)GC\* (\d+)\(")
+
+# lines are read as bytes here, this turns them into what reading the file in text
+# mode would give us.
+def decode_log_line(raw_line):
+    line = raw_line.decode(locale.getpreferredencoding(False), errors="replace")
+    if (line.endswith("\r\n")):
+        return line[:-2] + "\n"
+    elif (line.endswith("\r")):
+        return line[:-1] + "\n"
+    return line
+
+def build_gc_index(file_name, block_size=16 * 1024 * 1024):
+    gc_offsets = gc_record_store(None, gc_offset_fields, capacity=1024)
+    # GC# -> where it is in gc_offsets, for the GCs we haven't seen the end of yet
+    open_gcs = {}
+    block_offset = 0
+    with open(file_name, "rb") as log_file:
+        remainder = b""
+        while (True):
+            block = log_file.read(block_size)
+            at_end = (len(block) == 0)
+            block = remainder + block
+            # only look at complete lines, the rest goes with the next block
+            block_end = len(block) if at_end else (block.rfind(b"\n") + 1)
+            for m in gc_boundary_regex.finditer(block, 0, block_end):
+                line_start = block.rfind(b"\n", 0, m.start()) + 1
+                gc_index = int(m.group(2))
+                if (m.group(1)):
+                    if (gc_index in open_gcs):
+                        line_end = block.find(b"\n", m.end(), block_end)
+                        line_end = block_end if (line_end == -1) else (line_end + 1)
+                        gc_offsets.data["end"][open_gcs.pop(gc_index)] = block_offset + line_end
+                else:
+                    open_gcs[gc_index] = len(gc_offsets)
+                    gc_offsets.append((gc_index, block_offset + line_start, -1))
+
+            if (at_end):
+                break
+            remainder = block[block_end:]
+            block_offset += block_end
+
+    return gc_offsets.data[:len(gc_offsets)].copy()
+
+gc_start_regex = re.compile(rb"\*GC\* \d+\(")
+
+# the offset of the first *GC* line that starts at or after offset, or the size of
+# the file if there isn't one. It only reads from offset to that line so it's cheap
+# to call anywhere in a log that has no index yet.
+def find_next_gc_start(log_file, offset):
+    if (offset > 0):
+        # this skips the rest of the line offset is in, or nothing if offset is at the start of a line
+        log_file.seek(offset - 1)
+        log_file.readline()
+    else:
+        log_file.seek(0)
+
+    while (True):
+        line_offset = log_file.tell()
+        raw_line = log_file.readline()
+        if (not raw_line):
+            return line_offset
+        if (gc_start_regex.search(raw_line) is not None):
+            return line_offset
+
+def get_gc_index_path(file_name):
+    return file_name + ".gcindex.npz"
+
+def load_gc_index(file_name):
+    file_stat = os.stat(file_name)
+    index_path = get_gc_index_path(file_name)
+    if (os.path.exists(index_path)):
+        try:
+            with np.load(index_path) as arrays:
+                if ((arrays["version"].item() == GC_INDEX_VERSION) and
+                    (arrays["log_size"].item() == file_stat.st_size) and
+                    (arrays["log_mtime_ns"].item() == file_stat.st_mtime_ns)):
+                    return arrays["gcs"]
+        except (OSError, ValueError, KeyError) as e:
+            print("ignoring bad GC index {0}: {1}".format(index_path, e))
+
+    gc_offsets = build_gc_index(file_name)
+    try:
+        temp_path = "{0}.{1}.tmp".format(index_path, os.getpid())
+        with open(temp_path, "wb") as index_file:
+            np.savez(index_file, gcs=gc_offsets, version=GC_INDEX_VERSION,
+                log_size=file_stat.st_size, log_mtime_ns=file_stat.st_mtime_ns)
+        os.replace(temp_path, index_path)
+    except OSError as e:
+        # we can still use it, we just have to build it again next time
+        print("couldn't write GC index {0}: {1}".format(index_path, e))
+    return gc_offsets
+
+# returns the byte range [start, end) that covers GCs start_gc_index to end_gc_index.
+# it starts at the *GC* line of the first GC >= start_gc_index and ends after the *EGC*
+# line of the last GC <= end_gc_index, so a BGC that started in the range but ends
+# after that GC isn't in it. None for either means from the beginning/to the end.
+def get_gc_range_offsets(file_name, start_gc_index, end_gc_index):
+    gc_offsets = load_gc_index(file_name)
+    gc_indices = gc_offsets["gc_index"]
+
+    start_offset = 0
+    if (start_gc_index is not None):
+        first = np.searchsorted(gc_indices, start_gc_index, side="left")
+        start_offset = int(gc_offsets["start"][first]) if (first < len(gc_offsets)) else os.path.getsize(file_name)
+
+    end_offset = -1
+    if (end_gc_index is not None):
+        last = np.searchsorted(gc_indices, end_gc_index, side="right") - 1
+        if (last < 0):
+            end_offset = start_offset
+        else:
+            end_offset = int(gc_offsets["end"][last])
+
+    if (end_offset == -1):
+        end_offset = os.path.getsize(file_name)
+    return start_offset, max(start_offset, end_offset)
+
+def iter_lines_in_range(file_name, start_offset, end_offset):
+    with open(file_name, "rb") as log_file:
+        log_file.seek(start_offset)
+        offset = start_offset
+        for raw_line in log_file:
+            if (offset >= end_offset):
+                break
+            offset += len(raw_line)
+            yield decode_log_line(raw_line)
+
+# (line, next_line) like iter_lines_with_next for the lines in [start_offset, end_offset),
+# both offsets need to be at the start of a line. The last next_line is the line right
+# after the range. The range is decoded a block at a time which is a lot faster than
+# going line by line in binary mode.
+def iter_lines_with_next_in_range(file_name, start_offset, end_offset, block_size=16 * 1024 * 1024):
+    encoding = locale.getpreferredencoding(False)
+    with open(file_name, "rb") as log_file:
+        log_file.seek(start_offset)
+        bytes_left = end_offset - start_offset
+        partial_line = b""
+        line = None
+        while (bytes_left > 0):
+            read_size = min(block_size, bytes_left)
+            block = partial_line + log_file.read(read_size)
+            bytes_left -= read_size
+            # the last line in a block might continue in the next one
+            partial_line = b""
+            if (bytes_left > 0):
+                block_end = block.rfind(b"\n") + 1
+                block, partial_line = block[:block_end], block[block_end:]
+
+            for next_line in io.StringIO(block.decode(encoding, errors="replace"), newline=None):
+                if (line is not None):
+                    yield line, next_line
+                line = next_line
+
+        if (line is not None):
+            yield line, decode_log_line(log_file.readline())
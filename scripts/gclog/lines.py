@@ -0,0 +1,234 @@
+# everything for picking lines apart - the field extractors for the log lines we
+# care about and line_classifier which decides which handler a line goes to.
+import re
+
+from .records import PATH_ABOVE, PATH_BELOW, PATH_UNCHANGED
+
+def parse_str(str_to_parse, beg_str, end_str): 
+    start_index = str_to_parse.find(beg_str) + len(beg_str) 
+    end_index = str_to_parse.find(end_str, start_index) 
+    str_to_ret = str_to_parse[start_index:end_index]
+    # often we want to keep parsing so also return the remaining str
+    remaining_str = str_to_parse[end_index:]
+    return str_to_ret, remaining_str
+
+def parse_str_no_end(str_to_parse, beg_str): 
+    start_index = str_to_parse.find(beg_str) + len(beg_str) 
+    str_to_ret = str_to_parse[start_index:] 
+    return str_to_ret
+
+# a precompiled version of a chain of parse_str calls on one kind of line.
+#
+# steps are the (beg_str, end_str) pairs the chain would pass to parse_str, each one
+# working on what the previous one left as remaining_str; an end_str of None is a
+# parse_str_no_end. extract returns the same strings the chain would, but from a
+# single regex match instead of copying the rest of the line at every step. If the
+# line doesn't look like what the chain expects (some beg_str/end_str isn't there)
+# we just run the chain so the result is still exactly what parse_str gives.
+class field_extractor():
+    def __init__(self, steps):
+        self.steps = steps
+        pattern = ""
+        for beg_str, end_str in steps:
+            pattern += text_before(beg_str) + re.escape(beg_str)
+            if (end_str is None):
+                pattern += "(.*)"
+            else:
+                pattern += "(" + text_before(end_str) + ")(?=" + re.escape(end_str) + ")"
+        self.regex = re.compile(pattern, re.DOTALL)
+
+    def extract(self, line):
+        m = self.regex.match(line)
+        if (m is not None):
+            return m.groups()
+
+        fields = []
+        remaining_str = line
+        for beg_str, end_str in self.steps:
+            if (end_str is None):
+                fields.append(parse_str_no_end(remaining_str, beg_str))
+            else:
+                field_str, remaining_str = parse_str(remaining_str, beg_str, end_str)
+                fields.append(field_str)
+        return tuple(fields)
+
+# matches everything up to (not including) the first occurrence of s, the same
+# place str.find(s) would stop.
+def text_before(s):
+    first_char = re.escape(s[0])
+    if (len(s) == 1):
+        return "[^" + first_char + "]*"
+    return "[^{0}]*(?:{0}(?!{1})[^{0}]*)*".format(first_char, re.escape(s[1:]))
+
+#
+# one extractor per log line format we pull numbers out of with parse_str chains.
+#
+# [ 3060]BTL2* 1065552, 81.9, 85.5, 87.3, 14.4, 63.4, 8, 8, 2303504, 2303504
+# keyed by the BTL2*/BTL3* prefix, see get_btl_star_info
+btl_star_fields = {}
+
+# [21832]fla: 326136 (1208 fo rej), esa: 0, ca: 1297224, fl: 71967968(40%), fo: 819512, g1 ca: 524648
+fla_fields = field_extractor([("fla: ", " "), ("esa: ", ","), ("ca: ", ","), ("fl: ", "("), ("(", "%")])
+
+# [25160][h0][#7986]: 2^13: F: 1152->1132(20), u: 0(0), O: 11, P: 9, TB: 6
+# [24648][h0] 128: F: 29348->29380(-32), u: 0(0), O: 1257, P: 14, TB: 0
+# older logs don't have the TB: part.
+gen1_bucket_steps = [("->", "("), ("(", ")"), ("u: ", "("), ("O: ", ","), ("P: ", ",")]
+gen1_pow2_bucket_fields = field_extractor([("2^", ":")] + gen1_bucket_steps)
+gen1_pow2_bucket_tb_fields = field_extractor([("2^", ":")] + gen1_bucket_steps + [("TB: ", None)])
+gen1_size_bucket_fields = field_extractor([("] ", ":")] + gen1_bucket_steps)
+gen1_size_bucket_tb_fields = field_extractor([("] ", ":")] + gen1_bucket_steps + [("TB: ", None)])
+
+# [35820]h0 256: 2F: 10, 1P: 3)
+gc1_bucket_fields = field_extractor([(" ", ":"), ("2F: ", ","), ("1P: ", ")")])
+
+# [23400]GC#29051(1196,61)(gen1) took 7ms(elapsed: 435028308, 5196s, 86min) (alloc: 178796mb, 322mb)
+elapsed_fields = field_extractor([("took ", "ms"), (", ", "s"), (", ", "min"), ("alloc: ", "mb"), (" ", "mb")])
+# same line when we only want the timestamp and how much was allocated
+elapsed_alloc_fields = field_extractor([(", ", "s"), ("alloc: ", "mb"), (" ", "mb")])
+
+# parse BTL2/BTL3 lines
+def get_btl_star_info(line, beg_str): 
+    fields = btl_star_fields.get(beg_str)
+    if (fields is None):
+        fields = field_extractor([(beg_str, ",")] + [(" ", ",")] * 8 + [(" ", None)])
+        btl_star_fields[beg_str] = fields
+
+    last_bgc_size_str, start_flr_str, sweep_flr_str, end_flr_str, gen_increase_flr_str, bgc_surv_rate_str, actual_gen1_to_trigger_str, gen1_since_last_str, actual_alloc_to_trigger_str, alloc_to_trigger_str = fields.extract(line)
+    last_bgc_size = int(last_bgc_size_str) 
+    current_bgc_start_flr = float(start_flr_str) 
+    current_bgc_sweep_flr = float(sweep_flr_str) 
+    current_bgc_end_flr = float(end_flr_str) 
+    gen_increase_flr = float(gen_increase_flr_str) 
+    bgc_surv_rate = float(bgc_surv_rate_str) 
+    actual_gen1_to_trigger = int(actual_gen1_to_trigger_str) 
+    gen1_since_last = int(gen1_since_last_str) 
+    actual_alloc_to_trigger = int(actual_alloc_to_trigger_str) 
+    alloc_to_trigger = int(alloc_to_trigger_str) 
+    
+    return last_bgc_size, current_bgc_start_flr, current_bgc_sweep_flr, current_bgc_end_flr, gen_increase_flr, bgc_surv_rate, actual_gen1_to_trigger, gen1_since_last, actual_alloc_to_trigger, alloc_to_trigger
+
+# this is out of date...
+def parse_path_and_fl(line):
+    end_fl = 0
+    fl_goal = 0
+    path_taken = 0
+    
+    if (line.find("unchanged(") != -1):
+        path_taken = PATH_UNCHANGED
+        end_fl_str, remaining_str = parse_str(line, "fl ", ",")
+        end_fl = int(end_fl_str)
+        fl_goal_str = parse_str_no_end(remaining_str, " ")
+        fl_goal = int(fl_goal_str)
+        
+    elif (line.find("path above - fl ") != -1):
+        path_taken = PATH_ABOVE
+        end_fl_str, remaining_str = parse_str(line, "fl ", " ")
+        end_fl = int(end_fl_str)
+        fl_goal_str = parse_str_no_end(remaining_str, ">= ")
+        fl_goal = int(fl_goal_str)
+        
+    elif (line.find("path below - fl ") != -1):
+        path_taken = PATH_BELOW
+        end_fl_str, remaining_str = parse_str(line, "fl ", " ")
+        end_fl = int(end_fl_str)
+        fl_goal_str = parse_str_no_end(remaining_str, "< ")
+        fl_goal = int(fl_goal_str)
+        fl_goal = int(float(fl_goal) / 0.9)
+    
+    return end_fl, fl_goal, path_taken
+
+# a line is "of kind i" when markers[i] is the first marker (in list order) that
+# appears anywhere in it - the same thing a chain of
+#     if (line.find(markers[0]) != -1): ... elif (line.find(markers[1]) != -1): ...
+# decides, but with one scan of the line instead of one scan per marker tried.
+#
+# the scan is a single alternation regex where at any position the longest
+# marker wins. A found marker implies every marker that is a
+# substring of it is also in the line. The only markers a scan can miss are the
+# ones that start inside a found marker and run past it (eg, ", P: " after
+# "bytes in alloc, ") so those are still checked with "in" when they'd beat what
+# the scan found.
+LINE_KIND_NONE = -1
+
+class line_classifier():
+    def __init__(self, markers):
+        self.markers = list(markers)
+        num_markers = len(self.markers)
+        self.kind_of_marker = {}
+        for i in range(num_markers - 1, -1, -1):
+            self.kind_of_marker[self.markers[i]] = i
+
+        # the lowest kind implied by finding each marker
+        self.implied_kind = {}
+        for marker in self.kind_of_marker:
+            self.implied_kind[marker] = min(i for i in range(num_markers) if self.markers[i] in marker)
+
+        # the kinds that could start inside each marker and run past its end - a scan
+        # that found the marker would have skipped over them. Only the ones that'd
+        # beat what the marker implies are worth checking.
+        self.overlapping_markers = {}
+        for marker in self.kind_of_marker:
+            self.overlapping_markers[marker] = [(i, self.markers[i]) for i in range(self.implied_kind[marker])
+                if ((self.kind_of_marker[self.markers[i]] == i) and markers_overlap(marker, self.markers[i]))]
+
+        self.regex = re.compile(markers_pattern(self.kind_of_marker))
+        # for classifying lines in the raw bytes of a log, see iter_classified_lines_mmap
+        self.marker_bytes_regexes = [re.compile(re.escape(marker.encode("ascii"))) for marker in self.markers]
+
+    def classify(self, line):
+        found = self.regex.findall(line)
+        if (not found):
+            return LINE_KIND_NONE
+
+        implied_kind = self.implied_kind
+        overlapping_markers = self.overlapping_markers
+
+        # by far the most common case
+        if (len(found) == 1):
+            marker = found[0]
+            for overlapping_kind, overlapping_marker in overlapping_markers[marker]:
+                if (overlapping_marker in line):
+                    return overlapping_kind
+            return implied_kind[marker]
+
+        kind = min(implied_kind[marker] for marker in found)
+        for marker in found:
+            for overlapping_kind, overlapping_marker in overlapping_markers[marker]:
+                if (overlapping_kind >= kind):
+                    break
+                if (overlapping_marker in line):
+                    kind = overlapping_kind
+                    break
+        return kind
+
+# the alternation is built as a trie so markers sharing a prefix (all the "BTL"s)
+# are only tried once per position. The markers that can match at a position are
+# all on one path of the trie and the optional tails are greedy so the longest
+# one wins.
+def markers_pattern(markers):
+    trie = {}
+    for marker in markers:
+        node = trie
+        for c in marker:
+            node = node.setdefault(c, {})
+        node[""] = {}
+    return trie_pattern(trie)
+
+def trie_pattern(node):
+    branches = [re.escape(c) + trie_pattern(child) for c, child in sorted(node.items()) if (c != "")]
+    if (len(branches) == 0):
+        return ""
+    if ((len(branches) == 1) and ("" not in node)):
+        return branches[0]
+    pattern = "(?:" + "|".join(branches) + ")"
+    if ("" in node):
+        pattern += "?"
+    return pattern
+
+# true if a suffix of "first" is a prefix of "second" (but neither contains the other)
+def markers_overlap(first, second):
+    for overlap_len in range(1, min(len(first), len(second))):
+        if (first[-overlap_len:] == second[:overlap_len]):
+            return True
+    return False
@@ -0,0 +1,40 @@
+import concurrent.futures
+import contextlib
+import io
+import os
+import sys
+
+from . import cache
+
+# what a worker runs - function(*args) and what it printed
+def run_capturing_output(function, *args):
+    printed = io.StringIO()
+    with contextlib.redirect_stdout(printed):
+        result = function(*args)
+    return result, printed.getvalue()
+
+# parsing multiple logs at once, each in its own process. Returns {file_name: result}
+# where result is what process_function(file_name) returns. What each one prints is
+# printed in the order of file_names. process_function has to be a module level
+# function so it can be sent to the workers. The workers get the parent's parse
+# cache settings (eg the cache turned off) whichever way they're started.
+def process_files_in_parallel(process_function, file_names, num_workers=None):
+    file_names = list(dict.fromkeys(file_names))
+    if (num_workers is None):
+        num_workers = os.cpu_count()
+    num_workers = min(num_workers, len(file_names))
+
+    results = {}
+    if (num_workers <= 1):
+        for file_name in file_names:
+            results[file_name] = process_function(file_name)
+        return results
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=num_workers,
+            initializer=cache.set_parse_cache_settings, initargs=cache.get_parse_cache_settings()) as executor:
+        futures = [executor.submit(run_capturing_output, process_function, file_name) for file_name in file_names]
+        for file_name, future in zip(file_names, futures):
+            result, printed = future.result()
+            sys.stdout.write(printed)
+            results[file_name] = result
+    return results
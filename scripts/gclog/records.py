@@ -0,0 +1,180 @@
+import collections
+
+import numpy as np
+
+# per GC records are kept column by column in numpy arrays (see gc_record_store)
+# instead of as one python object per GC - with 300k GCs the objects alone were
+# GBs. The record types are named tuples so code that wants a single GC still does
+# info[i].gen_index; the field lists also say what dtype each column is stored as.
+#
+# elapsed_since_last_s is the seconds between last bgc end and this bgc start
+# elapsed_ms is the ms between this bgc start and end
+# gen2_actual_gen1_to_trigger is the # of gen1s between this bgc start and last bgc end, same as gen3_actual_gen1_to_trigger
+bgc_tuning_data_fields = [
+    ("gen_index", np.int64),
+    ("reason", np.int64),
+    ("gen2_panic_ca_plugs_size", np.int64),
+    ("gen2_panic_ca_plugs_count", np.int64),
+    ("gen2_panic_alloc", np.int64),
+    ("gen2_panic_fl", np.int64),
+    ("elapsed_since_last_s", np.int64),
+    ("elapsed_ms", np.int64),
+    ("alloc_gen0", np.int64),
+    ("alloc_gen3", np.int64),
+    ("beg_ml", np.int64),
+    ("end_ml", np.int64),
+    # end_heap_size is the physical heap size.
+    ("beg_heap_size", np.int64),
+    ("beg_commit_size", np.int64),
+    ("beg_ws_size", np.int64),
+    ("end_heap_size", np.int64),
+    ("end_commit_size", np.int64),
+    ("end_ws_size", np.int64),
+    ("gen2_last_bgc_size", np.int64),
+    ("gen2_current_bgc_start_flr", np.float64),
+    ("gen2_current_bgc_sweep_flr", np.float64),
+    ("gen2_current_bgc_physical_sweep_flr", np.float64),
+    ("gen2_current_bgc_end_flr", np.float64),
+    ("gen2_gen_increase_flr", np.float64),
+    ("gen2_bgc_surv_rate", np.float64),
+    ("gen2_actual_gen1_to_trigger", np.int64),
+    ("gen2_gen1_since_last", np.int64),
+    ("gen2_actual_alloc_to_trigger", np.int64),
+    ("gen2_alloc_to_trigger", np.int64),
+    ("gen3_last_bgc_size", np.int64),
+    ("gen3_current_bgc_start_flr", np.float64),
+    ("gen3_current_bgc_sweep_flr", np.float64),
+    ("gen3_current_bgc_physical_sweep_flr", np.float64),
+    ("gen3_current_bgc_end_flr", np.float64),
+    ("gen3_gen_increase_flr", np.float64),
+    ("gen3_bgc_surv_rate", np.float64),
+    ("gen3_actual_gen1_to_trigger", np.int64),
+    ("gen3_gen1_since_last", np.int64),
+    ("gen3_actual_alloc_to_trigger", np.int64),
+    ("gen3_alloc_to_trigger", np.int64),
+    ("in_use_physical_memory", np.float64),
+]
+
+bgc_tuning_data = collections.namedtuple("bgc_tuning_data",
+    [field_name for field_name, field_type in bgc_tuning_data_fields])
+
+PATH_ABOVE = 1
+PATH_BELOW = 2
+PATH_UNCHANGED = 3
+
+# ml_pi isn't passed in, it's always ml_kp + ml_ki
+bgc_detailed_tuning_data_fields = [
+    ("ml_kp", np.int64),
+    ("ml_ki", np.int64),
+    ("pi", np.int64),
+    ("gen2_alloc_kp", np.int64),
+    ("gen2_alloc_ki", np.int64),
+    ("gen3_alloc_kp", np.int64),
+    ("gen3_alloc_ki", np.int64),
+    ("gen2_end_physical_size", np.int64),
+    ("gen2_end_vfl_size", np.int64),
+    ("gen3_end_physical_size", np.int64),
+    ("gen3_end_vfl_size", np.int64),
+    ("gen3_end_fl", np.int64),
+    ("gen3_fl_goal", np.int64),
+    ("gen3_path_taken", np.int64),
+    ("gen3_alloc_smoothed", np.int64),
+    ("gen3_alloc_ff", np.int64),
+    ("ml_pi", np.int64),
+]
+
+class bgc_detailed_tuning_data(collections.namedtuple("bgc_detailed_tuning_data",
+    [field_name for field_name, field_type in bgc_detailed_tuning_data_fields])):
+    __slots__ = ()
+    def __new__(cls, ml_kp, ml_ki, pi, gen2_alloc_kp, gen2_alloc_ki,  gen3_alloc_kp, gen3_alloc_ki, 
+                gen2_end_physical_size, gen2_end_vfl_size, gen3_end_physical_size, gen3_end_vfl_size,
+                gen3_end_fl, gen3_fl_goal, gen3_path_taken, gen3_alloc_smoothed, gen3_alloc_ff):
+        return super().__new__(cls, ml_kp, ml_ki, pi, gen2_alloc_kp, gen2_alloc_ki, gen3_alloc_kp, gen3_alloc_ki,
+                gen2_end_physical_size, gen2_end_vfl_size, gen3_end_physical_size, gen3_end_vfl_size,
+                gen3_end_fl, gen3_fl_goal, gen3_path_taken, gen3_alloc_smoothed, gen3_alloc_ff,
+                (ml_kp + ml_ki))
+
+# a growable table of records of one type, stored as a numpy structured array
+# with one column per field. Appending doubles the capacity when it runs out so
+# it's amortized O(1); column(field_name) is a view of the filled part, no copying.
+#
+# indexing/iterating gives back the record type so it can be used like the list
+# of records it replaced.
+class gc_record_store():
+    def __init__(self, record_type, fields, capacity=64):
+        self.record_type = record_type
+        self.dtype = np.dtype(fields)
+        self.data = np.zeros(capacity, dtype=self.dtype)
+        self.count = 0
+
+    def append(self, record):
+        if (self.count == len(self.data)):
+            grown_data = np.zeros(len(self.data) * 2, dtype=self.dtype)
+            grown_data[:self.count] = self.data
+            self.data = grown_data
+        self.data[self.count] = tuple(record)
+        self.count += 1
+
+    def column(self, field_name):
+        return self.data[field_name][:self.count]
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, index):
+        if (index < 0):
+            index += self.count
+        if ((index < 0) or (index >= self.count)):
+            raise IndexError("record index {0} out of range ({1} records)".format(index, self.count))
+        return self.record_type._make(self.data[index].tolist())
+
+    def __iter__(self):
+        for index in range(self.count):
+            yield self[index]
+
+# per GC bucket histograms, one row of total_num_buckets counts per GC, so
+# looking across GCs is a column op on rows() instead of a loop.
+# m[i][b] still gives you the count for bucket b of the i-th GC.
+class gc_bucket_matrix():
+    def __init__(self, num_buckets, capacity=64):
+        self.data = np.zeros((capacity, num_buckets), dtype=np.int64)
+        self.count = 0
+
+    def append(self, row):
+        if (self.count == len(self.data)):
+            grown_data = np.zeros((len(self.data) * 2, self.data.shape[1]), dtype=np.int64)
+            grown_data[:self.count] = self.data
+            self.data = grown_data
+        self.data[self.count] = row
+        self.count += 1
+
+    def rows(self):
+        return self.data[:self.count]
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, index):
+        if (index < 0):
+            index += self.count
+        if ((index < 0) or (index >= self.count)):
+            raise IndexError("GC index {0} out of range ({1} GCs)".format(index, self.count))
+        return self.data[index]
+
+# num_elements is how many elements you want to get from the src array starting at start_index
+# if max_num_elements is > num_elements, the rest is NaN (which the charts leave out
+# like they did the Nones this used to pad with).
+#
+# for a gc_record_store that needs no padding this is a view of the column, nothing
+# is copied; padding has to make a float copy since ints can't be NaN.
+def get_fields(src, field_name, start_index, num_elements, max_num_elements):
+    if (isinstance(src, gc_record_store)):
+        field_data = src.column(field_name)[start_index:(start_index + num_elements)]
+    else:
+        field_data = np.array([getattr(record, field_name) for record in src[start_index:(start_index + num_elements)]],
+            dtype=np.float64)
+    if (len(field_data) == max_num_elements):
+        return field_data
+    padded_field_data = np.full(max_num_elements, np.nan)
+    padded_field_data[:len(field_data)] = field_data[:max_num_elements]
+    return padded_field_data
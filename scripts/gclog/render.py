@@ -0,0 +1,98 @@
+# drawing the chart cells without a display. Each panel (what used to be one
+# subplot of the big figure) gets its own figure on the Agg backend and is written
+# to png/svg files, the panels in parallel in worker processes.
+#
+# a chart cell goes through chart_panels either way so the same cell draws inline
+# like before when there's no out_dir.
+import concurrent.futures
+import os
+
+# has to be called before pyplot is imported for the first time in a process
+def use_headless_backend():
+    import matplotlib
+    matplotlib.use("Agg")
+
+# panel is (file name without the extension, [(chart_function, args, kwargs), ...]),
+# the chart functions are called on the panel's axes in order. They have to be module
+# level functions so they can be sent to the workers.
+def render_panel(panel, out_dir, formats, figsize, dpi):
+    use_headless_backend()
+    import matplotlib.pyplot as plt
+
+    panel_name, chart_calls = panel
+    fig = plt.figure(figsize=figsize, dpi=dpi)
+    panel_plt = fig.add_subplot(1, 1, 1)
+    for chart_function, args, kwargs in chart_calls:
+        chart_function(panel_plt, *args, **kwargs)
+
+    file_names = []
+    for file_format in formats:
+        file_name = os.path.join(out_dir, "{0}.{1}".format(panel_name, file_format))
+        fig.savefig(file_name, format=file_format, bbox_inches="tight")
+        file_names.append(file_name)
+    plt.close(fig)
+    return file_names
+
+def export_panels(panels, out_dir, formats=("png",), num_workers=None, figsize=(20, 4), dpi=100):
+    os.makedirs(out_dir, exist_ok=True)
+    if (num_workers is None):
+        num_workers = os.cpu_count()
+    num_workers = min(num_workers, len(panels))
+
+    if (num_workers <= 1):
+        return [file_name for panel in panels
+            for file_name in render_panel(panel, out_dir, formats, figsize, dpi)]
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=num_workers) as executor:
+        futures = [executor.submit(render_panel, panel, out_dir, formats, figsize, dpi) for panel in panels]
+        return [file_name for future in futures for file_name in future.result()]
+
+# the panels of one chart cell. With no out_dir it's the figure with a subplot per
+# panel we always drew and draw() draws right away; with an out_dir draw() only
+# records what to draw and finish() writes each panel to its own file.
+class chart_panels():
+    def __init__(self, name, num_panels, out_dir=None, formats=("png",), num_workers=None,
+                 figsize=(20, 4), dpi=100):
+        self.name = name
+        self.num_panels = num_panels
+        self.out_dir = out_dir
+        self.formats = formats
+        self.num_workers = num_workers
+        self.figsize = figsize
+        self.dpi = dpi
+        if (out_dir is None):
+            import matplotlib.pyplot as plt
+            fig = plt.figure()
+            self.subplots = [fig.add_subplot(num_panels, 1, (1 + panel_index))
+                for panel_index in range(0, num_panels)]
+        else:
+            self.chart_calls = [[] for panel_index in range(0, num_panels)]
+
+    def draw(self, panel_index, chart_function, *args, **kwargs):
+        if (self.out_dir is None):
+            chart_function(self.subplots[panel_index], *args, **kwargs)
+        else:
+            self.chart_calls[panel_index].append((chart_function, args, kwargs))
+
+    def finish(self):
+        if (self.out_dir is None):
+            return []
+        panels = [("{0}-{1}".format(self.name, panel_index), chart_calls)
+            for panel_index, chart_calls in enumerate(self.chart_calls) if (len(chart_calls) > 0)]
+        file_names = export_panels(panels, self.out_dir, self.formats, self.num_workers,
+            self.figsize, self.dpi)
+        print("wrote {0} panels of {1} to {2}".format(len(panels), self.name, self.out_dir))
+        return file_names
+
+# for the cells that draw on the subplots themselves, the whole figure in one file
+def save_figure(fig, name, out_dir, formats=("png",)):
+    os.makedirs(out_dir, exist_ok=True)
+    import matplotlib.pyplot as plt
+    file_names = []
+    for file_format in formats:
+        file_name = os.path.join(out_dir, "{0}.{1}".format(name, file_format))
+        fig.savefig(file_name, format=file_format, bbox_inches="tight")
+        file_names.append(file_name)
+    plt.close(fig)
+    print("wrote {0} to {1}".format(name, out_dir))
+    return file_names
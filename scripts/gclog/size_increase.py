@@ -0,0 +1,662 @@
+# the size_increase logs - per GC how gen2 grew and what gen1 promoted into it, bucketed
+# by size (see buckets.py for the bucket schemes).
+import collections
+import math
+
+import numpy as np
+
+from .records import gc_bucket_matrix, gc_record_store
+from .lines import LINE_KIND_NONE, line_classifier, parse_str, fla_fields, elapsed_fields, gen1_pow2_bucket_fields, gen1_pow2_bucket_tb_fields, gen1_size_bucket_fields, gen1_size_bucket_tb_fields
+from .buckets import bucket_schemes, detect_bucket_scheme
+from .cache import cached_parse
+from .gcindex import get_gc_range_offsets, iter_lines_in_range
+
+gen2_increase_data_fields = [
+    ("gen_index", np.int64),
+    ("gen_num", np.int64), # 1 or 2
+    ("bgc_state", np.int64),
+    # this is a ratio (not an int) when it comes from the [END][g2] line
+    ("gen2_fl_ratio", np.float64),
+    ("gen2_fl_size", np.int64),
+    ("gen2_size_increase", np.int64),
+    ("gen1_plugs_tried_in_gen2", np.int64),
+    ("gen2_fl_allocated", np.int64),
+    ("gen2_es_allocated", np.int64),
+    ("gen2_c_allocated", np.int64),
+    ("gen1_plan_ns", np.int64),
+    ("soh_allocated_mb_so_far", np.int64),
+    ("elapsed_s", np.int64),
+]
+
+gen2_increase_data = collections.namedtuple("gen2_increase_data",
+    [field_name for field_name, field_type in gen2_increase_data_fields])
+
+# for every eph GC we fill in this.
+# for gen1 GCs, it has 2 gen0 surv lines, we just take the 2nd line
+eph_surv_data_fields = [
+    ("gen_index", np.int64),
+    ("gen_num", np.int64),
+    ("gen0_alloc", np.int64),
+    ("gen0_surv", np.int64),
+    # for gen0 GCs these are 0
+    ("gen1_alloc", np.int64),
+    ("gen1_surv", np.int64),
+]
+
+eph_surv_data = collections.namedtuple("eph_surv_data",
+    [field_name for field_name, field_type in eph_surv_data_fields])
+
+TYPE_NGC=0
+TYPE_FGC=1
+TYPE_FGC_BEFORE_BGC=2
+TYPE_BGC=3
+
+# the bucket layouts are in bucket_schemes, the parser takes the scheme to use.
+
+def clear_array(arr, num_elems):
+    for i in range (0, num_elems):
+        arr[i] = 0
+
+def convert_gen_type(type_str):
+    gen_type = TYPE_NGC
+    if (type_str == "FGC"):
+        gen_type = TYPE_FGC
+    elif (type_str == "BGC"):
+        gen_type = TYPE_BGC
+    return gen_type
+
+# buckets start with 2^8
+# buckets are either in power form or size
+# largest power we get is 2^20 so 20 is passed here
+# so if it's >= 128 we know it's a size
+def convert_bucket_index(bucket_str, scheme):
+    bucket_index = int(bucket_str)
+    if (bucket_index >= 128):
+        return scheme.size_indices.get(bucket_index)
+    else:
+        bucket_index = bucket_index - scheme.base_power
+        return bucket_index
+
+def convert_index_to_size(bucket_index, scheme):
+    if (scheme.size_in_pow_2_p == 0) :
+        return scheme.sizes[bucket_index]
+    else:
+        # when it's in 2^n format, b0 starts with 2^base_power
+        return math.pow(2, (bucket_index + scheme.base_power))
+
+# all the parser state for process_file_bgc_tuning_size_increase, both what we
+# hand back at the end and what's only kept for the current GC.
+class bgc_tuning_size_increase_state():
+    def __init__(self, scheme):
+        self.scheme = scheme
+        total_num_buckets = len(scheme.sizes)
+        self.total_num_buckets = total_num_buckets
+
+        self.gen2_size_increase_info = gc_record_store(gen2_increase_data, gen2_increase_data_fields)
+        self.eph_surv_info = gc_record_store(eph_surv_data, eph_surv_data_fields)
+
+        # the following info is by buckets per GC
+        self.gen2_free_spaces_info = gc_bucket_matrix(total_num_buckets)
+        self.gen2_free_spaces_consumed_info = gc_bucket_matrix(total_num_buckets)
+        self.gen1_objs_info = gc_bucket_matrix(total_num_buckets)
+        self.gen1_plugs_info = gc_bucket_matrix(total_num_buckets)
+        self.gen1_unfit_plugs_info = gc_bucket_matrix(total_num_buckets)
+        self.gen0_big_objects_info = gc_bucket_matrix(total_num_buckets)
+        self.gen2_tb_info = gc_bucket_matrix(total_num_buckets)
+
+        # pause info - NOTE I am only tracking eph GC pauses
+        # each element will be for such a GC
+        self.gen0_pause_ms_info = []
+        self.gen1_pause_ms_info = []
+        # the following 2 are duplicated in gen2_increase_data...
+        self.gen1_plan_ns_info = []
+        self.gen1_plugs_tried_in_gen2_info = []
+
+        # when we don't try at allocate in gen2 at all, it means
+        # we decided to not promote.
+        self.gen1_plugs_tried_in_gen2_per_gc = 0
+        self.gen1_plan_ns = 0
+        self.gen1_np_plan_ns_info = []
+        # currently not used
+        self.gen1_np_size_info = []
+
+        # this is for the whole log
+        self.total_gen0_plugs = [0 for i in range(total_num_buckets)]
+        self.total_gen0_objs = [0 for i in range(total_num_buckets)]
+        self.total_gen0_allocated_big_objs = [0 for i in range(total_num_buckets)]
+
+        # these are temp ones saved in each GC
+        self.gen2_free_spaces_per_gc = [0 for i in range(total_num_buckets)]
+        self.gen2_free_spaces_consumed_per_gc = [0 for i in range(total_num_buckets)]
+        self.gen1_objs_per_gc = [0 for i in range(total_num_buckets)]
+        self.gen1_plugs_per_gc = [0 for i in range(total_num_buckets)]
+        self.gen1_unfit_plugs_per_gc = [0 for i in range(total_num_buckets)]
+        # what got threaded back because they were too big for current alloc request
+        self.gen2_threaded_back_per_gc = [0 for i in range(total_num_buckets)]
+
+        # note the first few bucktes in this are always 0 by definition since we only record big ones
+        self.gen0_big_objects_per_gc = [0 for i in range(total_num_buckets)]
+        self.num_gen0_gcs = 0
+        self.num_gen1_gcs = 0
+        # the only data I am getting for gen2 is really just the free space info...
+        # but it's easier if we maintain this across gen1/2 GCs so they are in order naturally.
+        self.num_gen1_gen2_gcs = 0
+
+        self.gen2_fl_allocated_per_gc = 0
+        self.gen2_es_allocated_per_gc = 0
+        self.gen2_c_allocated_per_gc = 0
+
+        self.eph_alloc_per_gc = [0 for i in range(2)]
+        self.eph_surv_per_gc = [0 for i in range(2)]
+
+        self.gen_num = 0
+        self.gen_type = 0
+        self.bgc_state = 0
+        self.gen2_fl_size = 0
+        self.gen2_fl_ratio = 0
+        self.gen2_size_increase = 0
+        self.fgc_before_bgc = 0
+        self.eph_pause_ms = 0
+
+        self.found_start_p = 0
+        self.first_gc_index = 0
+        self.last_gc_index = 0
+
+        self.found_first_elapsed_p = 0
+        self.first_elapsed_min = 0
+        self.last_elapsed_min = 0
+        self.last_elapsed_s = 0
+
+        self.found_first_alloc_soh_p = 0
+        self.first_alloc_soh_mb = 0
+        self.last_alloc_soh_mb = 0
+
+        self.found_first_alloc_loh_p = 0
+        self.first_alloc_loh_mb = 0
+        self.last_alloc_loh_mb = 0
+
+# the beginng of GC line looks like this:
+# [12148]*GC* 15(gen0:14)(1)(NGC)(0)
+# [12148]*GC* 14(gen0:13)(0)(FGC)(3)
+# [12148]*GC* 13(gen0:12)(2)(BGC)(0)
+# (gen)(type of GC)(bgc state)
+#
+# it's actually not necessary to parse this line...
+def size_increase_handle_gc_start(state, line):
+    # some of these are unnecessary to get at GC start...
+    state.fgc_before_bgc = 0
+    state.gen2_size_increase = 0
+
+    gen_index_str, remaining_str = parse_str(line, "* ", "(")
+    gen_index = int(gen_index_str)
+
+    if (state.found_start_p == 0):
+        state.first_gc_index = gen_index
+        state.found_start_p = 1
+
+    state.last_gc_index = gen_index
+
+    gen_num_str, remaining_str = parse_str(remaining_str, ")(", ")")
+    state.gen_num = int(gen_num_str)
+
+    if (state.gen_num == 0):
+        return
+
+    gen_type_str, remaining_str = parse_str(remaining_str, ")(", ")")
+    #gen_type = convert_gen_type(gen_type_str)
+    bgc_state_str, remaining_str = parse_str(remaining_str, ")(", ")")
+    state.bgc_state = int(bgc_state_str)
+
+    # print("GC#{0}: {1}, bgc state {2}".format(gen_index, state.gen_num, state.bgc_state))
+
+def size_increase_handle_gen1_before_bgc(state, line):
+    state.fgc_before_bgc = 1
+
+# only gen1's that increased gen2 size print out this line
+#
+# [31608]g2+ 24->21158960(21158936), esa: 0, ca: 1667104 (diff: 19491832)
+# means
+# g2+ last_size->current_size(increased), end of seg alloc, condemned alloc (inceased - esc - ca)
+def size_increase_handle_gen2_increase(state, line):
+    gen2_size_increase_str, remaining_str = parse_str(line, "(", ")")
+    state.gen2_size_increase = int(gen2_size_increase_str)
+
+# every gen1 prints out this line
+# [21832]fla: 326136 (1208 fo rej), esa: 0, ca: 1297224, fl: 71967968(40%), fo: 819512, g1 ca: 524648
+def size_increase_handle_fla(state, line):
+    gen2_fl_allocated_str, gen2_es_allocated_str, gen2_c_allocated_str, gen2_fl_size_str, gen2_fl_ratio_str = fla_fields.extract(line)
+    state.gen2_fl_allocated_per_gc = int(gen2_fl_allocated_str)
+    state.gen2_es_allocated_per_gc = int(gen2_es_allocated_str)
+    state.gen2_c_allocated_per_gc = int(gen2_c_allocated_str)
+    state.gen2_fl_size = int(gen2_fl_size_str)
+    state.gen2_fl_ratio = int(gen2_fl_ratio_str)
+
+# use this line to find out the fl ratio of gen2 after a BGC
+# [102864][END][g2]g2:, s: 10464744, frag: 279360(L: 135208, O: 144152), f: 2% (S)   P
+def size_increase_handle_gen2_end(state, line):
+    gen2_size_str, remaining_str = parse_str(line, "s: ", ",")
+    gen2_size = int(gen2_size_str)
+    gen2_fl_size_str, remaining_str = parse_str(line, "L: ", ",")
+    state.gen2_fl_size = int(gen2_fl_size_str)
+    state.gen2_fl_ratio = state.gen2_fl_size * 100 / gen2_size
+
+# pass gen0 info
+# [16132][h0][#44642]: 2^10: 0O: 1, 0B: 0, 0P: 6
+# 0O and 0P recorded during plan
+# 0O is recorded during allocation, when we see an alloc larger than alloc quantum
+def size_increase_handle_gen0_buckets(state, line):
+    if (line.find("2^") != -1):
+        bucket_str, remaining_str = parse_str(line, "2^", ":")
+    else:
+        bucket_str, remaining_str = parse_str(line, "]: ", ":")
+
+    b = convert_bucket_index(bucket_str, state.scheme)
+
+    # print("{0}: b: {1}".format (line, b))
+
+    num_gen0_objs_str, remaining_str = parse_str(remaining_str, "0O: ", ",")
+    num_gen0_objs = int(num_gen0_objs_str)
+    state.total_gen0_objs[b] = state.total_gen0_objs[b] + num_gen0_objs
+
+    num_gen0_allocated_big_objs_str, remaining_str = parse_str(remaining_str, "0B: ", ",")
+    num_gen0_allocated_big_objs = int(num_gen0_allocated_big_objs_str)
+    state.total_gen0_allocated_big_objs[b] = state.total_gen0_allocated_big_objs[b] + num_gen0_allocated_big_objs
+
+    num_gen0_plugs_str, remaining_str = parse_str(remaining_str, "0P: ", ",")
+    num_gen0_plugs = int(num_gen0_plugs_str)
+    state.total_gen0_plugs[b] = state.total_gen0_plugs[b] + num_gen0_plugs
+
+# now parsing the buckets
+# [ 1144][h0][#54778]: 2^11: F: 19782->19762(20), u: 531(553), O: 9, P: 531, g0P: 0
+# now it looks like this:
+# [25160][h0][#7986]: 2^13: F: 1152->1132(20), u: 0(0), O: 11, P: 9, TB: 6
+# or this
+# [24648][h0] 128: F: 29348->29380(-32), u: 0(0), O: 1257, P: 14, TB: 0
+def size_increase_handle_gen1_buckets(state, line):
+    tb_p = (line.find("TB: ") != -1)
+    if (line.find("2^") != -1):
+        fields = gen1_pow2_bucket_tb_fields if tb_p else gen1_pow2_bucket_fields
+    else:
+        fields = gen1_size_bucket_tb_fields if tb_p else gen1_size_bucket_fields
+
+    bucket_fields = fields.extract(line)
+    bucket_str, num_gen2_free_spaces_str, gen2_free_spaces_consumed_str, num_gen1_unfit_plugs_str, num_gen1_objs_str, num_gen1_plugs_str = bucket_fields[:6]
+
+    b = convert_bucket_index(bucket_str, state.scheme)
+
+    # print("{0}: b: {1}".format(line, b))
+
+    num_gen2_free_spaces = int(num_gen2_free_spaces_str)
+    state.gen2_free_spaces_per_gc[b] = num_gen2_free_spaces
+
+    gen2_free_spaces_consumed = int(gen2_free_spaces_consumed_str)
+    state.gen2_free_spaces_consumed_per_gc[b] = gen2_free_spaces_consumed
+
+    num_gen1_unfit_plugs = int(num_gen1_unfit_plugs_str)
+    state.gen1_unfit_plugs_per_gc[b] = num_gen1_unfit_plugs
+
+    num_gen1_objs = int (num_gen1_objs_str)
+    state.gen1_objs_per_gc[b] = num_gen1_objs
+
+    num_gen1_plugs = int (num_gen1_plugs_str)
+    state.gen1_plugs_per_gc[b] = num_gen1_plugs
+
+    bucket_size = int (bucket_str)
+    if (bucket_size < 128):
+        bucket_size = convert_index_to_size(bucket_size - state.scheme.base_power, state.scheme)
+
+    # if ((gen2_free_spaces_consumed > 0) or (num_gen1_plugs > 0)):
+    #     print("free space consumed: {0} x {1} = {2}, plugs: {3} x {1} = {4}".format(
+    #         gen2_free_spaces_consumed,
+    #         bucket_size,
+    #         (gen2_free_spaces_consumed * bucket_size),
+    #         num_gen1_plugs,
+    #         (num_gen1_plugs * bucket_size)))
+
+    # if (line.find("g0P:") != -1):
+    #     num_gen0_big_objects_str = parse_str_no_end(remaining_str, "g0P: ")
+    #     num_gen0_big_objects = int (num_gen0_big_objects_str)
+    #     state.gen0_big_objects_per_gc[b] = num_gen0_big_objects
+
+    if (tb_p):
+        num_tb = int (bucket_fields[6])
+        state.gen2_threaded_back_per_gc[b] = num_tb
+
+    # print("b{0} size: {1}: F: {2}, consumed F: {3}, P: {4}, TB: {5}".format(
+    #         b, bucket_str,
+    #         state.gen2_free_spaces_per_gc[b],
+    #         state.gen2_free_spaces_consumed_per_gc[b],
+    #         state.gen1_plugs_per_gc[b],
+    #         state.gen2_threaded_back_per_gc[b]))
+
+# [23400]GC#29051(1196,61)(gen1) took 7ms(elapsed: 435028308, 5196s, 86min) (alloc: 178796mb, 322mb)
+# NOTE this line is before *EGC* so we'll decide then which array to add the pause time to.
+def size_increase_handle_elapsed(state, line):
+    eph_pause_ms_str, elapsed_s_str, elapsed_min_str, alloc_soh_str, alloc_loh_str = elapsed_fields.extract(line)
+    state.eph_pause_ms = int (eph_pause_ms_str)
+
+    state.last_elapsed_s = int (elapsed_s_str)
+
+    elapsed_min = int (elapsed_min_str)
+    if (state.found_first_elapsed_p == 0):
+        state.first_elapsed_min = elapsed_min
+        state.found_first_elapsed_p = 1
+    state.last_elapsed_min = elapsed_min
+
+    alloc_soh_mb = int(alloc_soh_str)
+    if (state.found_first_alloc_soh_p == 0):
+        state.first_alloc_soh_mb = alloc_soh_mb
+        state.found_first_alloc_soh_p = 1
+    state.last_alloc_soh_mb = alloc_soh_mb
+
+    alloc_loh_mb = int(alloc_loh_str)
+    if (state.found_first_alloc_loh_p == 0):
+        state.first_alloc_loh_mb = alloc_loh_mb
+        state.found_first_alloc_loh_p = 1
+    state.last_alloc_loh_mb = alloc_loh_mb
+
+# [45892]g2 fla effi: 99%, effi: 95% (0,0), 2304ns(802)
+def size_increase_handle_effi(state, line):
+    if (line.find("ns(") != -1):
+        gen1_plan_ns_str, remaining_str = parse_str(line, "), ", "ns")
+        state.gen1_plan_ns = int (gen1_plan_ns_str)
+        state.gen1_plan_ns_info.append(state.gen1_plan_ns)
+
+        gen1_plugs_str, remaining_str = parse_str(remaining_str, "(", ")")
+        state.gen1_plugs_tried_in_gen2_per_gc = int (gen1_plugs_str)
+        state.gen1_plugs_tried_in_gen2_info.append(state.gen1_plugs_tried_in_gen2_per_gc)
+
+        if (state.gen1_plugs_tried_in_gen2_per_gc == 0):
+            state.gen1_np_plan_ns_info.append(state.gen1_plan_ns)
+
+        # print("gen1 plan {0}ns".format(state.gen1_plan_ns))
+
+# [40496][END][g1]g1:, s: 245568, frag: 0(L: 0, O: 0), f: 0% (C)   NP
+# when we detect that we did not promote, we want to get how much gen1 survived
+def size_increase_handle_gen1_end(state, line):
+    if (state.gen1_plugs_tried_in_gen2_per_gc == 0):
+        gen1_size_str, remaining_str = parse_str(line, "s: ", ",")
+        gen1_size_np = int (gen1_size_str)
+
+        gen1_frag_str, remaining_str = parse_str(remaining_str, "frag: ", "(")
+        gen1_frag_np = int(gen1_frag_str)
+        gen1_surv_size_np = gen1_size_np - gen1_frag_np
+
+        state.gen1_np_size_info.append(gen1_surv_size_np)
+
+# [102864][Bsw][h0][BGC#13]gen2: 2^14: F: 0, P: 54
+def size_increase_handle_bgc_sweep_buckets(state, line):
+    if (line.find("2^") != -1):
+        bucket_str, remaining_str = parse_str(line, "2^", ":")
+    else:
+        bucket_str, remaining_str = parse_str(line, "] ", ":")
+    b = convert_bucket_index(bucket_str, state.scheme)
+
+    num_gen2_free_spaces_str, remaining_str = parse_str(remaining_str, "F: ", ",")
+    num_gen2_free_spaces = int(num_gen2_free_spaces_str)
+
+    # print("{0}: b {1}".format(line, b))
+
+    state.gen2_free_spaces_per_gc[b] = num_gen2_free_spaces
+
+    # print("2^{0}: F: {1}".format(
+    #         (b + 8),
+    #         state.gen2_free_spaces_per_gc[b]))
+
+def size_increase_handle_surv(state, line):
+    surv_gen_num = 0
+    if (line.find("g1") != -1):
+        surv_gen_num = 1
+
+    eph_surv_str, remaining_str = parse_str(line, "surv: ", " ")
+    state.eph_surv_per_gc[surv_gen_num] = int(eph_surv_str)
+
+    eph_alloc_str, remaining_str = parse_str(remaining_str, "alloc: ", " ")
+    state.eph_alloc_per_gc[surv_gen_num] = int(eph_alloc_str)
+
+#
+# [102864]*EGC* 13(gen0:14)(2)(BGC)
+# [31608]*EGC* 15(gen0:15)(1)(GC)
+def size_increase_handle_gc_end(state, line):
+    gen_end_index_str, remaining_str = parse_str(line, "*EGC* ", "(")
+    gen_end_index = int(gen_end_index_str)
+    gen_end_num_str, remaining_str = parse_str(remaining_str, ")(", ")")
+    gen_end_num = int(gen_end_num_str)
+
+    if (gen_end_num < 2):
+        state.eph_surv_info.append(eph_surv_data(
+                gen_end_index,
+                gen_end_num,
+                state.eph_alloc_per_gc[0],
+                state.eph_surv_per_gc[0],
+                state.eph_alloc_per_gc[1],
+                state.eph_surv_per_gc[1]))
+
+        # intentionally not clearing so we get a smoother line
+        # clear_array(state.eph_alloc_per_gc, 2)
+        # clear_array(state.eph_surv_per_gc, 2)
+
+    if (gen_end_num == 0):
+        state.gen0_pause_ms_info.append(state.eph_pause_ms)
+        state.num_gen0_gcs = state.num_gen0_gcs + 1
+        return
+
+    gen_end_type_str, remaining_str = parse_str(remaining_str, ")(", ")")
+    gen_end_type = convert_gen_type(gen_end_type_str)
+    if (gen_end_num == 1):
+        state.gen1_pause_ms_info.append(state.eph_pause_ms)
+        state.num_gen1_gcs = state.num_gen1_gcs + 1
+        if (state.fgc_before_bgc):
+            gen_end_type = TYPE_FGC_BEFORE_BGC
+
+    state.gen2_size_increase_info.append(gen2_increase_data(
+                        gen_end_index,
+                        gen_end_num,
+                        state.bgc_state,
+                        state.gen2_fl_ratio,
+                        state.gen2_fl_size,
+                        state.gen2_size_increase,
+                        state.gen1_plugs_tried_in_gen2_per_gc,
+                        state.gen2_fl_allocated_per_gc,
+                        state.gen2_es_allocated_per_gc,
+                        state.gen2_c_allocated_per_gc,
+                        state.gen1_plan_ns,
+                        state.last_alloc_soh_mb,
+                        state.last_elapsed_s))
+
+    # row num_gen1_gen2_gcs of each matrix is this GC
+    state.gen2_free_spaces_info.append(state.gen2_free_spaces_per_gc)
+    state.gen2_free_spaces_consumed_info.append(state.gen2_free_spaces_consumed_per_gc)
+    state.gen1_objs_info.append(state.gen1_objs_per_gc)
+    state.gen1_plugs_info.append(state.gen1_plugs_per_gc)
+    state.gen2_tb_info.append(state.gen2_threaded_back_per_gc)
+    state.gen1_unfit_plugs_info.append(state.gen1_unfit_plugs_per_gc)
+    state.gen0_big_objects_info.append(state.gen0_big_objects_per_gc)
+
+    # print("GC#{0} gen{1}, type {2}, fl size: {3}, fl ratio:{4}, size inc {5}".format(
+    #                     gen_end_index,
+    #                     gen_end_num,
+    #                     gen_end_type,
+    #                     state.gen2_fl_size,
+    #                     state.gen2_fl_ratio,
+    #                     state.gen2_size_increase))
+
+    # re-init
+    state.gen2_size_increase = 0
+    state.gen2_fl_ratio = 0
+    state.gen2_fl_size = 0
+    state.gen1_plugs_tried_in_gen2_per_gc = 0
+    state.gen1_plan_ns = 0
+    clear_array(state.gen2_free_spaces_per_gc, state.total_num_buckets)
+    clear_array(state.gen2_free_spaces_consumed_per_gc, state.total_num_buckets)
+    clear_array(state.gen1_objs_per_gc, state.total_num_buckets)
+    clear_array(state.gen1_plugs_per_gc, state.total_num_buckets)
+    clear_array(state.gen1_unfit_plugs_per_gc, state.total_num_buckets)
+    clear_array(state.gen0_big_objects_per_gc, state.total_num_buckets)
+    clear_array(state.gen2_threaded_back_per_gc, state.total_num_buckets)
+
+    state.num_gen1_gen2_gcs = state.num_gen1_gen2_gcs + 1
+
+# same as bgc_tuning_line_handlers, the first marker a line contains decides its handler.
+size_increase_line_handlers = [
+    ("*GC*", size_increase_handle_gc_start),
+    ("doing gen1 before doing a bgc", size_increase_handle_gen1_before_bgc),
+    ("g2+ ", size_increase_handle_gen2_increase),
+    ("]fla: ", size_increase_handle_fla),
+    ("][END][g2]g2:", size_increase_handle_gen2_end),
+    (", 0B: ", size_increase_handle_gen0_buckets),
+    (", u: ", size_increase_handle_gen1_buckets),
+    ("(elapsed: ", size_increase_handle_elapsed),
+    ("effi: ", size_increase_handle_effi),
+    ("[END][g1]g1:", size_increase_handle_gen1_end),
+    ("][Bsw][", size_increase_handle_bgc_sweep_buckets),
+    (" surv: ", size_increase_handle_surv),
+    ("*EGC*", size_increase_handle_gc_end),
+]
+
+size_increase_classifier = line_classifier([marker for marker, handler in size_increase_line_handlers])
+
+# we return 1 array that encapsulates info from both gen2 and gen1, charting functions can
+# choose to form new arrays if they want to only display gen1 info
+#
+# if start_gc_index/end_gc_index are specified we seek straight to those GCs with the
+# GC index and only parse them. Everything (including the totals) is then only for
+# the GCs in the range.
+# scheme is the bucket_scheme the log uses, we figure it out from the bucket lines if
+# you don't give us one.
+def parse_file_bgc_tuning_size_increase (file_name, start_gc_index=None, end_gc_index=None, scheme=None):
+    if (scheme is None):
+        scheme = detect_bucket_scheme(file_name)
+    state = bgc_tuning_size_increase_state(scheme)
+
+    classify = size_increase_classifier.classify
+    handlers = [handler for marker, handler in size_increase_line_handlers]
+
+    if ((start_gc_index is None) and (end_gc_index is None)):
+        with open(file_name, "r") as pause_file:
+            for line in pause_file:
+                kind = classify(line)
+                if (kind != LINE_KIND_NONE):
+                    handlers[kind](state, line)
+    else:
+        start_offset, end_offset = get_gc_range_offsets(file_name, start_gc_index, end_gc_index)
+        for line in iter_lines_in_range(file_name, start_offset, end_offset):
+            kind = classify(line)
+            if (kind != LINE_KIND_NONE):
+                handlers[kind](state, line)
+
+    num_gen0_gcs = state.num_gen0_gcs
+    num_gen1_gcs = state.num_gen1_gcs
+    gen0_pause_ms_info = state.gen0_pause_ms_info
+    gen1_pause_ms_info = state.gen1_pause_ms_info
+    gen1_plan_ns_info = state.gen1_plan_ns_info
+    gen1_plugs_tried_in_gen2_info = state.gen1_plugs_tried_in_gen2_info
+    gen1_np_plan_ns_info = state.gen1_np_plan_ns_info
+
+    total_gen0_pause_ms = 0
+    for gen0_index in range (0, num_gen0_gcs):
+        total_gen0_pause_ms = total_gen0_pause_ms + gen0_pause_ms_info[gen0_index]
+    
+    total_gen1_pause_ms = 0
+    total_gen1_plan_ns = 0
+    # plugs we tried to allocate in older
+    total_gen1_plugs_tried = 0
+
+    print("{0} gen0 pause info recorded, {1} gen1 pause info recorded".format(
+        len(gen0_pause_ms_info),
+        len(gen1_pause_ms_info)))
+
+    print("{0} gen1 plan recorded".format(len(gen1_plan_ns_info)))
+
+    for gen1_index in range (0, num_gen1_gcs):
+        total_gen1_pause_ms = total_gen1_pause_ms + gen1_pause_ms_info[gen1_index]
+        total_gen1_plan_ns = total_gen1_plan_ns + gen1_plan_ns_info[gen1_index]
+        total_gen1_plugs_tried = total_gen1_plugs_tried + gen1_plugs_tried_in_gen2_info[gen1_index]
+
+    total_eph_pause_ms = total_gen0_pause_ms + total_gen1_pause_ms
+
+    total_gen1_plan_ms = total_gen1_plan_ns / 1000
+
+    # usually we have more than 1ms worth of plan time...this is just for small testing logs
+    if (total_gen1_plan_ms == 0):
+        total_gen1_plan_ms = 1
+
+    total_elapsed_min = state.last_elapsed_min - state.first_elapsed_min
+    total_alloc_soh_mb = state.last_alloc_soh_mb - state.first_alloc_soh_mb
+    total_alloc_loh_mb = state.last_alloc_loh_mb - state.first_alloc_loh_mb
+    soh_mb_per_min = 0
+    loh_mb_per_min = 0
+
+    eph_pause_ratio = 0
+    if (total_elapsed_min != 0):
+        soh_mb_per_min = total_alloc_soh_mb / total_elapsed_min
+        loh_mb_per_min = total_alloc_loh_mb / total_elapsed_min
+        eph_pause_ratio = (total_eph_pause_ms / 10.0 / 60.0) / total_elapsed_min
+
+    print("GC#{0} - GC#{1} ({2} GCs total, {3}mins (eph pause: {4}min ({5:.2f}%), soh alloc: {6}mb({7}mb/min), loh alloc: {8}mb({9}mb/min))".format (
+        state.first_gc_index, state.last_gc_index, (state.last_gc_index - state.first_gc_index),
+        total_elapsed_min,
+        (total_eph_pause_ms / 1000 / 60),
+        eph_pause_ratio,
+        total_alloc_soh_mb,
+        soh_mb_per_min,
+        total_alloc_loh_mb,
+        loh_mb_per_min))
+
+    print("{0} gen0s {1}ms ({2}ms/gc), {3} gen1s {4}ms ({5}ms/gc) gen1 plan: {6}ms ({7:.2f}%), {8} plugs tried - {9} plugs/ms".format(
+        num_gen0_gcs, 
+        total_gen0_pause_ms, 
+        (0 if (num_gen0_gcs == 0) else (total_gen0_pause_ms / num_gen0_gcs)),
+        num_gen1_gcs,
+        total_gen1_pause_ms,
+        (0 if (num_gen1_gcs == 0) else (total_gen1_pause_ms / num_gen1_gcs)),
+        total_gen1_plan_ms,
+        (0 if (total_gen1_pause_ms == 0) else (total_gen1_plan_ms * 100 / total_gen1_pause_ms)),
+        total_gen1_plugs_tried, 
+        (0 if (total_gen1_plan_ms == 0) else (total_gen1_plugs_tried / total_gen1_plan_ms))))
+
+    total_gen1_np = len(gen1_np_plan_ns_info)
+    total_gen1_np_plan_ns = 0
+    for gen1_index in range (0, total_gen1_np):
+        total_gen1_np_plan_ns = total_gen1_np_plan_ns + gen1_np_plan_ns_info[gen1_index]
+    
+    total_gen1_np_plan_ms = total_gen1_np_plan_ns / 1000
+    total_gen1_p_plan_ms = total_gen1_plan_ms - total_gen1_np_plan_ms
+    print("{0} gen1 didn't promote ({1:.2f}% total gen1s), {2} ms in plan ({3:.2f}% total plan, in promoting gen1 {4} plugs/ms".format(
+        total_gen1_np, 
+        (0 if (num_gen1_gcs == 0) else (total_gen1_np * 100.0 / num_gen1_gcs)),
+        total_gen1_np_plan_ms, 
+        (total_gen1_np_plan_ms * 100.0 / total_gen1_plan_ms),
+        (0 if (total_gen1_p_plan_ms == 0) else (total_gen1_plugs_tried / total_gen1_p_plan_ms))))
+
+    return state.eph_surv_info, state.total_gen0_plugs, state.total_gen0_objs, state.total_gen0_allocated_big_objs, state.num_gen1_gen2_gcs, state.gen2_size_increase_info, state.gen2_free_spaces_info, state.gen2_free_spaces_consumed_info, state.gen1_objs_info, state.gen1_plugs_info, state.gen1_unfit_plugs_info, state.gen0_big_objects_info, state.gen2_tb_info
+
+size_increase_record_types = [eph_surv_data, None, None, None, None, gen2_increase_data, None, None, None, None, None, None, None]
+
+# the parse when we have to figure out the scheme, the scheme's name goes at the end
+# so it's cached with the rest
+def parse_file_bgc_tuning_size_increase_detecting_scheme (file_name, start_gc_index=None, end_gc_index=None):
+    scheme = detect_bucket_scheme(file_name)
+    return parse_file_bgc_tuning_size_increase(file_name, start_gc_index, end_gc_index, scheme) + (scheme.name,)
+
+# with no scheme it's only detected when the log isn't in the cache - detecting can
+# read the whole log (when it has no bucket lines) so doing it on every call would
+# make a cache hit as slow as a parse. return_scheme also returns the scheme the
+# results are in, (results, scheme), for when you need the bucket sizes.
+def process_file_bgc_tuning_size_increase (file_name, start_gc_index=None, end_gc_index=None, scheme=None, return_scheme=False):
+    if (scheme is None):
+        result = cached_parse(file_name, "size-increase",
+            lambda file_name: parse_file_bgc_tuning_size_increase_detecting_scheme(file_name, start_gc_index, end_gc_index),
+            size_increase_record_types + [None], repr(("detected", start_gc_index, end_gc_index)))
+        scheme = bucket_schemes[result[-1]]
+        result = result[:-1]
+    else:
+        # the results depend on the buckets so they are part of the key
+        bucket_config = (scheme.name, scheme.sizes, scheme.base_power, scheme.size_in_pow_2_p)
+        result = cached_parse(file_name, "size-increase",
+            lambda file_name: parse_file_bgc_tuning_size_increase(file_name, start_gc_index, end_gc_index, scheme),
+            size_increase_record_types, repr((bucket_config, start_gc_index, end_gc_index)))
+
+    if (return_scheme):
+        return result, scheme
+    return result
@@ -0,0 +1,187 @@
+# writing made up logs in the formats the parsers read, so the parsers can be run
+# (and timed, see tests/test_bench_gclog.py) without the real logs. The same
+# arguments always give the same log. The values are random but every line the parsers look at is
+# there in the order the runtime writes it, with a few lines in between per GC that
+# they have to skip.
+import random
+
+from .buckets import bucket_schemes
+
+# the bgc tuning logs - a few eph GCs then a BGC with its BTL lines, num_bgcs times
+def write_bgc_tuning_log(file_name, num_bgcs, seed=1, num_noise_lines=3):
+    r = random.Random(seed)
+    gc_index = 100
+    elapsed_min = 1.0
+    with open(file_name, "w") as log_file:
+        write = log_file.write
+        write("[ 1]BTL tuning parameters: mem goal: 70(70), sweep flr goal: 20.0, ml: kp 1.0, ki 0.016\n")
+        for bgc_index in range(0, num_bgcs):
+            for i in range(0, r.randint(2, 5)):
+                gen_num = r.choice([0, 0, 1])
+                write("[ 8388]*GC* {0}(gen0:{1})({2})(NGC)({3})(g0: {4})(g3: {5})fla(2: 24004-5427, 3: 1914)esa3: 339211512\n".format(
+                    gc_index, gc_index - 1, gen_num, r.randint(0, 3), r.randint(1, 900), r.randint(1, 3000)))
+                for noise_index in range(0, num_noise_lines):
+                    write("[ 8388]h0 noise line {0} with nothing interesting (x) y z\n".format(r.randint(0, 10**6)))
+                write("[ 8388]*EGC* {0}(gen0:{0})({1})(NGC)(C)(P)(ml: 40->41)\n".format(gc_index, gen_num))
+                gc_index += 1
+
+            if (r.random() < 0.2):
+                write("[ 8388]*GC* {0}(gen0:{0})(0)(FGC)(3)(g0: 5)(g3: 6)fla(2: 1-1, 3: 1)esa3: 1\n".format(gc_index))
+                gc_index += 1
+
+            # an NGC2 - a blocking gen2 with its own BTL line
+            if (r.random() < 0.2):
+                write("[ 1]h0 init: 0(9)\n")
+                write("[ 1]h0 ml: {0}\n".format(r.randint(1, 99)))
+                write("[ 8388]*GC* {0}(gen0:{1})(2)(NGC)(0)(g0: {2})(g3: {3})fla(2: 1-1, 3: 1)esa3: 1\n".format(
+                    gc_index, gc_index - 1, r.randint(1, 900), r.randint(1, 3000)))
+                write(get_btl_ml_line(r, "(NGC2)"))
+                write("[ 8388]*EGC* {0}(gen0:{0})(2)(NGC)(C)(P)(ml: 0->{1})\n".format(gc_index, r.randint(1, 99)))
+                gc_index += 1
+
+            write("[ 8396]*GC* {0}(gen0:{1})(0)(NGC)(1)(g0: 726)(g3: 2234)fla(2: 1-1, 3: 1)esa3: 1\n".format(gc_index, gc_index - 1))
+            write("[ 8396]doing gen0 before doing a bgc\n")
+            write("[ 8396]*EGC* {0}(gen0:{0})(0)(NGC)(C)(P)(ml: 40->41)\n".format(gc_index))
+            gc_index += 1
+
+            write("[ 8388]*GC* {0}(gen0:{1})(2)(BGC)(0)(g0: {2})(g3: {3})fla(2: 24004-5427, 3: 1914)esa3: 339211512\n".format(
+                gc_index, gc_index - 1, r.randint(1, 900), r.randint(1, 3000)))
+            write("[ 1]BTL: g2t[st]: {0:.3f} min\n".format(elapsed_min))
+            elapsed_min += r.random()
+            write(r.choice(["[ 1]stepping trigger: yes\n", "[ 1]BTLc: gen2 panic trigger!!!\n",
+                "[ 1]BTLc: gen3 panic trigger!!!\n", "[ 1]BTLc: gen2 below goal growth trigger!!!\n",
+                "[ 1]BTLc: gen3 below goal growth trigger!!!\n", ""]))
+            write("[ 1]BTLc: g2 plugs (1:2) {0}%, P: {1}({2})\n".format(r.choice([100, 85]), r.randint(0, 9), r.randint(0, 99999)))
+            if (r.random() < 0.3):
+                write("[ 1]BTLc: gen2 panic trigger in free ({0} - {1}) ->{2}, flr: {3:.3f}, x\n".format(
+                    r.randint(5000, 9000), r.randint(0, 4000), r.randint(1000, 99999), r.random() * 50))
+            if (r.random() < 0.1):
+                write("[ 1]BTLc: gen3 panic trigger in free (1 - 0) ->1, flr: 1.0, x\n")
+            write("[ 1]g2 [BEG] #{0} THS: {1} {2} {3}(645697536, 662626304)\n".format(
+                bgc_index, r.randint(10**8, 10**9), r.randint(10**8, 10**9), r.randint(10**8, 10**9)))
+            write("[ 3060]BTL2: sflr: 98.751%->91.115% (49168919753->49168919753, 48554626049->44800081185) (1:0-0/gen1) since start (afl: {0}, {1:.3f})\n".format(
+                r.randint(1, 10**10), r.random() * 100))
+            write("[ 3060]BTL3: sflr: 98.751%->91.115% (1->1, 1->1) (1:0-0/gen1) since start (afl: {0}, {1:.3f})\n".format(
+                r.randint(1, 10**10), r.random() * 100))
+            for gen_num in (2, 3):
+                write("[ 1]BTL{0}* {1}, {2:.3f}, {3:.3f}, {4:.3f}, {5:.3f}, {6:.3f}, {7}, {8}, {9}, {10}\n".format(
+                    gen_num, r.randint(10**6, 10**10), r.random() * 100, r.random() * 100, r.random() * 100,
+                    r.random() * 100, r.random() * 100, r.randint(0, 999), r.randint(0, 999),
+                    r.randint(0, 10**9), r.randint(0, 10**9)))
+                write("[ 1]BTL{0}: kp = {1} bytes in alloc, x\n".format(gen_num, r.randint(-10**6, 10**6)))
+                write("[ 1]BTL{0}: ki: +accu err {1}=x\n".format(gen_num, r.randint(-10**6, 10**6)))
+            write(r.choice(["[ 1]BTL3: path above - fl {0} >= {1}\n", "[ 1]BTL3: path below - fl {0} < {1}\n",
+                "[ 1]BTL3: unchanged(x) fl {0}, {1}\n"]).format(r.randint(0, 10**6), r.randint(0, 10**6)))
+            write("[ 1]BTL3 smoothed ->{0}\n".format(r.randint(0, 10**6)))
+            write("[ 1]BTL3 ff ->{0}\n".format(r.randint(0, 10**6)))
+            write("[ 1]BTL3[g3]: below goal, kp -> {0}\n".format(r.randint(0, 10**6)))
+            write("[ 1]BTL: reason: {0}, x\n".format(r.choice([12, 14, 15, 16])))
+            write(get_btl_ml_line(r, ""))
+            write("[ 9080]g(2) #{0} [END] THS: {1} {2} {3}\n".format(
+                bgc_index, r.randint(10**8, 10**9), r.randint(10**8, 10**9), r.randint(10**8, 10**9)))
+            write("[ 1]BTL: g2t[en]: {0:.3f} min\n".format(elapsed_min))
+            elapsed_min += r.random() * 3
+            write("[ 3816]*EGC* {0}(gen0:{0})(2)(BGC)(S)(P)(ml: {1}->{2})\n".format(gc_index, r.randint(1, 99), r.randint(1, 99)))
+            gc_index += 1
+
+def get_btl_ml_line(r, suffix):
+    return "[ 8388]BTL: ml: {0} (g: 60)(below), a: {1} (g: 6848602112, elg: {2}+{3}=5123182664, {4}+{5}=30698544, pi={6}), vfl: -5342047895={7}+{8}{9}\n".format(
+        r.randint(1, 99), r.randint(10**9, 10**10), r.randint(10**8, 10**10), r.randint(0, 10**6),
+        r.randint(10**6, 10**8), r.randint(0, 10**6), r.randint(-5, 5), r.randint(-10**9, 10**9),
+        r.randint(-10**9, 10**9), suffix)
+
+# the size_increase logs. scheme is how the buckets are logged - pow2 logs them as
+# 2^n, the others by size.
+def write_size_increase_log(file_name, num_gcs, scheme=None, seed=2, num_noise_lines=2):
+    if (scheme is None):
+        scheme = bucket_schemes["pow2"]
+    if (scheme.name == "pow2"):
+        bucket_labels = ["2^{0}".format(scheme.base_power + i) for i in range(0, len(scheme.sizes))]
+    else:
+        bucket_labels = [str(size) for size in scheme.sizes]
+
+    r = random.Random(seed)
+    gc_index = 1000
+    elapsed_s = 100
+    soh_alloc_mb = 1000
+    loh_alloc_mb = 10
+    with open(file_name, "w") as log_file:
+        write = log_file.write
+        for i in range(0, num_gcs):
+            gen_num = r.choice([0, 0, 1, 1, 2])
+            gc_type = "BGC" if (gen_num == 2) else r.choice(["NGC", "NGC", "FGC"])
+            write("[12148]*GC* {0}(gen0:{1})({2})({3})({4})\n".format(gc_index, gc_index - 1, gen_num, gc_type, r.randint(0, 3)))
+            for noise_index in range(0, num_noise_lines):
+                write("[12148]h0 noise line {0} with nothing interesting\n".format(r.randint(0, 10**6)))
+            if ((gen_num == 1) and (r.random() < 0.3)):
+                write("[12148]doing gen1 before doing a bgc\n")
+
+            if (gen_num >= 1):
+                if (r.random() < 0.3):
+                    write("[31608]g2+ 24->21158960({0}), esa: 0, ca: 1667104 (diff: 19491832)\n".format(r.randint(0, 10**7)))
+                write("[21832]fla: {0} (1208 fo rej), esa: {1}, ca: {2}, fl: {3}({4}%), fo: 819512, g1 ca: 524648\n".format(
+                    r.randint(0, 10**6), r.choice([0, 5]), r.choice([0, 12345]), r.randint(0, 10**8), r.randint(0, 99)))
+                for bucket_line_index in range(0, r.randint(1, 4)):
+                    bucket_label = r.choice(bucket_labels)
+                    if (scheme.name == "pow2"):
+                        write("[ 1144][h0][#{0}]: {1}: F: {2}->{3}({4}), u: {5}({6}), O: {7}, P: {8}, TB: {9}\n".format(
+                            gc_index, bucket_label, r.randint(0, 9999), r.randint(0, 9999), r.randint(0, 99),
+                            r.randint(0, 99), r.randint(0, 99), r.randint(0, 99), r.randint(0, 99), r.randint(0, 99)))
+                    else:
+                        write("[24648][h0] {0}: F: {1}->{2}({3}), u: {4}({5}), O: {6}, P: {7}, TB: {8}\n".format(
+                            bucket_label, r.randint(0, 9999), r.randint(0, 9999), r.randint(-50, 99),
+                            r.randint(0, 99), r.randint(0, 99), r.randint(0, 99), r.randint(0, 99), r.randint(0, 99)))
+                write("[45892]g2 fla effi: 99%, effi: 95% (0,0), {0}ns({1})\n".format(
+                    r.randint(100, 5000), r.choice([0, r.randint(1, 900)])))
+                write("[40496][END][g1]g1:, s: {0}, frag: {1}(L: 0, O: 0), f: 0% (C)   NP\n".format(
+                    r.randint(10**5, 10**6), r.randint(0, 10**5)))
+
+            if (gen_num == 2):
+                write("[102864][END][g2]g2:, s: {0}, frag: 279360(L: {1}, O: 144152), f: 2% (S)   P\n".format(
+                    r.randint(10**7, 10**8), r.randint(0, 10**6)))
+                if (scheme.name == "pow2"):
+                    write("[102864][Bsw][h0][BGC#13]gen2: {0}: F: {1}, P: 54\n".format(r.choice(bucket_labels), r.randint(0, 999)))
+            if (scheme.name == "pow2"):
+                write("[16132][h0][#{0}]: {1}: 0O: {2}, 0B: {3}, 0P: {4}\n".format(
+                    gc_index, r.choice(bucket_labels), r.randint(0, 9), r.randint(0, 9), r.randint(0, 9)))
+
+            write("[1]h0 g0 surv: {0} alloc: {1} x\n".format(r.randint(0, 10**6), r.randint(0, 10**6)))
+            if (gen_num >= 1):
+                write("[1]h0 g1 surv: {0} alloc: {1} x\n".format(r.randint(0, 10**6), r.randint(0, 10**6)))
+            elapsed_s += r.randint(0, 2)
+            soh_alloc_mb += r.randint(0, 50)
+            loh_alloc_mb += r.randint(0, 2)
+            write("[23400]GC#{0}(1196,61)(gen{1}) took {2}ms(elapsed: 435028308, {3}s, {4}min) (alloc: {5}mb, {6}mb)\n".format(
+                gc_index, gen_num, r.randint(1, 30), elapsed_s, elapsed_s // 60, soh_alloc_mb, loh_alloc_mb))
+            write("[31608]*EGC* {0}(gen0:{0})({1})({2})\n".format(gc_index, gen_num, "BGC" if (gc_type == "BGC") else "GC"))
+            gc_index += 1
+
+# the gc1 logs - the recording buckets at the end of each BGC sweep and after some GCs
+def write_gc1_log(file_name, num_gcs, scheme=None, seed=3):
+    if (scheme is None):
+        scheme = bucket_schemes["recording105"]
+    r = random.Random(seed)
+    elapsed_s = 10
+    soh_alloc_mb = 100
+    loh_alloc_mb = 5
+    with open(file_name, "w") as log_file:
+        write = log_file.write
+        for gc_index in range(0, num_gcs):
+            if (r.random() < 0.05):
+                write("[35820]end of bgc sweep: x\n")
+                for bucket_line_index in range(0, r.randint(1, 6)):
+                    write("[35820]h0 {0}: 2F: {1}, 1P: {2})\n".format(r.choice(scheme.sizes), r.randint(0, 999), r.randint(0, 999)))
+                if (r.random() < 0.7):
+                    write("[35820]h0 g2 surv: {0} current: 316220432 alloc: 8514792 (96%) f: 180% new-size: 1 new-alloc: 2\n".format(
+                        r.randint(0, 10**9)))
+                if (r.random() < 0.7):
+                    write("[35820][END][g2]g2:, s: {0}, frag: 76920000(L: {1}, O: {2}), f: 19% (S)   P\n".format(
+                        r.randint(0, 10**9), r.randint(0, 10**8), r.randint(0, 10**7)))
+            if (r.random() < 0.2):
+                write("[35820]h0 {0}: 2F: {1}, 1P: {2})\n".format(r.choice(scheme.sizes), r.randint(0, 999), r.randint(0, 999)))
+            elapsed_s += r.randint(0, 2)
+            soh_alloc_mb += r.randint(0, 50)
+            loh_alloc_mb += r.randint(0, 2)
+            write("[73576]GC#{0}(1949,123)(gen0) took 3ms(elapsed: 1574564594, {1}s, {2}min) (alloc: {3}mb, {4}mb)\n".format(
+                gc_index, elapsed_s, elapsed_s // 60, soh_alloc_mb, loh_alloc_mb))
+            write("[73576]noise\n")
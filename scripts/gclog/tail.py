@@ -0,0 +1,31 @@
+import os
+
+from .gcindex import decode_log_line
+
+# a lot of what we want is at the end of a log (the last GC, the last few lines of a
+# lastbuf file) so these read a log backwards in chunks instead of reading all of it.
+# Lines come back the same as reading the file in text mode would give them.
+def iter_lines_reversed(file_name, chunk_size=64 * 1024):
+    with open(file_name, "rb") as log_file:
+        position = log_file.seek(0, os.SEEK_END)
+        remainder = b""
+        while (position > 0):
+            read_size = min(chunk_size, position)
+            position -= read_size
+            log_file.seek(position)
+            raw_lines = (log_file.read(read_size) + remainder).splitlines(keepends=True)
+            # the first line might be cut off so keep it till we've read the chunk before it
+            if (position > 0):
+                remainder = raw_lines[0]
+                raw_lines = raw_lines[1:]
+            for raw_line in reversed(raw_lines):
+                yield decode_log_line(raw_line)
+
+def read_last_lines(file_name, num_lines):
+    lines = []
+    for line in iter_lines_reversed(file_name):
+        if (len(lines) == num_lines):
+            break
+        lines.append(line)
+    lines.reverse()
+    return lines
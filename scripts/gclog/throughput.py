@@ -0,0 +1,46 @@
+from .lines import parse_str
+from .tail import read_last_lines
+
+# parse the last 3 lines of the lastbuf.txt
+# [13596][END][g0]g2:, s: 578459456, frag: 333606624(L: 331827616, O: 1779008), f: 57% (C)   P
+# [13596][END][g0]g1:, s: 221992, frag: 0(L: 0, O: 0), f: 0% (C)   P
+# [13596]*EGC* 283078(gen0:283078)(0)(GC)(0)(0)
+def process_throughput_size(lastbuf_file_name):
+    print("processing lastbuf file: {0}".format(lastbuf_file_name))
+    # we only need the last 4 lines
+    lines = read_last_lines(lastbuf_file_name, 4)
+    num_lines = len(lines)
+
+    elapsed_time_line = lines[num_lines-4]
+    soh_alloc_mb_str, remaining_str = parse_str (elapsed_time_line, "alloc: ", "mb")
+    soh_alloc_mb = int(soh_alloc_mb_str)
+
+    loh_alloc_mb_str, remaining_str = parse_str (remaining_str, " ", "mb")
+    loh_alloc_mb = int(loh_alloc_mb_str)
+
+    gen2_size_line = lines[num_lines-3]
+    gen2_size_str, remaining_str = parse_str(gen2_size_line, "s: ", ",")
+    gen2_size = int(gen2_size_str)
+
+    last_gc_end_line = lines[num_lines-1]
+    last_gc_index_str, remaining_str = parse_str(last_gc_end_line, "GC* ", "(")
+    last_gc_index = int(last_gc_index_str)
+
+    print("soh alloc: {0}mb, loh {1}mb, g2 {2:,}, last gc: {3}".format(
+        soh_alloc_mb, loh_alloc_mb, gen2_size, last_gc_index))
+    return soh_alloc_mb, loh_alloc_mb, gen2_size, last_gc_index
+
+def process_output(file_name):
+    print("processing output file: {0}".format(file_name))
+    with open(file_name, "r") as pause_file:
+        lines = pause_file.readlines()
+        for i in range(0, len(lines)):
+            line = lines[i]
+            # print(line)
+            if (line.find("10min elapsed") != -1):
+                num_iterations_str, remaining_str = parse_str(line, "Iter ", ":")
+                num_iterations = int(num_iterations_str)
+                print("did {0:,} iterations".format(num_iterations))
+                return num_iterations
+    
+    print("didn't find 10min elapsed line!!!!")
@@ -0,0 +1,9 @@
+# the GC stats we get out of the ETW traces and what's done with them. Nothing here
+# needs clr (TraceEvent) so app.py can use it too.
+#
+# metrics      - the GC stats we keep, their units and how to read each one
+# readers      - the trace reader interface and a fake reader for trying things without TraceEvent
+# events       - reading just the process and the GC events we want out of a trace, and a fake event source
+# ingest       - reading a batch of traces in parallel and streaming the rows out
+# store        - the results of all the runs, keyed on (Test, Date), that app.py reads
+# manifest     - which traces are already in the results so only new/changed ones are read
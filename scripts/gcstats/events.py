@@ -0,0 +1,152 @@
+import abc
+import collections
+
+from .metrics import GC_METRIC_SPEC, read_gc_metrics
+from .readers import trace_reader
+
+# reading a trace for just the process we want instead of all of it. read_trace
+# loads the runtimes of every process in the trace, goes through every event and
+# only then looks for corerun; here the reader tells the event source up front which
+# processes (by name) and which events (by keyword) it wants, and the source stops
+# as soon as the process we want has ended. So what it costs is about the GC events
+# of that one process, not the size of the trace.
+
+# ClrTraceEventParser.Keywords.GC - the GC events are all Stats() needs
+CLR_GC_KEYWORDS = 0x1
+
+class gc_event_filter():
+    def __init__(self, process_name="corerun", keywords=CLR_GC_KEYWORDS):
+        self.process_name = process_name.lower()
+        self.keywords = keywords
+
+    def matches_process(self, process_name):
+        return (process_name.lower().find(self.process_name) != -1)
+
+    def wants_keywords(self, keywords):
+        return ((keywords & self.keywords) != 0)
+
+# a process the filter matched, when it ended (or when the trace did). gc_stats is
+# what mang.GC.Stats() gives us, None if the process never loaded the runtime.
+traced_process = collections.namedtuple("traced_process", ["process_id", "name", "gc_stats"])
+
+# goes through one trace. process() calls on_process_stop(traced_process) for each
+# process the filter matches as it ends, and for the ones still running when the
+# trace ends; it stops right away when on_process_stop returns True.
+class event_source(abc.ABC):
+    @abc.abstractmethod
+    def process(self, event_filter, on_process_stop):
+        pass
+
+# a trace_reader that reads through an event_source; subclasses say how to open one.
+# The stats are from the first process that matches the filter and has the runtime
+# loaded to end.
+class filtered_trace_reader(trace_reader):
+    def __init__(self, process_name="corerun", keywords=CLR_GC_KEYWORDS):
+        self.event_filter = gc_event_filter(process_name, keywords)
+
+    @abc.abstractmethod
+    def open_source(self, file_name):
+        pass
+
+    def read(self, file_name):
+        source = self.open_source(file_name)
+        target_processes = []
+        def on_process_stop(process):
+            if (process.gc_stats is None):
+                return False
+            target_processes.append(process)
+            return True
+        source.process(self.event_filter, on_process_stop)
+        if (len(target_processes) == 0):
+            return None
+
+        process = target_processes[0]
+        print("info for process {0}: {1}".format(process.process_id, process.name))
+        return {'IsServerGCUsed': process.gc_stats.IsServerGCUsed,
+                'stats': read_gc_metrics(process.gc_stats)}
+
+# the fake event source below, for trying the filtering out without TraceEvent.
+#
+# kind is "ProcessStart", "ProcessStop", "GCEnd" or anything else (eg "MethodJit")
+# for events we don't want; pause_msec is only for GCEnd.
+fake_event = collections.namedtuple("fake_event", ["kind", "process_id", "process_name", "keywords", "pause_msec"])
+
+# the events of one process - it starts, has num_gcs GCs with num_other_events
+# non GC events after each and ends
+def make_fake_process_events(process_id, process_name, num_gcs, num_other_events=0, has_runtime=True):
+    events = [fake_event("ProcessStart", process_id, process_name, 0, 0)]
+    for gc_index in range(0, num_gcs):
+        if (has_runtime):
+            events.append(fake_event("GCEnd", process_id, process_name, CLR_GC_KEYWORDS, 1.0 + (gc_index % 10)))
+        for event_index in range(0, num_other_events):
+            # ClrTraceEventParser.Keywords.Jit
+            events.append(fake_event("MethodJit", process_id, process_name, 0x10, 0))
+    events.append(fake_event("ProcessStop", process_id, process_name, 0, 0))
+    return events
+
+# what Stats() would say about the fake GCs - the pauses are made up, the rest is 0
+class fake_gc_stats():
+    def __init__(self, pauses_msec):
+        for metric in GC_METRIC_SPEC:
+            setattr(self, metric.name, 0)
+        self.IsServerGCUsed = False
+        self.HeapCount = 1
+        self.TotalPauseTimeMSec = sum(pauses_msec)
+        if (len(pauses_msec) > 0):
+            self.MeanPauseDurationMSec = self.TotalPauseTimeMSec / len(pauses_msec)
+            self.MaxSuspendDurationMSec = max(pauses_msec)
+
+    def GetGCPauseTimePercentage(self):
+        return 0
+
+# goes through the events like TraceEvent would and counts what it did with them:
+# num_events_read is every event it got to before it stopped, num_events_decoded
+# the ones that got past the filter (only those cost anything past the header).
+class fake_event_source(event_source):
+    def __init__(self, events):
+        self.events = events
+        self.num_events_read = 0
+        self.num_events_decoded = 0
+
+    def process(self, event_filter, on_process_stop):
+        # process id -> (name, GC pauses, loaded the runtime) of the processes the
+        # filter matched that haven't ended yet
+        running_processes = collections.OrderedDict()
+        def stop_process(process_id):
+            name, pauses_msec, has_runtime = running_processes.pop(process_id)
+            gc_stats = fake_gc_stats(pauses_msec) if has_runtime else None
+            return on_process_stop(traced_process(process_id, name, gc_stats))
+
+        for event in self.events:
+            self.num_events_read += 1
+            if (event.kind == "ProcessStart"):
+                if (event_filter.matches_process(event.process_name)):
+                    running_processes[event.process_id] = (event.process_name, [], False)
+                continue
+            if (event.process_id not in running_processes):
+                continue
+            if (event.kind == "ProcessStop"):
+                if (stop_process(event.process_id)):
+                    return
+                continue
+            if (not event_filter.wants_keywords(event.keywords)):
+                continue
+            self.num_events_decoded += 1
+            if (event.kind == "GCEnd"):
+                name, pauses_msec, has_runtime = running_processes[event.process_id]
+                pauses_msec.append(event.pause_msec)
+                running_processes[event.process_id] = (name, pauses_msec, True)
+
+        for process_id in list(running_processes):
+            if (stop_process(process_id)):
+                return
+
+# file name -> its fake events. The sources are kept so their counts can be looked
+# at after a read (in this process - a worker's copy isn't sent back).
+class fake_event_reader(filtered_trace_reader):
+    def __init__(self, trace_events, process_name="corerun", keywords=CLR_GC_KEYWORDS):
+        filtered_trace_reader.__init__(self, process_name, keywords)
+        self.sources = {file_name: fake_event_source(events) for file_name, events in trace_events.items()}
+
+    def open_source(self, file_name):
+        return self.sources[file_name]
@@ -0,0 +1,127 @@
+import concurrent.futures
+import os
+from datetime import date, timedelta
+
+from .metrics import GCSTATS_HEADER
+
+# reading a batch of traces with a trace_reader (see readers.py), several at once in
+# worker processes. Each trace is one row - the test, the date it ran and the GC
+# stats - and rows are handed to write_row as soon as their trace is done, so they
+# come in the order the traces finish, not the order they were given. A trace that
+# can't be read is printed and skipped, the rest of the batch still goes in.
+
+# the traces are under <root>\<test>\<days ago>\...
+def get_test_name_and_date(trace_file):
+    test_name = trace_file.split('\\')[1]
+    date_diff = int(trace_file.split('\\')[2])
+    test_date = date.today() - timedelta(days=date_diff)
+    return test_name, test_date
+
+def read_trace_row(reader, trace_file):
+    test_name, test_date = get_test_name_and_date(trace_file)
+    stats_summary = reader.read(trace_file)
+    if (stats_summary is None):
+        raise ValueError("no process to read in {0}".format(trace_file))
+
+    row = {'Test': test_name, 'Date': test_date}
+    for header in GCSTATS_HEADER:
+        row[header] = stats_summary['stats'][header]['Stat']
+    return row
+
+# runs in the worker. Errors come back as text since what TraceEvent throws can't
+# always be sent back from a worker process.
+def try_read_trace_row(reader, trace_file):
+    try:
+        return read_trace_row(reader, trace_file), None
+    except Exception as e:
+        return None, "{0}: {1}".format(type(e).__name__, e)
+
+# returns the number of rows written and [(trace_file, error), ...] for the traces
+# that couldn't be read. trace_done(trace_file) is called once a trace's row has
+# been written (that's when it can go in the manifest).
+def ingest_traces(trace_files, reader, write_row, num_workers=None, trace_done=None):
+    if (num_workers is None):
+        num_workers = os.cpu_count()
+    num_workers = min(num_workers, len(trace_files))
+
+    num_rows = 0
+    failed_traces = []
+    def add_result(trace_file, row, error):
+        nonlocal num_rows
+        if (error is not None):
+            print("failed to read {0}: {1}".format(trace_file, error))
+            failed_traces.append((trace_file, error))
+            return
+        write_row(row)
+        num_rows += 1
+        if (trace_done is not None):
+            trace_done(trace_file)
+
+    if (num_workers <= 1):
+        for trace_file in trace_files:
+            row, error = try_read_trace_row(reader, trace_file)
+            add_result(trace_file, row, error)
+        return num_rows, failed_traces
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=num_workers) as executor:
+        futures = {executor.submit(try_read_trace_row, reader, trace_file): trace_file for trace_file in trace_files}
+        for future in concurrent.futures.as_completed(futures):
+            trace_file = futures[future]
+            try:
+                row, error = future.result()
+            except Exception as e:
+                # the worker itself died (eg the trace crashed TraceEvent)
+                row, error = None, "{0}: {1}".format(type(e).__name__, e)
+            add_result(trace_file, row, error)
+    return num_rows, failed_traces
+
+def format_csv_row(values):
+    return ''.join('{},'.format(value) for value in values) + '\n'
+
+def get_csv_row_key(line):
+    return tuple(line.split(',', 2)[:2])
+
+# writes the rows to a csv the way ETWAnalysis.py did before the results went in the
+# store (see store.py) - Test, Date, then the stats, each followed by a comma. Rows are upserted on (Test, Date): a new one is
+# appended and flushed right away, so what's done is there even if the batch is
+# stopped; one that replaces a row already in the file (its trace changed) is kept
+# till close(), which rewrites the file once with them in. So a batch of new traces
+# only ever appends.
+class csv_row_writer():
+    def __init__(self, file_name):
+        self.file_name = file_name
+        self.replaced_rows = {}
+        self.keys = set()
+        if (os.path.exists(file_name) and (os.path.getsize(file_name) > 0)):
+            with open(file_name, 'r') as csv_file:
+                next(csv_file)
+                for line in csv_file:
+                    self.keys.add(get_csv_row_key(line))
+            self.csv_file = open(file_name, 'a')
+        else:
+            self.csv_file = open(file_name, 'w')
+            # Test name, Date test was taken
+            self.csv_file.write(format_csv_row(['Test', 'Date'] + GCSTATS_HEADER))
+            self.csv_file.flush()
+
+    def __call__(self, row):
+        line = format_csv_row([row['Test'], row['Date']] + [row[header] for header in GCSTATS_HEADER])
+        key = get_csv_row_key(line)
+        if (key in self.keys):
+            self.replaced_rows[key] = line
+            return
+        self.keys.add(key)
+        self.csv_file.write(line)
+        self.csv_file.flush()
+
+    def close(self):
+        self.csv_file.close()
+        if (len(self.replaced_rows) == 0):
+            return
+        new_file_name = self.file_name + '.new'
+        with open(self.file_name, 'r') as csv_file, open(new_file_name, 'w') as new_csv_file:
+            new_csv_file.write(next(csv_file))
+            for line in csv_file:
+                new_csv_file.write(self.replaced_rows.get(get_csv_row_key(line), line))
+        os.replace(new_file_name, self.file_name)
+        self.replaced_rows = {}
@@ -0,0 +1,41 @@
+import json
+import os
+
+# which traces are already in the results, so a run only reads the traces that are
+# new or have changed since. A trace is keyed by its path and counts as changed if
+# its size or mtime is different from when it was read. Delete the manifest to read
+# everything again.
+class trace_manifest():
+    def __init__(self, file_name):
+        self.file_name = file_name
+        # path -> [size, mtime_ns]
+        self.traces = {}
+        if (os.path.exists(file_name)):
+            with open(file_name, 'r') as manifest_file:
+                self.traces = json.load(manifest_file)
+
+    @staticmethod
+    def get_trace_key(trace_file):
+        trace_stat = os.stat(trace_file)
+        return [trace_stat.st_size, trace_stat.st_mtime_ns]
+
+    # trace -> its key now, for the traces we need to read. The key is taken before
+    # the trace is read so if it changes while we read it, it's read again next time.
+    def get_changed_traces(self, trace_files):
+        changed_traces = {}
+        for trace_file in trace_files:
+            trace_key = self.get_trace_key(trace_file)
+            if (self.traces.get(trace_file) != trace_key):
+                changed_traces[trace_file] = trace_key
+        return changed_traces
+
+    def mark_ingested(self, trace_file, trace_key):
+        self.traces[trace_file] = trace_key
+
+    # written to the side and moved over so a run that's stopped halfway doesn't
+    # leave half a manifest
+    def save(self):
+        new_file_name = self.file_name + '.new'
+        with open(new_file_name, 'w') as manifest_file:
+            json.dump(self.traces, manifest_file, indent=1, sort_keys=True)
+        os.replace(new_file_name, self.file_name)
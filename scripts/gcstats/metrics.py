@@ -0,0 +1,46 @@
+import collections
+import operator
+
+# the GC stats we keep for a trace. Each one is read off the stats of the process
+# (mang.GC.Stats()) with its accessor, so we ask TraceEvent for the stats once and
+# read all of them off that - every Stats() call goes over the .NET bridge and adds
+# up all the GCs of the process again.
+#
+# the CSV header (GCSTATS_HEADER) and the units app.py shows come from this, to keep
+# a new stat in all of them add it here.
+gc_metric = collections.namedtuple("gc_metric", ["name", "units", "accessor"])
+
+GC_METRIC_SPEC = [
+    gc_metric('GCPauseTimePercentage', '%', operator.methodcaller('GetGCPauseTimePercentage')),
+    gc_metric('HeapCount', 'Count', operator.attrgetter('HeapCount')),
+    gc_metric('MaxAllocRateMBSec', 'MB', operator.attrgetter('MaxAllocRateMBSec')),
+    gc_metric('MaxSizePeakMB', 'MB', operator.attrgetter('MaxSizePeakMB')),
+    gc_metric('MaxSuspendDurationMSec', 'MSec', operator.attrgetter('MaxSuspendDurationMSec')),
+    gc_metric('MeanCpuMSec', 'MSec', operator.attrgetter('MeanCpuMSec')),
+    gc_metric('MeanPauseDurationMSec', 'MSec', operator.attrgetter('MeanPauseDurationMSec')),
+    gc_metric('MeanSizeAfterMB', 'MB', operator.attrgetter('MeanSizeAfterMB')),
+    gc_metric('MeanSizePeakMB', 'MB', operator.attrgetter('MeanSizePeakMB')),
+    gc_metric('NumInduced', 'Count', operator.attrgetter('NumInduced')),
+    gc_metric('NumWithPinEvents', 'Count', operator.attrgetter('NumWithPinEvents')),
+    gc_metric('NumWithPinPlugEvents', 'Count', operator.attrgetter('NumWithPinPlugEvents')),
+    gc_metric('PinnedObjectPercentage', '%', operator.attrgetter('PinnedObjectPercentage')),
+    gc_metric('PinnedObjectSizes', 'Count', operator.attrgetter('PinnedObjectSizes')),
+    gc_metric('ProcessDuration', 'Sec', operator.attrgetter('ProcessDuration')),
+    gc_metric('TotalAllocatedMB', 'MB', operator.attrgetter('TotalAllocatedMB')),
+    gc_metric('TotalCpuMSec', 'MSec', operator.attrgetter('TotalCpuMSec')),
+    gc_metric('TotalPauseTimeMSec', 'MSec', operator.attrgetter('TotalPauseTimeMSec')),
+    gc_metric('TotalPromotedMB', 'MB', operator.attrgetter('TotalPromotedMB')),
+    gc_metric('TotalSizeAfterMB', 'MB', operator.attrgetter('TotalSizeAfterMB')),
+    gc_metric('TotalSizePeakMB', 'MB', operator.attrgetter('TotalSizePeakMB')),
+]
+
+# GC Stats header
+GCSTATS_HEADER = [metric.name for metric in GC_METRIC_SPEC]
+GC_METRIC_UNITS = {metric.name: metric.units for metric in GC_METRIC_SPEC}
+
+# name -> {'Units': ..., 'Stat': ...} for each metric, from the one stats object
+def read_gc_metrics(gc_stats):
+    stats = {}
+    for metric in GC_METRIC_SPEC:
+        stats[metric.name] = {'Units': metric.units, 'Stat': metric.accessor(gc_stats)}
+    return stats
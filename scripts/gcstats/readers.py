@@ -0,0 +1,38 @@
+import abc
+import zlib
+
+from .metrics import GC_METRIC_SPEC
+
+# a trace reader gets the GC stats out of one trace. read() returns what
+# ETWAnalysis.read_trace always has - {'IsServerGCUsed': ..., 'stats': {name: {'Units': ...,
+# 'Stat': ...}}} - or None if the trace doesn't have the process we want.
+#
+# the real ones (ETWAnalysis.traceevent_reader and the filtered one, see events.py)
+# need TraceEvent through clr, so on a box without it use fake_trace_reader to try
+# out what's done with the stats.
+# Readers are sent to the worker processes so they have to be picklable.
+class trace_reader(abc.ABC):
+    @abc.abstractmethod
+    def read(self, file_name):
+        pass
+
+# made up stats that only depend on the trace's name, so the same trace always gets
+# the same ones. Traces with any of fail_on in their name raise like a broken trace
+# would, and missing_on ones have no process to read.
+class fake_trace_reader(trace_reader):
+    def __init__(self, fail_on=(), missing_on=(), is_server_gc=False):
+        self.fail_on = tuple(fail_on)
+        self.missing_on = tuple(missing_on)
+        self.is_server_gc = is_server_gc
+
+    def read(self, file_name):
+        if (any(name_part in file_name for name_part in self.fail_on)):
+            raise ValueError("{0} is not a trace we can read".format(file_name))
+        if (any(name_part in file_name for name_part in self.missing_on)):
+            return None
+
+        seed = zlib.crc32(file_name.encode("utf-8"))
+        stats = {}
+        for metric_index, metric in enumerate(GC_METRIC_SPEC):
+            stats[metric.name] = {'Units': metric.units, 'Stat': ((seed >> (metric_index % 24)) % 1000) / 10.0}
+        return {'IsServerGCUsed': self.is_server_gc, 'stats': stats}
@@ -0,0 +1,122 @@
+import csv
+import os
+import sqlite3
+import threading
+
+from .metrics import GCSTATS_HEADER
+
+# the results of all the runs, one row per (Test, Date), in a SQLite file instead of
+# the csv we used to write by hand and read whole. (Test, Date) is the primary key
+# so reading one test or a range of dates only reads those rows, and a run of the
+# same test on the same day replaces the row that's there.
+#
+# sqlite3 comes with python so nothing has to be installed for it, unlike parquet.
+# A metric added to GC_METRIC_SPEC gets its column added the next time the store is
+# opened; the rows already there have it as NULL.
+
+RESULTS_TABLE = 'results'
+KEY_COLUMNS = ['Test', 'Date']
+
+class results_store():
+    def __init__(self, file_name):
+        self.file_name = file_name
+        # the dashboard reads from the threads flask serves requests on
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(file_name, check_same_thread=False)
+        with self.connection:
+            self.connection.execute('CREATE TABLE IF NOT EXISTS {0} (Test TEXT NOT NULL, Date TEXT NOT NULL, '
+                'PRIMARY KEY (Test, Date))'.format(RESULTS_TABLE))
+            self.connection.execute('CREATE INDEX IF NOT EXISTS {0}_date ON {0} (Date)'.format(RESULTS_TABLE))
+            existing_columns = [column_info[1] for column_info in
+                self.connection.execute('PRAGMA table_info({0})'.format(RESULTS_TABLE))]
+            for header in GCSTATS_HEADER:
+                if (header not in existing_columns):
+                    self.connection.execute('ALTER TABLE {0} ADD COLUMN {1} NUMERIC'.format(RESULTS_TABLE, header))
+        self.columns = KEY_COLUMNS + GCSTATS_HEADER
+
+    def get_row_values(self, row):
+        return [row['Test'], str(row['Date'])] + [row.get(header) for header in GCSTATS_HEADER]
+
+    def write_rows(self, verb, rows):
+        statement = '{0} INTO {1} ({2}) VALUES ({3})'.format(verb, RESULTS_TABLE,
+            ', '.join(self.columns), ', '.join(['?'] * len(self.columns)))
+        with self.lock, self.connection:
+            return self.connection.executemany(statement, (self.get_row_values(row) for row in rows)).rowcount
+
+    # rows are dicts like the ones gcstats.ingest makes ({'Test': ..., 'Date': ...,
+    # metric: stat}). append raises sqlite3.IntegrityError if one is already there
+    # (and writes none of them), upsert replaces it.
+    def append(self, rows):
+        return self.write_rows('INSERT', rows)
+
+    def upsert(self, rows):
+        return self.write_rows('INSERT OR REPLACE', rows)
+
+    # so the store can be given to ingest_traces as write_row. Each row is committed
+    # on its own so what's done is there even if the batch is stopped.
+    def __call__(self, row):
+        self.upsert([row])
+
+    def close(self):
+        self.connection.close()
+
+    def get_tests(self):
+        with self.lock:
+            return [test for (test,) in
+                self.connection.execute('SELECT DISTINCT Test FROM {0} ORDER BY Test'.format(RESULTS_TABLE))]
+
+    # column name -> [values] for the rows of these tests between these dates
+    # (inclusive, either can be left out), in (Test, Date) order. Only the rows and
+    # columns asked for are read.
+    def read(self, columns=None, tests=None, start_date=None, end_date=None):
+        if (columns is None):
+            columns = self.columns
+        unknown_columns = [column for column in columns if (column not in self.columns)]
+        if (len(unknown_columns) > 0):
+            raise ValueError("no such columns in the results: {0}".format(', '.join(unknown_columns)))
+
+        conditions = []
+        params = []
+        if (tests is not None):
+            tests = list(tests)
+            if (len(tests) == 0):
+                return {column: [] for column in columns}
+            conditions.append('Test IN ({0})'.format(', '.join(['?'] * len(tests))))
+            params.extend(tests)
+        if (start_date is not None):
+            conditions.append('Date >= ?')
+            params.append(str(start_date))
+        if (end_date is not None):
+            conditions.append('Date <= ?')
+            params.append(str(end_date))
+
+        query = 'SELECT {0} FROM {1}'.format(', '.join(columns), RESULTS_TABLE)
+        if (len(conditions) > 0):
+            query += ' WHERE ' + ' AND '.join(conditions)
+        query += ' ORDER BY Test, Date'
+        with self.lock:
+            rows = self.connection.execute(query, params).fetchall()
+        return {column: [row[column_index] for row in rows] for column_index, column in enumerate(columns)}
+
+    # rows from a csv ETWAnalysis.py used to write (or csv_row_writer writes), which
+    # has a comma after the last column too
+    def import_csv(self, csv_file_name):
+        with open(csv_file_name, 'r', newline='') as csv_file:
+            rows = []
+            for csv_row in csv.DictReader(csv_file):
+                row = {'Test': csv_row['Test'], 'Date': csv_row['Date']}
+                for header in GCSTATS_HEADER:
+                    value = csv_row.get(header)
+                    row[header] = None if (value in (None, '')) else float(value)
+                rows.append(row)
+        return self.upsert(rows)
+
+# opens the store, and if it's new and there's a csv from before the store was
+# added, starts it off with the rows in that
+def open_results_store(file_name, csv_file_name=None):
+    is_new_store = not os.path.exists(file_name)
+    store = results_store(file_name)
+    if (is_new_store and (csv_file_name is not None) and os.path.exists(csv_file_name)):
+        num_rows = store.import_csv(csv_file_name)
+        print("imported {0} rows from {1} into {2}".format(num_rows, csv_file_name, file_name))
+    return store
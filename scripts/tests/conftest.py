@@ -0,0 +1,45 @@
+import os
+import sys
+
+import pytest
+
+# the tests import gclog/gcstats from scripts/ like the scripts do
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gclog import cache
+from gclog.buckets import bucket_schemes
+from gclog.synthlog import write_bgc_tuning_log, write_size_increase_log, write_gc1_log
+
+# the tests always parse, they never get what an earlier run left in the cache
+@pytest.fixture(autouse=True)
+def no_parse_cache(monkeypatch):
+    monkeypatch.setattr(cache, "g_parse_cache_dir", None)
+
+# made up logs (see gclog/synthlog.py), written once per test run. They're small so
+# the tests are quick; test_bench_gclog.py writes its own bigger ones.
+@pytest.fixture(scope="session")
+def synth_log_dir(tmp_path_factory):
+    return tmp_path_factory.mktemp("synthlogs")
+
+@pytest.fixture(scope="session")
+def bgc_tuning_log(synth_log_dir):
+    file_name = str(synth_log_dir / "bgc-tuning.log")
+    write_bgc_tuning_log(file_name, 200)
+    return file_name
+
+# scheme name -> log
+@pytest.fixture(scope="session")
+def size_increase_logs(synth_log_dir):
+    logs = {}
+    for scheme_name in ["pow2", "size42", "size100"]:
+        logs[scheme_name] = str(synth_log_dir / "size-increase-{0}.log".format(scheme_name))
+        write_size_increase_log(logs[scheme_name], 1000, scheme=bucket_schemes[scheme_name])
+    return logs
+
+@pytest.fixture(scope="session")
+def gc1_logs(synth_log_dir):
+    logs = []
+    for seed, num_gcs in [(3, 1000), (4, 1200)]:
+        logs.append(str(synth_log_dir / "gc1-{0}.log".format(seed)))
+        write_gc1_log(logs[-1], num_gcs, seed=seed)
+    return logs
@@ -0,0 +1,130 @@
+import contextlib
+import functools
+import multiprocessing
+import os
+import sys
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+from gclog import cache
+from gclog.buckets import bucket_schemes
+from gclog.synthlog import write_bgc_tuning_log, write_size_increase_log, write_gc1_log
+from gclog.bgc_tuning import process_file_bgc_tuning
+from gclog.size_increase import process_file_bgc_tuning_size_increase
+from gclog.gc1 import process_file_bgc_gc1
+
+# times the gclog parsers on made up logs (gclog/synthlog.py) with pytest-benchmark,
+# so we can see if a change made them faster or slower without the real logs, eg
+#
+#   GCLOG_BENCH_GCS=200000 python -m pytest tests/test_bench_gclog.py --benchmark-only
+#
+# (--benchmark-skip leaves them out of a normal test run). The cache is off so every
+# round parses. After the benchmark table we print each parser's lines/s (from its
+# best round) and the peak RSS of parsing the log once in a new process (so what the
+# other benchmarks used doesn't count). Peak RSS needs the resource module so it's
+# only there on Linux/macOS.
+g_bench_gcs = int(os.environ.get("GCLOG_BENCH_GCS", "10000"))
+g_bench_rounds = int(os.environ.get("GCLOG_BENCH_ROUNDS", "3"))
+g_bench_scheme = bucket_schemes[os.environ.get("GCLOG_BENCH_SCHEME", "pow2")]
+
+# peak RSS so far of this process in MB. ru_maxrss is in KB on Linux and bytes on macOS.
+def get_peak_rss_mb():
+    if (resource is None):
+        return None
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if (sys.platform == "darwin"):
+        return peak_rss / (1024 * 1024)
+    return peak_rss / 1024
+
+def count_lines(file_name):
+    num_lines = 0
+    with open(file_name, "rb") as log_file:
+        for block in iter(functools.partial(log_file.read, 1024 * 1024), b""):
+            num_lines += block.count(b"\n")
+    return num_lines
+
+def run_parser(process_function, file_name):
+    with open(os.devnull, "w") as devnull:
+        with contextlib.redirect_stdout(devnull):
+            return process_function(file_name)
+
+# runs in the child process, returns (MB before parsing, peak MB)
+def measure_parser_rss(process_function, file_name):
+    cache.g_parse_cache_dir = None
+    rss_before_mb = get_peak_rss_mb()
+    run_parser(process_function, file_name)
+    return rss_before_mb, get_peak_rss_mb()
+
+# name -> (log, what makes the log, the parser); benchmarks on the same log share
+# it. The parsers have to be module level functions or partials of them since
+# they're sent to the child process.
+def get_benchmarks(num_gcs, scheme):
+    # a BGC and its eph GCs are about 5 GCs
+    num_bgcs = max(num_gcs // 5, 1)
+    bgc_tuning_log_name = "bgc-tuning-{0}".format(num_bgcs)
+    return {
+        "bgc-tuning": (bgc_tuning_log_name, functools.partial(write_bgc_tuning_log, num_bgcs=num_bgcs),
+            process_file_bgc_tuning),
+        "bgc-tuning-mmap": (bgc_tuning_log_name, functools.partial(write_bgc_tuning_log, num_bgcs=num_bgcs),
+            functools.partial(process_file_bgc_tuning, use_mmap=True)),
+        "size-increase": ("size-increase-{0}-{1}".format(scheme.name, num_gcs),
+            functools.partial(write_size_increase_log, num_gcs=num_gcs, scheme=scheme),
+            functools.partial(process_file_bgc_tuning_size_increase, scheme=scheme)),
+        "gc1": ("gc1-{0}".format(num_gcs), functools.partial(write_gc1_log, num_gcs=num_gcs), process_file_bgc_gc1),
+    }
+
+g_benchmarks = get_benchmarks(g_bench_gcs, g_bench_scheme)
+
+@pytest.fixture(scope="module")
+def bench_log_dir(tmp_path_factory):
+    return tmp_path_factory.mktemp("benchlogs")
+
+# the lines/s and RSS of each benchmark, printed at the end of the run after the
+# benchmark table (output is captured while the tests run)
+class bench_report():
+    def __init__(self):
+        self.rows = []
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if (len(self.rows) == 0):
+            return
+        terminalreporter.write_sep("-", "gclog parsers, {0} GCs".format(g_bench_gcs))
+        terminalreporter.write_line("{0:<16}|{1:>10}|{2:>12}|{3:>9}|{4:>9}".format(
+            "parser", "lines", "lines/s", "base MB", "peak MB"))
+        for name, num_lines, lines_per_s, rss_before_mb, peak_rss_mb in self.rows:
+            terminalreporter.write_line("{0:<16}|{1:>10,}|{2:>12,.0f}|{3:>9}|{4:>9}".format(
+                name, num_lines, lines_per_s,
+                "n/a" if (rss_before_mb is None) else "{0:.1f}".format(rss_before_mb),
+                "n/a" if (peak_rss_mb is None) else "{0:.1f}".format(peak_rss_mb)))
+
+@pytest.fixture(scope="module")
+def bench_rows(request):
+    report = bench_report()
+    request.config.pluginmanager.register(report, "gclog-bench-report")
+    return report.rows
+
+@pytest.mark.parametrize("name", list(g_benchmarks))
+def test_bench_parser(benchmark, bench_log_dir, bench_rows, name):
+    log_name, write_log, process_function = g_benchmarks[name]
+    log_file_name = str(bench_log_dir / "{0}.log".format(log_name))
+    if (not os.path.exists(log_file_name)):
+        write_log(log_file_name)
+    num_lines = count_lines(log_file_name)
+
+    benchmark.pedantic(run_parser, args=(process_function, log_file_name), rounds=g_bench_rounds, iterations=1)
+    lines_per_s = num_lines / benchmark.stats.stats.min
+
+    # spawn so it starts from a new interpreter, like it would on Windows
+    with multiprocessing.get_context("spawn").Pool(1) as pool:
+        rss_before_mb, peak_rss_mb = pool.apply(measure_parser_rss, (process_function, log_file_name))
+
+    benchmark.extra_info.update({"lines": num_lines, "lines_per_s": lines_per_s,
+        "base_mb": rss_before_mb, "peak_mb": peak_rss_mb})
+    bench_rows.append((name, num_lines, lines_per_s, rss_before_mb, peak_rss_mb))
@@ -0,0 +1,55 @@
+import pytest
+
+from gclog.bgc_tuning import (bgc_tuning_classifier, iter_classified_lines, iter_classified_lines_mmap,
+                              parse_file_bgc_tuning, process_file_bgc_tuning, compare_bgc_tuning_parse_modes)
+from gclog.size_increase import size_increase_classifier
+
+# the same log with the newline at the end taken off, so the last line (a *EGC line,
+# which the parser does want) has no line end
+@pytest.fixture(scope="module")
+def bgc_tuning_log_no_newline(bgc_tuning_log, tmp_path_factory):
+    with open(bgc_tuning_log, "rb") as log_file:
+        log_bytes = log_file.read()
+    assert log_bytes.endswith(b"\n")
+    file_name = str(tmp_path_factory.mktemp("mmap") / "bgc-tuning-no-newline.log")
+    with open(file_name, "wb") as log_file:
+        log_file.write(log_bytes[:-1])
+    return file_name
+
+@pytest.fixture(params=["newline", "no-newline"])
+def log_file_name(request, bgc_tuning_log, bgc_tuning_log_no_newline):
+    return bgc_tuning_log if (request.param == "newline") else bgc_tuning_log_no_newline
+
+# small blocks so a lot of lines (and a line with its next_line) get split across blocks
+@pytest.mark.parametrize("block_size", [64 * 1024 * 1024, 4096, 100, 1])
+def test_classified_lines(log_file_name, block_size):
+    text_lines = list(iter_classified_lines(log_file_name, bgc_tuning_classifier))
+    assert len(text_lines) > 0
+    assert list(iter_classified_lines_mmap(log_file_name, bgc_tuning_classifier, block_size)) == text_lines
+
+def test_classified_lines_size_increase(size_increase_logs):
+    for file_name in size_increase_logs.values():
+        assert (list(iter_classified_lines_mmap(file_name, size_increase_classifier, 4096)) ==
+                list(iter_classified_lines(file_name, size_increase_classifier)))
+
+def get_parse_result(file_name, use_mmap, capsys):
+    num_gen2s, bgc_tuning, bgc_detailed_tuning, total_physical_memory = process_file_bgc_tuning(file_name, use_mmap=use_mmap)
+    return (num_gen2s, bgc_tuning.data[:len(bgc_tuning)].tolist(), bgc_detailed_tuning.data[:len(bgc_detailed_tuning)].tolist(),
+        total_physical_memory, capsys.readouterr().out)
+
+def test_process_file(log_file_name, capsys):
+    text_result = get_parse_result(log_file_name, False, capsys)
+    assert len(text_result[1]) > 0
+    assert get_parse_result(log_file_name, True, capsys) == text_result
+
+def test_no_newline_parses_the_same(bgc_tuning_log, bgc_tuning_log_no_newline, capsys):
+    assert get_parse_result(bgc_tuning_log_no_newline, True, capsys) == get_parse_result(bgc_tuning_log, False, capsys)
+
+def test_compare_parse_modes(log_file_name, capsys):
+    assert compare_bgc_tuning_parse_modes(log_file_name)
+
+def test_empty_log(tmp_path):
+    file_name = str(tmp_path / "empty.log")
+    open(file_name, "w").close()
+    assert list(iter_classified_lines_mmap(file_name, bgc_tuning_classifier)) == []
+    assert parse_file_bgc_tuning(file_name, use_mmap=True)[0] == parse_file_bgc_tuning(file_name)[0]
@@ -0,0 +1,52 @@
+import contextlib
+import io
+import os
+
+import pytest
+
+from gclog import bgc_tuning
+from gclog.bgc_tuning import get_bgc_tuning_chunks, parse_file_bgc_tuning, parse_file_bgc_tuning_parallel
+from gclog.gcindex import get_gc_index_path
+from gclog.synthlog import write_bgc_tuning_log
+
+def parse_printing(parse_function, *args):
+    printed = io.StringIO()
+    with contextlib.redirect_stdout(printed):
+        num_gen2s, bgc_tuning_records, bgc_detailed_tuning_records, total_physical_memory = parse_function(*args)
+    return (num_gen2s, bgc_tuning_records.data[:len(bgc_tuning_records)].tolist(),
+        bgc_detailed_tuning_records.data[:len(bgc_detailed_tuning_records)].tolist(),
+        total_physical_memory, printed.getvalue())
+
+@pytest.fixture(scope="module")
+def small_bgc_tuning_log(tmp_path_factory):
+    file_name = str(tmp_path_factory.mktemp("smalllog") / "bgc-tuning-small.log")
+    write_bgc_tuning_log(file_name, 2)
+    return file_name
+
+# a small warmup so most chunks start with the wrong guess and have to be parsed again
+@pytest.mark.parametrize("warmup_bytes", [1024 * 1024, 512])
+@pytest.mark.parametrize("num_workers", [1, 2, 3, 8])
+def test_parallel_matches_serial(monkeypatch, bgc_tuning_log, num_workers, warmup_bytes):
+    monkeypatch.setattr(bgc_tuning, "g_parallel_parse_warmup_bytes", warmup_bytes)
+    assert parse_printing(parse_file_bgc_tuning_parallel, bgc_tuning_log, num_workers) == \
+        parse_printing(parse_file_bgc_tuning, bgc_tuning_log)
+
+def test_more_workers_than_gcs(small_bgc_tuning_log):
+    num_gcs = sum(1 for line in open(small_bgc_tuning_log) if ("*GC* " in line))
+    num_workers = num_gcs * 3
+    assert len(get_bgc_tuning_chunks(small_bgc_tuning_log, num_workers)) <= num_gcs
+    assert parse_printing(parse_file_bgc_tuning_parallel, small_bgc_tuning_log, num_workers) == \
+        parse_printing(parse_file_bgc_tuning, small_bgc_tuning_log)
+
+def test_chunks_start_at_gcs_without_an_index(bgc_tuning_log):
+    chunks = get_bgc_tuning_chunks(bgc_tuning_log, 5)
+    with open(bgc_tuning_log, "rb") as log_file:
+        log_bytes = log_file.read()
+    assert len(chunks) == 5
+    assert chunks[0] == (0, 0, chunks[1][1])
+    assert chunks[-1][2] == len(log_bytes)
+    for warmup_start_offset, start_offset, end_offset in chunks[1:]:
+        assert log_bytes[start_offset - 1:start_offset] == b"\n"
+        assert log_bytes.find(b"*GC* ", start_offset, log_bytes.find(b"\n", start_offset)) != -1
+        assert warmup_start_offset <= start_offset < end_offset
+    assert not os.path.exists(get_gc_index_path(bgc_tuning_log))
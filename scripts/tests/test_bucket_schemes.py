@@ -0,0 +1,30 @@
+import contextlib
+import io
+
+import numpy as np
+
+from gclog.buckets import bucket_schemes, get_pow2_bucket_sizes, make_bucket_scheme
+from gclog.size_increase import process_file_bgc_tuning_size_increase
+from gclog.synthlog import write_size_increase_log
+
+def parse_quietly(file_name, scheme):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return process_file_bgc_tuning_size_increase(file_name, scheme=scheme)
+
+# a 2^n scheme that starts at 2^9 reads its log into the same buckets as pow2 (2^8)
+# reads its own - the bucket power has to come from the scheme everywhere. It's
+# called pow2 too since that's how synthlog knows to write 2^n buckets.
+def test_pow2_scheme_with_another_base_power(tmp_path):
+    pow2_scheme = bucket_schemes["pow2"]
+    shifted_scheme = make_bucket_scheme("pow2", [size * 2 for size in get_pow2_bucket_sizes()], base_power=9)
+    pow2_log = str(tmp_path / "pow2.log")
+    shifted_log = str(tmp_path / "shifted.log")
+    write_size_increase_log(pow2_log, 500, scheme=pow2_scheme)
+    write_size_increase_log(shifted_log, 500, scheme=shifted_scheme)
+
+    pow2_result = parse_quietly(pow2_log, pow2_scheme)
+    shifted_result = parse_quietly(shifted_log, shifted_scheme)
+    assert len(shifted_result[5]) == len(pow2_result[5])
+    for pow2_matrix, shifted_matrix in zip(pow2_result[6:], shifted_result[6:]):
+        assert np.array_equal(pow2_matrix.rows(), shifted_matrix.rows())
+    assert shifted_result[1] == pow2_result[1]
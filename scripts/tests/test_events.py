@@ -0,0 +1,66 @@
+import pytest
+
+from gcstats.events import CLR_GC_KEYWORDS, event_source, filtered_trace_reader, fake_event_reader, make_fake_process_events
+
+def read_fake_trace(events, process_name="corerun", keywords=CLR_GC_KEYWORDS):
+    reader = fake_event_reader({"trace.etl": events}, process_name, keywords)
+    return reader.read("trace.etl"), reader.sources["trace.etl"]
+
+def test_other_processes_are_not_decoded():
+    events = (make_fake_process_events(1, "devenv.exe", num_gcs=50, num_other_events=3) +
+        make_fake_process_events(2, "corerun.exe", num_gcs=10, num_other_events=3))
+    stats_summary, source = read_fake_trace(events)
+
+    # only the GC events of corerun, not devenv's GCs or anyone's JIT events
+    assert source.num_events_decoded == 10
+    assert stats_summary["stats"]["TotalPauseTimeMSec"]["Stat"] == sum(1.0 + (gc_index % 10) for gc_index in range(0, 10))
+
+def test_keywords_not_asked_for_are_not_decoded():
+    events = make_fake_process_events(2, "corerun.exe", num_gcs=10, num_other_events=3)
+    # ClrTraceEventParser.Keywords.Jit only
+    stats_summary, source = read_fake_trace(events, keywords=0x10)
+
+    assert source.num_events_decoded == 30
+    # no GC events means no runtime, so nothing to read
+    assert stats_summary is None
+
+def test_stops_when_the_process_ends():
+    target_events = make_fake_process_events(2, "corerun.exe", num_gcs=10, num_other_events=3)
+    events = target_events + make_fake_process_events(3, "corerun.exe", num_gcs=100)
+    stats_summary, source = read_fake_trace(events)
+
+    assert source.num_events_read == len(target_events)
+    assert source.num_events_decoded == 10
+    assert stats_summary["stats"]["MaxSuspendDurationMSec"]["Stat"] == 10.0
+
+def test_skips_matching_process_without_runtime():
+    events = (make_fake_process_events(2, "corerun.exe", num_gcs=5, has_runtime=False) +
+        make_fake_process_events(3, "corerun.exe", num_gcs=4))
+    stats_summary, source = read_fake_trace(events)
+
+    assert source.num_events_decoded == 4
+    assert stats_summary["stats"]["TotalPauseTimeMSec"]["Stat"] == 10.0
+
+def test_process_still_running_at_end_of_trace():
+    events = make_fake_process_events(2, "corerun.exe", num_gcs=3)[:-1]
+    stats_summary, source = read_fake_trace(events)
+
+    assert stats_summary["stats"]["TotalPauseTimeMSec"]["Stat"] == 6.0
+
+def test_no_matching_process():
+    events = make_fake_process_events(1, "devenv.exe", num_gcs=50, num_other_events=3)
+    stats_summary, source = read_fake_trace(events)
+
+    assert stats_summary is None
+    assert source.num_events_read == len(events)
+    assert source.num_events_decoded == 0
+
+def test_bases_without_their_methods_cant_be_made():
+    class no_process_source(event_source):
+        pass
+    class no_open_source_reader(filtered_trace_reader):
+        pass
+    with pytest.raises(TypeError):
+        no_process_source()
+    with pytest.raises(TypeError):
+        no_open_source_reader()
@@ -0,0 +1,94 @@
+import random
+
+import pytest
+
+from gclog.lines import (field_extractor, parse_str, parse_str_no_end, fla_fields, gen1_pow2_bucket_fields,
+                         gen1_pow2_bucket_tb_fields, gen1_size_bucket_fields, gen1_size_bucket_tb_fields,
+                         gc1_bucket_fields, elapsed_fields, elapsed_alloc_fields)
+
+# the parse_str chain a field_extractor stands in for
+def extract_by_parse_str(steps, line):
+    fields = []
+    remaining_str = line
+    for beg_str, end_str in steps:
+        if (end_str is None):
+            fields.append(parse_str_no_end(remaining_str, beg_str))
+        else:
+            field_str, remaining_str = parse_str(remaining_str, beg_str, end_str)
+            fields.append(field_str)
+    return tuple(fields)
+
+btl2_fields = field_extractor([("BTL2* ", ",")] + [(" ", ",")] * 8 + [(" ", None)])
+
+# extractor name -> (extractor, lines like the ones it gets in a real log)
+g_extractor_lines = {
+    "fla": (fla_fields, ["[21832]fla: 326136 (1208 fo rej), esa: 0, ca: 1297224, fl: 71967968(40%), fo: 819512, g1 ca: 524648\n"]),
+    "gen1-pow2": (gen1_pow2_bucket_fields, ["[25160][h0][#7986]: 2^13: F: 1152->1132(20), u: 0(0), O: 11, P: 9, TB: 6\n"]),
+    "gen1-pow2-tb": (gen1_pow2_bucket_tb_fields, ["[25160][h0][#7986]: 2^13: F: 1152->1132(20), u: 0(0), O: 11, P: 9, TB: 6\n"]),
+    "gen1-size": (gen1_size_bucket_fields, ["[24648][h0] 128: F: 29348->29380(-32), u: 0(0), O: 1257, P: 14, TB: 0\n"]),
+    "gen1-size-tb": (gen1_size_bucket_tb_fields, ["[24648][h0] 128: F: 29348->29380(-32), u: 0(0), O: 1257, P: 14, TB: 0\n"]),
+    "gc1": (gc1_bucket_fields, ["[35820]h0 256: 2F: 10, 1P: 3)\n"]),
+    "elapsed": (elapsed_fields, ["[23400]GC#29051(1196,61)(gen1) took 7ms(elapsed: 435028308, 5196s, 86min) (alloc: 178796mb, 322mb)\n"]),
+    "elapsed-alloc": (elapsed_alloc_fields, ["[23400]GC#29051(1196,61)(gen1) took 7ms(elapsed: 435028308, 5196s, 86min) (alloc: 178796mb, 322mb)\n"]),
+    "btl2": (btl2_fields, ["[ 3060]BTL2* 1065552, 81.9, 85.5, 87.3, 14.4, 63.4, 8, 8, 2303504, 2303504\n"]),
+}
+
+def check_extract(extractor, line):
+    assert extractor.extract(line) == extract_by_parse_str(extractor.steps, line), repr(line)
+
+@pytest.mark.parametrize("name", sorted(g_extractor_lines))
+def test_fast_path(name):
+    extractor, lines = g_extractor_lines[name]
+    for line in lines:
+        # these are the lines the regex is for, they shouldn't need the fallback
+        assert extractor.regex.match(line) is not None
+        check_extract(extractor, line)
+
+def test_fallback_when_a_marker_is_missing():
+    line = "[25160][h0][#7986]: 2^13: F: 1152->1132(20), u: 0(0), O: 11, TB: 6\n"
+    assert gen1_pow2_bucket_tb_fields.regex.match(line) is None
+    check_extract(gen1_pow2_bucket_tb_fields, line)
+    line = "[23400]GC#29051(1196,61)(gen1) took 7ms(elapsed: 435028308, 5196s, 86min)\n"
+    assert elapsed_fields.regex.match(line) is None
+    check_extract(elapsed_fields, line)
+
+def test_missing_field():
+    line = "[25160][h0][#7986]: 2^13: F: 1152->1132(20), u: 0(0), O: , P: 9, TB: \n"
+    check_extract(gen1_pow2_bucket_tb_fields, line)
+    assert gen1_pow2_bucket_tb_fields.extract(line)[4] == ""
+    assert gen1_pow2_bucket_tb_fields.extract(line)[6] == "\n"
+    check_extract(gc1_bucket_fields, "[35820]h0 256: 2F: , 1P: )\n")
+
+def test_extra_whitespace():
+    line = "[25160][h0][#7986]:  2^13 :  F:  1152 ->  1132 ( 20 ),  u:  0 ( 0 ),  O:  11 ,  P:  9 ,  TB:  6 \n"
+    assert gen1_pow2_bucket_tb_fields.regex.match(line) is not None
+    check_extract(gen1_pow2_bucket_tb_fields, line)
+    check_extract(elapsed_fields, "[23400]GC#29051(1196,61)(gen1) took  7 ms(elapsed: 435028308,  5196 s,  86 min)  (alloc:  178796 mb,   322 mb)\n")
+    check_extract(btl2_fields, "[ 3060]BTL2*  1065552 ,  81.9,85.5, 87.3,  14.4, 63.4, 8, 8, 2303504,\t2303504\n")
+
+# the sample lines with characters dropped, repeated or swapped for ones the markers
+# are made of, so both the regex and the fallback get lines that are a bit off
+def make_damaged_lines(line, num_lines, seed):
+    r = random.Random(seed)
+    marker_chars = " ,:()^%*-><"
+    lines = []
+    for line_index in range(0, num_lines):
+        chars = list(line)
+        for change_index in range(0, r.randint(1, 3)):
+            i = r.randrange(0, len(chars))
+            change = r.randint(0, 2)
+            if (change == 0):
+                del chars[i]
+            elif (change == 1):
+                chars.insert(i, chars[i])
+            else:
+                chars[i] = r.choice(marker_chars)
+        lines.append("".join(chars))
+    return lines
+
+@pytest.mark.parametrize("name", sorted(g_extractor_lines))
+def test_damaged_lines(name):
+    extractor, lines = g_extractor_lines[name]
+    for line in lines:
+        for damaged_line in make_damaged_lines(line, 2000, seed=11):
+            check_extract(extractor, damaged_line)
@@ -0,0 +1,52 @@
+import csv
+from datetime import date, timedelta
+
+import pytest
+
+from gcstats.ingest import csv_row_writer, ingest_traces
+from gcstats.metrics import GCSTATS_HEADER
+from gcstats.readers import fake_trace_reader, trace_reader
+
+GOOD_TRACE = "traces\\good-test\\1\\run.etl"
+FAILING_TRACE = "traces\\failing-test\\2\\broken.etl"
+MISSING_TRACE = "traces\\missing-test\\3\\other-process.etl"
+
+def read_csv_rows(file_name):
+    with open(file_name, "r", newline="") as csv_file:
+        return list(csv.reader(csv_file))
+
+@pytest.mark.parametrize("num_workers", [1, 2])
+def test_failed_traces_dont_stop_the_batch(tmp_path, num_workers):
+    csv_file_name = str(tmp_path / "test.csv")
+    reader = fake_trace_reader(fail_on=["broken"], missing_on=["other-process"])
+
+    # every row has to be in the file by the time the next one comes in
+    rows_on_disk = []
+    csv_writer = csv_row_writer(csv_file_name)
+    def write_row(row):
+        csv_writer(row)
+        rows_on_disk.append(len(read_csv_rows(csv_file_name)) - 1)
+    try:
+        num_rows, failed_traces = ingest_traces([FAILING_TRACE, GOOD_TRACE, MISSING_TRACE], reader,
+            write_row, num_workers=num_workers)
+    finally:
+        csv_writer.close()
+
+    assert num_rows == 1
+    assert rows_on_disk == [1]
+    assert sorted(trace_file for trace_file, error in failed_traces) == sorted([FAILING_TRACE, MISSING_TRACE])
+    assert dict(failed_traces)[FAILING_TRACE].startswith("ValueError: ")
+
+    csv_rows = read_csv_rows(csv_file_name)
+    # every column has a comma after it
+    assert csv_rows[0] == ["Test", "Date"] + GCSTATS_HEADER + [""]
+    assert len(csv_rows) == 2
+    assert csv_rows[1][:2] == ["good-test", str(date.today() - timedelta(days=1))]
+    good_stats = reader.read(GOOD_TRACE)["stats"]
+    assert [float(value) for value in csv_rows[1][2:-1]] == [good_stats[header]["Stat"] for header in GCSTATS_HEADER]
+
+def test_reader_without_read_cant_be_made():
+    class no_read_reader(trace_reader):
+        pass
+    with pytest.raises(TypeError):
+        no_read_reader()
@@ -0,0 +1,61 @@
+import random
+
+import pytest
+
+from gclog.bgc_tuning import bgc_tuning_classifier
+from gclog.lines import LINE_KIND_NONE, line_classifier
+from gclog.size_increase import size_increase_classifier
+
+# what line_classifier has to give - the first marker in list order that's in the
+# line, like the chain of "if (line.find(marker) != -1)" it replaced
+def classify_by_substring(markers, line):
+    for kind, marker in enumerate(markers):
+        if (marker in line):
+            return kind
+    return LINE_KIND_NONE
+
+@pytest.fixture(scope="module")
+def classifier_logs(bgc_tuning_log, size_increase_logs):
+    return {"bgc-tuning": (bgc_tuning_classifier, [bgc_tuning_log]),
+            "size-increase": (size_increase_classifier, list(size_increase_logs.values()))}
+
+@pytest.mark.parametrize("log_kind", ["bgc-tuning", "size-increase"])
+def test_synthlog_lines(classifier_logs, log_kind):
+    classifier, file_names = classifier_logs[log_kind]
+    num_classified = 0
+    for file_name in file_names:
+        with open(file_name, "r") as log_file:
+            for line in log_file:
+                kind = classifier.classify(line)
+                assert kind == classify_by_substring(classifier.markers, line), line
+                num_classified += (kind != LINE_KIND_NONE)
+    assert num_classified > 0
+
+# lines made of several markers, some run into each other (the end of one is the
+# start of the next) which is what the overlap handling is for
+def make_marker_lines(markers, num_lines, seed):
+    r = random.Random(seed)
+    lines = []
+    for line_index in range(0, num_lines):
+        line = "[ 8388]"
+        for marker_index in range(0, r.randint(1, 3)):
+            marker = r.choice(markers)
+            overlap_len = r.randint(0, len(marker) - 1)
+            if ((overlap_len > 0) and line.endswith(marker[:overlap_len])):
+                line += marker[overlap_len:]
+            else:
+                line += r.choice(["", " x ", "("]) + marker
+        lines.append(line + " 123\n")
+    return lines
+
+@pytest.mark.parametrize("classifier", [bgc_tuning_classifier, size_increase_classifier], ids=["bgc-tuning", "size-increase"])
+def test_lines_with_several_markers(classifier):
+    for line in make_marker_lines(classifier.markers, 5000, seed=7):
+        assert classifier.classify(line) == classify_by_substring(classifier.markers, line), line
+
+def test_overlapping_markers():
+    # "a, P: " starts inside "bytes in alloc, " and runs past it
+    classifier = line_classifier(["a, P: ", "bytes in alloc, ", "P: "])
+    for line in ["kp = 5 bytes in alloc, P: 3\n", "kp = 5 bytes in alloc, x\n", "P: 3\n", "nothing\n",
+                 "ff ->1 bytes in alloc, \n"]:
+        assert classifier.classify(line) == classify_by_substring(classifier.markers, line), line
@@ -0,0 +1,82 @@
+import contextlib
+import hashlib
+import io
+import json
+import os
+
+import pytest
+
+from gclog.bgc_tuning import process_file_bgc_tuning
+from gclog.buckets import bucket_schemes
+from gclog.gc1 import process_file_bgc_gc1, process_file_bgc_gc1_comparison
+from gclog.records import gc_bucket_matrix, gc_record_store
+from gclog.size_increase import process_file_bgc_tuning_size_increase
+
+# the process_file_* functions on the synthlog logs (see conftest.py) have to give
+# what they gave when data/parity.json was written, so a change that's meant to only
+# make a parser faster can't change what it returns or prints. Each item of the
+# result (and what was printed) is kept as a hash so it's clear which one changed.
+#
+# if a change is meant to change the results, write the file again with
+#   GCLOG_UPDATE_PARITY=1 python -m pytest tests/test_parity.py
+# and say why in the commit.
+g_parity_file_name = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "parity.json")
+
+def get_item_hash(item):
+    if (isinstance(item, gc_record_store)):
+        data = item.data[:len(item)]
+        item_bytes = str(data.dtype).encode("utf-8") + data.tobytes()
+    elif (isinstance(item, gc_bucket_matrix)):
+        item_bytes = item.rows().tobytes()
+    else:
+        item_bytes = repr(item).encode("utf-8")
+    return hashlib.sha1(item_bytes).hexdigest()[:16]
+
+# the logs are in a different temp dir every run so that's taken out of what was printed
+def get_parity(function, log_dir, *args, **kwargs):
+    printed = io.StringIO()
+    with contextlib.redirect_stdout(printed):
+        result = function(*args, **kwargs)
+    if (not isinstance(result, tuple)):
+        result = (result,)
+    printed_text = printed.getvalue().replace(str(log_dir), "<logs>")
+    return {"items": [get_item_hash(item) for item in result],
+            "printed": hashlib.sha1(printed_text.encode("utf-8")).hexdigest()[:16]}
+
+parity_cases = ["bgc-tuning", "bgc-tuning-mmap", "size-increase-pow2", "size-increase-size42",
+    "size-increase-size100", "size-increase-detected", "gc1", "gc1-comparison"]
+
+def run_parity_case(case, synth_log_dir, bgc_tuning_log, size_increase_logs, gc1_logs):
+    if (case == "bgc-tuning"):
+        return get_parity(process_file_bgc_tuning, synth_log_dir, bgc_tuning_log)
+    if (case == "bgc-tuning-mmap"):
+        return get_parity(process_file_bgc_tuning, synth_log_dir, bgc_tuning_log, use_mmap=True)
+    if (case == "size-increase-detected"):
+        return get_parity(process_file_bgc_tuning_size_increase, synth_log_dir, size_increase_logs["size42"])
+    if (case.startswith("size-increase-")):
+        scheme_name = case[len("size-increase-"):]
+        return get_parity(process_file_bgc_tuning_size_increase, synth_log_dir, size_increase_logs[scheme_name],
+            scheme=bucket_schemes[scheme_name])
+    if (case == "gc1"):
+        return get_parity(process_file_bgc_gc1, synth_log_dir, gc1_logs[0])
+    return get_parity(process_file_bgc_gc1_comparison, synth_log_dir, gc1_logs[0], gc1_logs[1])
+
+@pytest.fixture(scope="module")
+def expected_parity():
+    if (os.environ.get("GCLOG_UPDATE_PARITY")):
+        expected = {}
+        yield expected
+        with open(g_parity_file_name, "w") as parity_file:
+            json.dump(expected, parity_file, indent=1, sort_keys=True)
+            parity_file.write("\n")
+    else:
+        with open(g_parity_file_name, "r") as parity_file:
+            yield json.load(parity_file)
+
+@pytest.mark.parametrize("case", parity_cases)
+def test_parity(case, expected_parity, synth_log_dir, bgc_tuning_log, size_increase_logs, gc1_logs):
+    parity = run_parity_case(case, synth_log_dir, bgc_tuning_log, size_increase_logs, gc1_logs)
+    if (os.environ.get("GCLOG_UPDATE_PARITY")):
+        expected_parity[case] = parity
+    else:
+        assert parity == expected_parity[case]
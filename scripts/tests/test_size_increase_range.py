@@ -0,0 +1,46 @@
+import contextlib
+import io
+
+import numpy as np
+import pytest
+
+from gclog.buckets import bucket_schemes
+from gclog.size_increase import process_file_bgc_tuning_size_increase
+
+def parse_quietly(file_name, start_gc_index=None, end_gc_index=None, scheme=None):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return process_file_bgc_tuning_size_increase(file_name, start_gc_index, end_gc_index, scheme)
+
+def get_records(store):
+    return store.data[:len(store)]
+
+# the per GC records of a range are the ones the full parse has for those GCs
+@pytest.mark.parametrize("scheme_name", ["pow2", "size42", "size100"])
+def test_range_matches_full_parse(size_increase_logs, scheme_name):
+    file_name = size_increase_logs[scheme_name]
+    scheme = bucket_schemes[scheme_name]
+    full_result = parse_quietly(file_name, scheme=scheme)
+    gen2_gc_indices = full_result[5].column("gen_index")
+    start_gc_index = int(gen2_gc_indices[len(gen2_gc_indices) // 3])
+    end_gc_index = int(gen2_gc_indices[2 * len(gen2_gc_indices) // 3])
+    range_result = parse_quietly(file_name, start_gc_index, end_gc_index, scheme)
+
+    # eph_surv_info and gen2_size_increase_info
+    for item_index in [0, 5]:
+        full_records = get_records(full_result[item_index])
+        in_range = (full_records["gen_index"] >= start_gc_index) & (full_records["gen_index"] <= end_gc_index)
+        assert np.array_equal(full_records[in_range], get_records(range_result[item_index]))
+
+    # the bucket matrices have a row per gen2_size_increase_info record
+    gen2_in_range = (gen2_gc_indices >= start_gc_index) & (gen2_gc_indices <= end_gc_index)
+    for full_matrix, range_matrix in zip(full_result[6:], range_result[6:]):
+        assert np.array_equal(full_matrix.rows()[gen2_in_range], range_matrix.rows())
+
+def test_range_with_no_gcs(size_increase_logs):
+    printed = io.StringIO()
+    with contextlib.redirect_stdout(printed):
+        result = process_file_bgc_tuning_size_increase(size_increase_logs["pow2"], 999999990, 999999999,
+            bucket_schemes["pow2"])
+    assert len(result[0]) == 0
+    assert len(result[5]) == 0
+    assert "0 gen0s 0ms (0ms/gc), 0 gen1s 0ms (0ms/gc)" in printed.getvalue()